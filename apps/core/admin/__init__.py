@@ -1,3 +1,4 @@
 from . import email
+from . import outbox
 from . import profile
 from . import user
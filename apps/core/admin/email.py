@@ -18,7 +18,10 @@ class EmailInlineFormSet(BaseInlineFormSet):
             data = form.cleaned_data
             email = form.instance
 
-            if (data.get('DELETE') and email.is_primary):
+            # NOTE `self.instance` is the user, so it isn't loaded per email
+            email.user = self.instance
+            is_primary = email.is_primary
+            if (data.get('DELETE') and is_primary):
                 error_msg = _('You cannot delete the primary email.')
                 raise exceptions.ValidationError(error_msg)
 
@@ -0,0 +1,35 @@
+from django.contrib import admin
+from django.utils import timezone
+from django.utils.translation import gettext_lazy as _
+
+from ..models import OutboxEmail
+
+
+class OutboxEmailAdmin(admin.ModelAdmin):
+
+    actions = ['requeue',]
+
+    list_display = ['id', 'kind', 'status', 'user', 'attempts',
+                    'next_attempt_date', 'sent_date',]
+
+    list_filter = ['kind', 'status',]
+
+    list_select_related = ['user',]
+
+    readonly_fields = ['attempts', 'creation_date', 'email', 'kind',
+                       'last_error', 'lease_date', 'sent_date', 'user',]
+
+    search_fields = ['user__email', 'email__address',]
+
+    def has_add_permission(self, request):
+        return False
+
+    @admin.action(description=_('Queue the selected emails again'))
+    def requeue(self, request, queryset):
+        queryset.update(status=OutboxEmail.Status.PENDING,
+                        attempts=0,
+                        lease_date=None,
+                        next_attempt_date=timezone.now())
+
+
+admin.site.register(OutboxEmail, OutboxEmailAdmin)
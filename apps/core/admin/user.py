@@ -25,6 +25,9 @@ class UserAdmin(auth_admin.UserAdmin):
 
     list_filter = ['is_active', 'is_staff', 'is_superuser',]
 
+    # NOTE `full_name` is read from the profile
+    list_select_related = ['profile',]
+
     search_fields = ['username', 'email', 'emails__address',
                      'profile__given_name', 'profile__family_name',]
 
@@ -76,5 +79,12 @@ class UserAdmin(auth_admin.UserAdmin):
 
         super().save_related(request, form, formsets, change)
 
+        # NOTE The email of the user may have been added in the inlines, after
+        # the user was saved.
+        user = form.instance
+        primary_email = user.primary_email
+        if not primary_email or primary_email.address != user.email:
+            user.update_primary_email(save=True)
+
 
 admin.site.register(User, UserAdmin)
@@ -0,0 +1,108 @@
+import logging
+import time
+
+from django.conf import settings
+from django.core.cache import (
+    DEFAULT_CACHE_ALIAS,
+    caches,
+)
+
+
+logger = logging.getLogger(__name__)
+
+_USER_DATA_CACHE_PREFIX = 'core:user_data'
+
+
+def is_user_data_cache_enabled():
+    """Returns whether the users' data are cached (see `USER_DATA_CACHE`).
+
+    Returns:
+        bool: Whether the cache is enabled.
+    """
+
+    return settings.USER_DATA_CACHE.get('USE_CACHE', False)
+
+
+def _get_user_data_cache():
+    """Returns the cache of the users' data, if enabled.
+
+    Returns:
+        BaseCache: The cache set in `USER_DATA_CACHE`, or `None` if the cache
+            is disabled.
+    """
+
+    if not is_user_data_cache_enabled():
+        return None
+
+    alias = settings.USER_DATA_CACHE.get('CACHE_ALIAS', DEFAULT_CACHE_ALIAS)
+    return caches[alias]
+
+
+def _get_user_data_cache_key(user_pk):
+    return f'{_USER_DATA_CACHE_PREFIX}:{user_pk}'
+
+
+def get_cached_user_data(user_pk, version):
+    """Returns the cached representation of an user (see `UserSerializer`).
+
+    Entries are kept along with the version of the user's data (see
+    `User.version`) they represent, and only returned for that version. So,
+    even when an invalidation doesn't reach a cache (e.g. the local memory
+    cache of another process), stale data is never returned.
+
+    The hit (or miss) and the time taken are logged (`DEBUG`) by the
+    `apps.core.cache` logger.
+
+    Args:
+        user_pk (uuid): The primary key of the user.
+        version (int): The current version of the user's data.
+
+    Returns:
+        dict: The representation of the user, or `None` if it's not cached
+            (or the cache is disabled).
+    """
+
+    cache = _get_user_data_cache()
+    if cache is None:
+        return None
+
+    start = time.perf_counter()
+    entry = cache.get(_get_user_data_cache_key(user_pk))
+    data = entry[1] if entry and entry[0] == version else None
+    duration = (time.perf_counter() - start) * 1000
+
+    logger.debug('User data cache %s: user %s, version %s, %.2fms',
+                 'miss' if data is None else 'hit', user_pk, version, duration)
+
+    return data
+
+
+def set_cached_user_data(user_pk, version, data):
+    """Caches the representation of an user (see `get_cached_user_data`).
+
+    Args:
+        user_pk (uuid): The primary key of the user.
+        version (int): The version of the user's data represented.
+        data (dict): The representation of the user.
+    """
+
+    cache = _get_user_data_cache()
+    if cache is None:
+        return
+
+    cache.set(_get_user_data_cache_key(user_pk), (version, dict(data)),
+              timeout=settings.USER_DATA_CACHE.get('TIMEOUT', 60 * 5))
+
+
+def invalidate_user_data_cache(user_pk):
+    """Deletes the cached representation of an user.
+
+    Args:
+        user_pk (uuid): The primary key of the user.
+    """
+
+    cache = _get_user_data_cache()
+    if cache is None:
+        return
+
+    cache.delete(_get_user_data_cache_key(user_pk))
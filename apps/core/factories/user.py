@@ -1,5 +1,3 @@
-from datetime import datetime
-
 from django.contrib.auth import get_user_model
 import factory
 from faker import Faker
@@ -13,13 +11,7 @@ fake = Faker()
 
 def build_username(obj):
     base_username = f'{obj.given_name}_{obj.family_name}'.lower()
-    username = base_username
-
-    while User.objects.filter(username=username).exists():
-        timestamp_slice = str(int(datetime.now().timestamp()))[-5:]
-        username = f'{base_username}_{timestamp_slice}'
-
-    return username
+    return User.objects.generate_username(base_username)
 
 
 class UserFactory(DictFactoryMixin,
@@ -76,8 +68,11 @@ class UserFactory(DictFactoryMixin,
             'date_joined',
             'groups',
             'last_login',
+            'primary_email',
+            'token_version',
             'user',
             'user_permissions',
+            'version',
         ] if f not in include_fields)
 
         return cls._filter_fields(user_dict,
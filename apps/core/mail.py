@@ -1,9 +1,54 @@
+import smtplib
+
 from django.conf import settings
 from django.core.mail import EmailMultiAlternatives
+from django.template.loader import render_to_string
+from django.utils import translation
+from django.utils.functional import Promise
 from django.utils.http import urlencode
 from django.utils.translation import gettext_lazy as _
 
 from utils.helpers import load_entity
+from utils.mail import get_email_connection
+
+
+def send_many(messages, fail_silently=False):
+    """Sends many emails through a single session of the email backend.
+
+    Each email is handled as in `CustomEmailMessage.send` (e.g. printed in
+    development, or sent by its callback), and the ones left are sent at once
+    by the email backend shared by the process (see `utils.mail`).
+
+    Args:
+        messages (list): The `CustomEmailMessage` instances to be sent.
+        fail_silently (bool, optional): If `True`, exceptions will be
+            silenced. Defaults to `False`.
+
+    Returns:
+        int: The number of emails sent.
+    """
+
+    num_sent = 0
+    batch = []
+    for message in messages:
+        sent = message.dispatch()
+        if sent is None:
+            batch.append(message)
+
+        else:
+            num_sent += sent
+
+    if not batch:
+        return num_sent
+
+    try:
+        return num_sent + get_email_connection().send_messages(batch)
+
+    except (OSError, smtplib.SMTPException):
+        if not fail_silently:
+            raise
+
+        return num_sent
 
 
 class CustomEmailMessage(EmailMultiAlternatives):
@@ -11,14 +56,23 @@ class CustomEmailMessage(EmailMultiAlternatives):
 
     This class is a wrapper around Django's `EmailMultiAlternatives` class.
 
+    When `template_name` is set, the bodies of the email are rendered from
+    the `<template_name>.txt` and `<template_name>.html` templates, with the
+    copy of the email (see `get_body_copy`) as context.
+
     Attributes:
         html_body (str): The HTML body of the email.
+        template_name (str): The name of the templates of the bodies, without
+            the extension.
     """
 
     html_body = None
 
+    template_name = None
+
     def __init__(self, *args, **kwargs):
         self.html_body = kwargs.pop('html_body', None)
+        self._copy = {}
 
         super().__init__(*args, **kwargs)
 
@@ -37,7 +91,38 @@ class CustomEmailMessage(EmailMultiAlternatives):
             str: The body of the email as plain text.
         """
 
-        return self.body
+        if not self.template_name:
+            return self.body
+
+        return render_to_string(f'{self.template_name}.txt', self.get_copy())
+
+    def get_body_copy(self):
+        """Returns the copy of the email, used as context of its templates.
+
+        Returns:
+            dict: The copy of the email.
+        """
+
+        return {}
+
+    def get_copy(self):
+        """Returns the copy of the email, built once per language.
+
+        The copy is kept in the instance, with its lazy translations already
+        evaluated, so the bodies (and `print`) don't build it again.
+
+        Returns:
+            dict: The copy of the email (see `get_body_copy`).
+        """
+
+        language = translation.get_language()
+        if language not in self._copy:
+            self._copy[language] = {
+                key: str(value) if isinstance(value, Promise) else value
+                for key, value in self.get_body_copy().items()
+            }
+
+        return self._copy[language]
 
     def get_html_body(self):
         """Returns the body of the email as HTML.
@@ -46,7 +131,10 @@ class CustomEmailMessage(EmailMultiAlternatives):
             str: The body of the email as HTML.
         """
 
-        return self.html_body
+        if not self.template_name:
+            return self.html_body
+
+        return render_to_string(f'{self.template_name}.html', self.get_copy())
 
     def print(self):
         """Prints the email information to the console.
@@ -65,23 +153,22 @@ class CustomEmailMessage(EmailMultiAlternatives):
         print(f'CC: {join_recipients(self.cc)}')
         print(f'BCC: {join_recipients(self.bcc)}')
         print('-'*80)
-        print(self.get_body())
+        print(self.body)
         print('='*80, '\n')
 
-    def send(self, fail_silently=False, callback=None, send_in_dev=False):
-        """Sends the email.
+    def dispatch(self, callback=None, send_in_dev=False):
+        """Handles the email before it's sent by the email backend.
 
         Args:
-            fail_silently (bool, optional): If `True`, exceptions will be
-                silenced. Defaults to `False`.
             callback (function, optional): A function to be called to send
-                the email instead of the default `send` method. Defaults to
-                `None`.
+                the email instead of the email backend. Defaults to `None`.
             send_in_dev (bool, optional): If `True`, the email will be sent
                 even if the `PRODUCTION` flag is `False`. Defaults to `False`.
 
         Returns:
-            int: The number of emails sent.
+            int: The number of emails sent (by the callback, or `0` if the
+                email isn't sent), or `None` if the email must be sent by the
+                email backend.
         """
 
         if settings.TESTING:
@@ -96,10 +183,46 @@ class CustomEmailMessage(EmailMultiAlternatives):
         if callable(callback):
             return callback()
 
-        if self.html_body:
+        if self.html_body and not self.alternatives:
             self.attach_alternative(self.html_body, 'text/html')
 
-        return super().send(fail_silently=fail_silently)
+        return None
+
+    def get_connection(self, fail_silently=False):
+        # NOTE The email backend (and its connection) is shared by the process
+        if not self.connection:
+            self.connection = get_email_connection()
+
+        return self.connection
+
+    def send(self, fail_silently=False, callback=None, send_in_dev=False):
+        """Sends the email.
+
+        Args:
+            fail_silently (bool, optional): If `True`, exceptions will be
+                silenced. Defaults to `False`.
+            callback (function, optional): A function to be called to send
+                the email instead of the default `send` method. Defaults to
+                `None`.
+            send_in_dev (bool, optional): If `True`, the email will be sent
+                even if the `PRODUCTION` flag is `False`. Defaults to `False`.
+
+        Returns:
+            int: The number of emails sent.
+        """
+
+        sent = self.dispatch(callback=callback, send_in_dev=send_in_dev)
+        if sent is not None:
+            return sent
+
+        try:
+            return super().send()
+
+        except (OSError, smtplib.SMTPException):
+            if not fail_silently:
+                raise
+
+            return 0
 
 
 class VerificationEmailMessage(CustomEmailMessage):
@@ -114,6 +237,8 @@ class VerificationEmailMessage(CustomEmailMessage):
 
     email_to_verify = None
 
+    template_name = 'core/mail/verification'
+
     def __init__(self, *args, **kwargs):
         from apps.core.models import Email
         self.email_to_verify = kwargs.pop('email_to_verify', None)
@@ -133,17 +258,6 @@ class VerificationEmailMessage(CustomEmailMessage):
 
         self.to = [self.email_to_verify.address,]
 
-    def get_body(self):
-        copy = self.get_body_copy()
-
-        return (
-            f"{copy['title_text']}\n\n"
-            f"{copy['main_text']}\n\n"
-            f"Use the following link to confirm your email address:\n"
-            f"{copy['confirmation_url']}\n\n"
-            f"{copy['footer_text']}"
-        )
-
     def get_body_copy(self):
         confirmation_base_url = settings.EMAIL_CONFIRMATION.get(
             'FRONTEND_BASE_URL', '')
@@ -174,17 +288,6 @@ class VerificationEmailMessage(CustomEmailMessage):
 
         return default_copy
 
-    def get_html_body(self):
-        copy = self.get_body_copy()
-
-        return (
-            f"<h1>{copy['title_text']}</h1>"
-            f"<p>{copy['main_text']}</p>"
-            f"<p><a href=\"{copy['confirmation_url']}\">{copy['button_text']}</a></p>"
-            f"<p><em>Direct link: {copy['confirmation_url']}</em></p>"
-            f"<p>{copy['footer_text']}</p>"
-        )
-
     def print(self):
         super().print()
 
@@ -207,19 +310,16 @@ class VerificationEmailMessage(CustomEmailMessage):
             print(f'Backend Payload Data: {backend_data}')
             print('='*80, '\n')
 
-    def send(self, fail_silently=False):
-        callback = None
+    def dispatch(self, callback=None, send_in_dev=False):
         if callback_path := settings.EMAIL_CONFIRMATION.get('SEND_EMAIL_CALLBACK', None):
             send_callback = load_entity(callback_path)
 
             def callback(): return send_callback(self)
 
-        send_in_dev = settings.EMAIL_CONFIRMATION.get(
+        send_in_dev = send_in_dev or settings.EMAIL_CONFIRMATION.get(
             'SEND_EMAIL_IN_DEV', False)
 
-        return super().send(fail_silently=fail_silently,
-                            callback=callback,
-                            send_in_dev=send_in_dev)
+        return super().dispatch(callback=callback, send_in_dev=send_in_dev)
 
 
 class PasswordRecoveryEmailMessage(CustomEmailMessage):
@@ -234,6 +334,8 @@ class PasswordRecoveryEmailMessage(CustomEmailMessage):
 
     user = None
 
+    template_name = 'core/mail/password_recovery'
+
     def __init__(self, *args, **kwargs):
         from apps.core.models import User
         self.user = kwargs.pop('user', None)
@@ -253,17 +355,6 @@ class PasswordRecoveryEmailMessage(CustomEmailMessage):
 
         self.to = [self.user.email,]
 
-    def get_body(self):
-        copy = self.get_body_copy()
-
-        return (
-            f"{copy['title_text']}\n\n"
-            f"{copy['main_text']}\n\n"
-            f"Use the following link to reset your password:\n"
-            f"{copy['password_reset_url']}\n\n"
-            f"{copy['footer_text']}"
-        )
-
     def get_body_copy(self):
         password_reset_base_url = settings.PASSWORD_RECOVERY.get(
             'FRONTEND_BASE_URL', '')
@@ -293,17 +384,6 @@ class PasswordRecoveryEmailMessage(CustomEmailMessage):
 
         return default_copy
 
-    def get_html_body(self):
-        copy = self.get_body_copy()
-
-        return (
-            f"<h1>{copy['title_text']}</h1>"
-            f"<p>{copy['main_text']}</p>"
-            f"<p><a href=\"{copy['password_reset_url']}\">{copy['button_text']}</a></p>"
-            f"<p><em>Direct link: {copy['password_reset_url']}</em></p>"
-            f"<p>{copy['footer_text']}</p>"
-        )
-
     def print(self):
         super().print()
 
@@ -325,16 +405,13 @@ class PasswordRecoveryEmailMessage(CustomEmailMessage):
             print(f'Backend Payload Data: {backend_data}')
             print('='*80, '\n')
 
-    def send(self, fail_silently=False):
-        callback = None
+    def dispatch(self, callback=None, send_in_dev=False):
         if callback_path := settings.PASSWORD_RECOVERY.get('SEND_EMAIL_CALLBACK', None):
             send_callback = load_entity(callback_path)
 
             def callback(): return send_callback(self)
 
-        send_in_dev = settings.PASSWORD_RECOVERY.get(
+        send_in_dev = send_in_dev or settings.PASSWORD_RECOVERY.get(
             'SEND_EMAIL_IN_DEV', False)
 
-        return super().send(fail_silently=fail_silently,
-                            callback=callback,
-                            send_in_dev=send_in_dev)
+        return super().dispatch(callback=callback, send_in_dev=send_in_dev)
@@ -0,0 +1,72 @@
+from django.core.management.base import BaseCommand
+from django.db.models import (
+    Exists,
+    OuterRef,
+    Subquery,
+)
+
+from ...models import (
+    Email,
+    User,
+)
+
+
+class Command(BaseCommand):
+    help = ('Points the `primary_email` of the users created before it '
+            'existed to the `Email` of their `email` address, in chunks.')
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--batch-size',
+            type=int,
+            default=1000,
+            help='The number of users updated per chunk. Defaults to 1000.',
+        )
+
+        parser.add_argument(
+            '--dry-run',
+            action='store_true',
+            help='Only reports how many users would be updated.',
+        )
+
+    def handle(self, *args, **options):
+        batch_size = options['batch_size']
+        dry_run = options['dry_run']
+
+        # NOTE The same lookup as `User.update_primary_email`, made by the
+        # database for the whole chunk in a single `UPDATE`.
+        primary_emails = Email.objects.filter(
+            user=OuterRef('pk'),
+            address=OuterRef('email'),
+        ).values('pk')
+
+        # NOTE The users are read with keyset pagination (by primary key), so
+        # the ones without an `Email` for their address, which are left as
+        # they are, are only read once.
+        queryset = User.objects.without_profile().filter(
+            primary_email__isnull=True).order_by('pk')
+
+        total = 0
+        last_pk = None
+        while True:
+            chunk = queryset
+            if last_pk is not None:
+                chunk = chunk.filter(pk__gt=last_pk)
+
+            pks = list(chunk.values_list('pk', flat=True)[:batch_size])
+            if not pks:
+                break
+
+            last_pk = pks[-1]
+            users = User.objects.without_profile().filter(
+                Exists(primary_emails), pk__in=pks)
+
+            if dry_run:
+                total += users.count()
+
+            else:
+                total += users.update(
+                    primary_email=Subquery(primary_emails[:1]))
+
+        verb = 'Would update' if dry_run else 'Updated'
+        self.stdout.write(self.style.SUCCESS(f'{verb} {total} users.'))
@@ -0,0 +1,133 @@
+import math
+import statistics
+import time
+
+from django.contrib.auth.hashers import get_hashers
+from django.core.management.base import BaseCommand
+
+from utils.hashers import (
+    TunedArgon2PasswordHasher,
+    TunedPBKDF2PasswordHasher,
+)
+
+
+class Command(BaseCommand):
+    help = ('Benchmarks the configured `PASSWORD_HASHERS` on this host, and '
+            'recommends the parameters that take the target time to hash a '
+            'password (see `PASSWORD_HASHERS_PARAMS`).')
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--target-ms',
+            type=float,
+            default=250,
+            help='The target time (in milliseconds) to hash a password. '
+                 'Defaults to 250.',
+        )
+
+        parser.add_argument(
+            '--samples',
+            type=int,
+            default=3,
+            help='The number of passwords hashed by each hasher (the median '
+                 'time is used). Defaults to 3.',
+        )
+
+    def handle(self, *args, **options):
+        target_ms = options['target_ms']
+        samples = options['samples']
+
+        for hasher in get_hashers():
+            try:
+                duration = self.time_hasher(hasher, samples)
+
+            except ValueError as e:
+                # NOTE The library of the hasher isn't installed
+                self.stdout.write(self.style.WARNING(
+                    f'{hasher.algorithm}: skipped ({e}).'))
+                continue
+
+            current, recommended = self.recommend(hasher, duration, target_ms)
+            if current is None:
+                self.stdout.write(f'{hasher.algorithm}: {duration:.1f}ms '
+                                  f'(not tunable).')
+                continue
+
+            self.stdout.write(f'{hasher.algorithm}: {duration:.1f}ms with '
+                              f'{current}, recommended {recommended} for '
+                              f'{target_ms:g}ms.')
+
+        self.stdout.write(self.style.SUCCESS('Done.'))
+
+    def time_hasher(self, hasher, samples):
+        """Times the hashing of a password by a hasher.
+
+        Args:
+            hasher (BasePasswordHasher): The hasher.
+            samples (int): The number of passwords hashed.
+
+        Raises:
+            ValueError: If the library of the hasher isn't installed.
+
+        Returns:
+            float: The median time (in milliseconds) to hash a password.
+        """
+
+        durations = []
+        for _ in range(samples):
+            salt = hasher.salt()
+            start = time.perf_counter()
+            hasher.encode('BENCHMARK#pass!123', salt)
+            durations.append((time.perf_counter() - start) * 1000)
+
+        return statistics.median(durations)
+
+    def recommend(self, hasher, duration, target_ms):
+        """Recommends the parameters of a hasher for the target time.
+
+        The cost of PBKDF2 (iterations) and Argon2 (time cost) is linear,
+        while the cost of bcrypt (rounds) and scrypt (work factor) is
+        exponential, so they are scaled accordingly. The parameters of the
+        tuned hashers (see `utils.hashers`) come with their settings.
+
+        Args:
+            hasher (BasePasswordHasher): The hasher.
+            duration (float): The time (in milliseconds) to hash a password.
+            target_ms (float): The target time (in milliseconds).
+
+        Returns:
+            tuple: The current and the recommended parameters, formatted, or
+                `(None, None)` if the hasher can't be tuned.
+        """
+
+        ratio = target_ms / max(duration, 0.001)
+
+        if hasher.algorithm.startswith('pbkdf2'):
+            iterations = max(1000, round(hasher.iterations * ratio, -3))
+            setting = (' (`PBKDF2_ITERATIONS`)'
+                       if isinstance(hasher, TunedPBKDF2PasswordHasher)
+                       else '')
+            return (f'iterations={hasher.iterations}',
+                    f'iterations={iterations:.0f}{setting}')
+
+        if hasher.algorithm == 'argon2':
+            time_cost = max(1, round(hasher.time_cost * ratio))
+            setting = (' (`ARGON2_TIME_COST`)'
+                       if isinstance(hasher, TunedArgon2PasswordHasher)
+                       else '')
+            return (f'time_cost={hasher.time_cost}, '
+                    f'memory_cost={hasher.memory_cost}, '
+                    f'parallelism={hasher.parallelism}',
+                    f'time_cost={time_cost}{setting}')
+
+        if hasher.algorithm.startswith('bcrypt'):
+            rounds = max(4, hasher.rounds + round(math.log2(ratio)))
+            return f'rounds={hasher.rounds}', f'rounds={rounds}'
+
+        if hasher.algorithm == 'scrypt':
+            work_factor = 2 ** max(
+                1, round(math.log2(hasher.work_factor * ratio)))
+            return (f'work_factor={hasher.work_factor}',
+                    f'work_factor={work_factor}')
+
+        return None, None
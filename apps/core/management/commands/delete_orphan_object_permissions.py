@@ -0,0 +1,129 @@
+from collections import defaultdict
+
+from django.contrib.contenttypes.models import ContentType
+from django.core.exceptions import ValidationError
+from django.core.management.base import BaseCommand
+from guardian.utils import (
+    get_group_obj_perms_model,
+    get_user_obj_perms_model,
+)
+
+
+class Command(BaseCommand):
+    help = ('Deletes the generic object permissions (guardian\'s '
+            '`UserObjectPermission` and `GroupObjectPermission`) whose objects '
+            'no longer exist, in batches.')
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--app-label',
+            action='append',
+            dest='app_labels',
+            help='The app whose models are checked. Can be repeated. '
+                 'Defaults to `core`.',
+        )
+
+        parser.add_argument(
+            '--batch-size',
+            type=int,
+            default=1000,
+            help='The number of rows checked (and deleted) per batch. '
+                 'Defaults to 1000.',
+        )
+
+        parser.add_argument(
+            '--dry-run',
+            action='store_true',
+            help='Only reports the orphaned rows, without deleting them.',
+        )
+
+    def handle(self, *args, **options):
+        app_labels = options['app_labels'] or ['core']
+        batch_size = options['batch_size']
+        dry_run = options['dry_run']
+
+        content_types = {
+            content_type.pk: content_type
+            for content_type in ContentType.objects.filter(
+                app_label__in=app_labels)
+        }
+
+        total = 0
+        for obj_perms_model in [get_user_obj_perms_model(),
+                                get_group_obj_perms_model()]:
+            deleted = self.delete_orphans(obj_perms_model, content_types,
+                                          batch_size, dry_run)
+
+            for model_label, count in sorted(deleted.items()):
+                verb = 'Would delete' if dry_run else 'Deleted'
+                self.stdout.write(f'{verb} {count} orphaned '
+                                  f'`{obj_perms_model.__name__}` rows of '
+                                  f'`{model_label}`.')
+                total += count
+
+        self.stdout.write(self.style.SUCCESS(f'Done ({total} rows).'))
+
+    def delete_orphans(self, obj_perms_model, content_types, batch_size,
+                       dry_run):
+        """Deletes the orphaned rows of a generic object permission model.
+
+        The table is streamed with keyset pagination (by primary key), so
+        each batch is an indexed range scan and no batch is ever skipped by
+        the rows deleted before it. Each batch costs one query to read it,
+        one per content type to check which objects exist, and one to delete
+        the orphans.
+
+        Args:
+            obj_perms_model (cls): The generic object permission model.
+            content_types (dict): The content types to check, by primary key.
+            batch_size (int): The number of rows read per batch.
+            dry_run (bool): Whether to only count the orphans.
+
+        Returns:
+            dict: The number of orphans (deleted or not), by model label.
+        """
+
+        queryset = obj_perms_model.objects.filter(
+            content_type__in=list(content_types)).order_by('pk')
+
+        deleted = defaultdict(int)
+        last_pk = 0
+        while True:
+            rows = list(queryset.filter(pk__gt=last_pk).values_list(
+                'pk', 'content_type_id', 'object_pk')[:batch_size])
+            if not rows:
+                return deleted
+
+            last_pk = rows[-1][0]
+
+            rows_by_ctype = defaultdict(list)
+            for pk, content_type_pk, object_pk in rows:
+                rows_by_ctype[content_type_pk].append((pk, object_pk))
+
+            orphans = []
+            for content_type_pk, ctype_rows in rows_by_ctype.items():
+                model = content_types[content_type_pk].model_class()
+                if model is None:
+                    # NOTE Stale content type (its model was removed)
+                    continue
+
+                object_pks = {}
+                for pk, object_pk in ctype_rows:
+                    try:
+                        object_pks[pk] = model._meta.pk.to_python(object_pk)
+
+                    except ValidationError:
+                        # NOTE Malformed keys can't refer to any object
+                        object_pks[pk] = None
+
+                existing_pks = set(model.objects.filter(
+                    pk__in={p for p in object_pks.values() if p is not None}
+                ).values_list('pk', flat=True))
+
+                ctype_orphans = [pk for pk, object_pk in object_pks.items()
+                                 if object_pk not in existing_pks]
+                deleted[model._meta.label] += len(ctype_orphans)
+                orphans.extend(ctype_orphans)
+
+            if orphans and not dry_run:
+                obj_perms_model.objects.filter(pk__in=orphans).delete()
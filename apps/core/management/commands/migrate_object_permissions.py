@@ -0,0 +1,144 @@
+from django.core.exceptions import ValidationError
+from django.core.management.base import BaseCommand
+from django.db import transaction
+from guardian.ctypes import get_content_type
+from guardian.utils import (
+    get_group_obj_perms_model,
+    get_user_obj_perms_model,
+)
+
+from utils.permissions import invalidate_perms_cache
+
+from ...models import (
+    Email,
+    User,
+)
+
+
+class Command(BaseCommand):
+    help = ('Moves the generic object permissions (guardian\'s '
+            '`UserObjectPermission` and `GroupObjectPermission`) of `User` and '
+            '`Email` objects to their direct foreign key models, in chunks.')
+
+    models = [User, Email]
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--batch-size',
+            type=int,
+            default=1000,
+            help='The number of rows moved per transaction. Defaults to 1000.',
+        )
+
+        parser.add_argument(
+            '--dry-run',
+            action='store_true',
+            help='Only reports how many rows would be moved.',
+        )
+
+    def handle(self, *args, **options):
+        batch_size = options['batch_size']
+        dry_run = options['dry_run']
+
+        total = 0
+        for model in self.models:
+            for get_obj_perms_model, owner_field in [
+                (get_user_obj_perms_model, 'user_id'),
+                (get_group_obj_perms_model, 'group_id'),
+            ]:
+                generic_model = get_obj_perms_model()
+                direct_model = get_obj_perms_model(model)
+                if direct_model is generic_model:
+                    continue
+
+                moved, skipped = self.move_rows(
+                    model, generic_model, direct_model, owner_field,
+                    batch_size, dry_run)
+                total += moved
+
+                verb = 'Would move' if dry_run else 'Moved'
+                self.stdout.write(f'{verb} {moved} rows from '
+                                  f'`{generic_model.__name__}` to '
+                                  f'`{direct_model.__name__}`.')
+
+                if skipped:
+                    self.stdout.write(self.style.WARNING(
+                        f'Skipped {skipped} `{generic_model.__name__}` rows '
+                        f'of `{model._meta.label}` with a malformed '
+                        f'`object_pk`.'))
+
+        if total and not dry_run:
+            # NOTE The permissions didn't change, but their cached entries
+            # were read from the generic models.
+            invalidate_perms_cache()
+
+        self.stdout.write(self.style.SUCCESS(f'Done ({total} rows).'))
+
+    def move_rows(self, model, generic_model, direct_model, owner_field,
+                  batch_size, dry_run):
+        """Moves the generic object permissions of a model in chunks.
+
+        The generic rows are read with keyset pagination (by primary key), so
+        each chunk is an indexed range scan, no matter how big the table is.
+        Rows whose object no longer exists, or whose `object_pk` isn't a
+        valid key of the model, are left behind (see the
+        `delete_orphan_object_permissions` command).
+
+        Args:
+            model (cls): The model the permissions are over.
+            generic_model (cls): The generic object permission model.
+            direct_model (cls): The direct foreign key object permission model.
+            owner_field (str): The column of the grantee (`user_id` or
+                `group_id`).
+            batch_size (int): The number of rows read per chunk.
+            dry_run (bool): Whether to only count the rows.
+
+        Returns:
+            tuple: The number of rows moved (or to be moved), and the number
+                of rows skipped because of a malformed `object_pk`.
+        """
+
+        queryset = generic_model.objects.filter(
+            content_type=get_content_type(model)).order_by('pk')
+        to_pk = model._meta.pk.to_python
+
+        moved = 0
+        skipped = 0
+        last_pk = 0
+        while True:
+            rows = list(queryset.filter(pk__gt=last_pk).values_list(
+                'pk', owner_field, 'permission_id', 'object_pk')[:batch_size])
+            if not rows:
+                return moved, skipped
+
+            last_pk = rows[-1][0]
+
+            object_pks = {}
+            for pk, _, _, object_pk in rows:
+                try:
+                    object_pks[pk] = to_pk(object_pk)
+
+                except ValidationError:
+                    # NOTE Malformed keys can't refer to any object
+                    skipped += 1
+
+            existing_pks = set(model.objects.filter(
+                pk__in=set(object_pks.values())).values_list('pk', flat=True))
+            rows = [(pk, owner_pk, permission_pk, object_pks[pk])
+                    for pk, owner_pk, permission_pk, _ in rows
+                    if object_pks.get(pk) in existing_pks]
+            moved += len(rows)
+
+            if dry_run or not rows:
+                continue
+
+            with transaction.atomic():
+                direct_model.objects.bulk_create([
+                    direct_model(**{owner_field: owner_pk,
+                                    'permission_id': permission_pk,
+                                    'content_object_id': object_pk})
+                    for _, owner_pk, permission_pk, object_pk in rows
+                ], ignore_conflicts=True)
+
+                generic_model.objects.filter(
+                    pk__in=[row[0] for row in rows]).delete()
@@ -0,0 +1,59 @@
+import time
+
+from django.core.management.base import BaseCommand
+
+from ...models import OutboxEmail
+from ...outbox import send_queued_emails
+
+
+class Command(BaseCommand):
+    help = ('Sends the emails queued in the outbox (see `EMAIL_OUTBOX`), '
+            'retrying the failed ones with backoff. Several workers can run '
+            'at once.')
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--batch-size',
+            type=int,
+            default=None,
+            help='The number of emails claimed per batch. Defaults to '
+                 '`EMAIL_OUTBOX[\'BATCH_SIZE\']`.',
+        )
+
+        parser.add_argument(
+            '--loop',
+            action='store_true',
+            help='Keeps sending the emails as they are queued, instead of '
+                 'exiting when the outbox is empty.',
+        )
+
+        parser.add_argument(
+            '--interval',
+            type=float,
+            default=1,
+            help='The time (in seconds) waited for new emails when the outbox '
+                 'is empty, with `--loop`. Defaults to 1.',
+        )
+
+    def handle(self, *args, **options):
+        batch_size = options['batch_size']
+        loop = options['loop']
+        interval = options['interval']
+
+        while True:
+            results = send_queued_emails(batch_size=batch_size)
+
+            if sum(results.values()):
+                self.stdout.write(
+                    f'Sent {results[OutboxEmail.Status.SENT]}, discarded '
+                    f'{results[OutboxEmail.Status.DISCARDED]}, retrying '
+                    f'{results[OutboxEmail.Status.PENDING]}, failed '
+                    f'{results[OutboxEmail.Status.FAILED]} emails.')
+                continue
+
+            if not loop:
+                break
+
+            time.sleep(interval)
+
+        self.stdout.write(self.style.SUCCESS('Done.'))
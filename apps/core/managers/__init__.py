@@ -1 +1,4 @@
-from .user import UserManager
+from .user import (
+    UserManager,
+    UserQuerySet,
+)
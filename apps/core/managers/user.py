@@ -1,14 +1,131 @@
+import re
+
 from django.contrib.auth.models import BaseUserManager
+from django.db import (
+    IntegrityError,
+    models,
+    transaction,
+)
+
+
+class UserQuerySet(models.QuerySet):
+
+    def bump_version(self):
+        """Bumps the version of the users' data (see `User.version`).
+
+        The version is incremented by the `UPDATE` itself, so concurrent
+        bumps don't overwrite each other.
+
+        Returns:
+            int: The number of users bumped.
+        """
+
+        return self.update(version=models.F('version') + 1)
+
+    def with_profile(self):
+        """Joins the users' profiles in the same query.
+
+        The profile fields proxied by `User` (e.g. `given_name`, `full_name`)
+        are read from the profile loaded along with the user, instead of
+        firing a query per user.
+
+        Returns:
+            UserQuerySet: The users, with their profiles.
+        """
+
+        return self.select_related('profile')
+
+    def without_profile(self):
+        """Opts out of the profile join (see `with_profile`).
+
+        Any other relation selected with `select_related` is kept.
+
+        Returns:
+            UserQuerySet: The users, without their profiles.
+        """
+
+        clone = self._chain()
+        related = clone.query.select_related
+        if isinstance(related, dict) and 'profile' in related:
+            related = {k: v for k, v in related.items() if k != 'profile'}
+            clone.query.select_related = related or False
+
+        return clone
+
+    def select_for_update(self, *args, **kwargs):
+        """Locks the users' rows, without joining their profiles.
+
+        Some databases (e.g. PostgreSQL) refuse to lock the nullable side of
+        an outer join, which is how the profiles are joined. Pass `profile`
+        in `of` to lock the profiles too.
+        """
+
+        queryset = self
+        if 'profile' not in kwargs.get('of', ()):
+            queryset = self.without_profile()
+
+        return super(UserQuerySet, queryset).select_for_update(*args, **kwargs)
+
+
+class UserManager(BaseUserManager.from_queryset(UserQuerySet)):
+
+    # NOTE How many times `create_user` retries when a generated username is
+    # taken by a concurrent signup before it's saved.
+    username_retries = 3
+
+    def get_queryset(self):
+        """Returns the users with their profiles (see `UserQuerySet`).
+
+        Use `without_profile()` to opt out of the join.
+        """
+
+        return super().get_queryset().with_profile()
+
+    def generate_username(self, base_username):
+        """Generates a free username from a base username.
+
+        All the usernames starting with `base_username` are fetched with a
+        single (indexed) query. If `base_username` itself is taken, the
+        smallest free numeric suffix is appended to it (e.g. `john_2`), so the
+        result only depends on the usernames already taken.
 
+        Args:
+            base_username (str): The desired username.
+
+        Returns:
+            str: The generated username.
+        """
+
+        taken = set(self.filter(username__startswith=base_username)
+                    .values_list('username', flat=True))
+        if base_username not in taken:
+            return base_username
+
+        pattern = re.compile(rf'^{re.escape(base_username)}_(\d+)$')
+        suffixes = {int(match.group(1))
+                    for match in map(pattern.match, taken) if match}
 
-class UserManager(BaseUserManager):
+        suffix = 1
+        while suffix in suffixes:
+            suffix += 1
+
+        return f'{base_username}_{suffix}'
 
     def create_user(self, email, **kwargs):
         """Creates, saves and returns a new user.
 
+        If no username is given, one is generated (see `generate_username`).
+        When a concurrent signup takes the generated username before this
+        user is saved, a new one is generated, up to `username_retries` times.
+
         Args:
             email (str): The user's email address.
 
+        Raises:
+            IntegrityError: If the user violates any other unique constraint
+                (e.g. the email is taken), or if no free username was found
+                after all the retries.
+
         Returns:
             User: The created user.
         """
@@ -21,8 +138,22 @@ class UserManager(BaseUserManager):
         if password:
             user.set_password(password)
 
-        user.save()
-        return user
+        generate_username = not user.username
+        for attempt in range(self.username_retries + 1):
+            try:
+                with transaction.atomic(using=self.db):
+                    user.save(using=self.db)
+
+                return user
+
+            except IntegrityError:
+                if (not generate_username
+                        or attempt == self.username_retries
+                        or not self.filter(username=user.username).exists()):
+                    raise
+
+                # NOTE The `generate_username` signal generates a new one
+                user.username = None
 
     def create_superuser(self, email, password, **kwargs):
         """Creates, saves and returns a superuser.
@@ -1,3 +1,10 @@
 from .email import Email
+from .outbox import OutboxEmail
+from .permissions import (
+    EmailGroupObjectPermission,
+    EmailUserObjectPermission,
+    UserGroupObjectPermission,
+    UserUserObjectPermission,
+)
 from .profile import Profile
 from .user import User
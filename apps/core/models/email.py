@@ -26,6 +26,9 @@ class Email(models.Model):
         verbose_name_plural = _('emails')
         ordering = ['address',]
 
+    # NOTE See `utils.permissions.OwnerOrObjectPermissions`.
+    OWNER_FIELD = 'user'
+
     class Origin(models.TextChoices):
         """Origin of the email.
         """
@@ -106,11 +109,19 @@ class Email(models.Model):
     def is_primary(self):
         """Whether the email is primary or not.
 
+        NOTE Emails loaded through `user.emails` share the `user` instance,
+        so no query is made to load it.
+
         Returns:
             bool: Whether the email is primary or not.
         """
 
-        return self.address == self.user.email
+        # NOTE Users created before `primary_email` existed may not have it
+        # yet (see the `backfill_primary_emails` command).
+        if self.user.primary_email_id is None:
+            return self.user.email == self.address
+
+        return self.user.primary_email_id == self.pk
 
     # ---------------------------------- METHODS --------------------------------- #
 
@@ -146,6 +157,24 @@ class Email(models.Model):
             timezone.now() < expiration_date
         ])
 
+    def get_resend_wait(self):
+        """Returns how long until a new confirmation code can be requested.
+
+        The codes can be requested once per `RESEND_COOLDOWN` seconds (see
+        `EMAIL_CONFIRMATION`), counted from the `confirmation_code_date`.
+
+        Returns:
+            float: The time to wait (in seconds), or `0` if a new code can be
+                requested now.
+        """
+
+        cooldown = settings.EMAIL_CONFIRMATION.get('RESEND_COOLDOWN', 0)
+        if not cooldown:
+            return 0
+
+        elapsed = timezone.now() - self.confirmation_code_date
+        return max(cooldown - elapsed.total_seconds(), 0)
+
     def get_verification_email_message(self, **kwargs):
         """Gets the verification email.
 
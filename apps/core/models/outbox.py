@@ -0,0 +1,153 @@
+import uuid
+
+from django.db import models
+from django.utils import timezone
+from django.utils.translation import gettext_lazy as _
+
+
+class OutboxEmail(models.Model):
+    """Represents a transactional email waiting to be sent (see `core.outbox`).
+
+    The email message isn't stored, but built when the email is sent, from
+    the current state of its `email` or `user` (see `get_email_message`).
+
+    Attributes:
+        attempts (int): The number of failed attempts to send the email.
+        creation_date (datetime): The date the email was queued.
+        email (Email): The email to be verified, for verification emails.
+        kind (str): The kind of the email.
+        last_error (str): The error of the last failed attempt.
+        lease_date (datetime): The date until which the email is claimed by
+            a worker.
+        next_attempt_date (datetime): The date the email is due to be sent.
+        sent_date (datetime): The date the email was sent.
+        status (str): The status of the email. Defaults to `PENDING`.
+        user (User): The user the email is sent to.
+    """
+
+    class Meta:
+        verbose_name = _('outbox email')
+        verbose_name_plural = _('outbox emails')
+        ordering = ['next_attempt_date',]
+        indexes = [
+            models.Index(fields=['status', 'next_attempt_date'],
+                         name='core_outbox_due_idx'),
+        ]
+
+    class Kind(models.TextChoices):
+        """Kind of the email.
+        """
+
+        VERIFICATION = 'VERIFICATION', _('Verification')
+        PASSWORD_RECOVERY = 'PASSWORD_RECOVERY', _('Password Recovery')
+
+    class Status(models.TextChoices):
+        """Status of the email.
+        """
+
+        PENDING = 'PENDING', _('Pending')
+        SENT = 'SENT', _('Sent')
+        DISCARDED = 'DISCARDED', _('Discarded')
+        FAILED = 'FAILED', _('Failed')
+
+    # ---------------------------------- FIELDS ---------------------------------- #
+
+    id = models.UUIDField(
+        primary_key=True,
+        default=uuid.uuid4,
+        editable=False,
+    )
+
+    attempts = models.PositiveIntegerField(
+        default=0,
+        editable=False,
+        verbose_name=_('attempts'),
+    )
+
+    creation_date = models.DateTimeField(
+        auto_now_add=True,
+        verbose_name=_('creation date'),
+    )
+
+    email = models.ForeignKey(
+        to='core.Email',
+        null=True,
+        blank=True,
+        on_delete=models.CASCADE,
+        related_name='+',
+        verbose_name=_('email'),
+    )
+
+    kind = models.CharField(
+        max_length=31,
+        choices=Kind.choices,
+        verbose_name=_('kind'),
+    )
+
+    last_error = models.TextField(
+        blank=True,
+        default='',
+        editable=False,
+        verbose_name=_('last error'),
+    )
+
+    lease_date = models.DateTimeField(
+        null=True,
+        blank=True,
+        editable=False,
+        verbose_name=_('lease date'),
+    )
+
+    next_attempt_date = models.DateTimeField(
+        default=timezone.now,
+        verbose_name=_('next attempt date'),
+    )
+
+    sent_date = models.DateTimeField(
+        null=True,
+        blank=True,
+        editable=False,
+        verbose_name=_('sent date'),
+    )
+
+    status = models.CharField(
+        max_length=31,
+        choices=Status.choices,
+        default=Status.PENDING,
+        verbose_name=_('status'),
+    )
+
+    user = models.ForeignKey(
+        to='core.User',
+        on_delete=models.CASCADE,
+        related_name='+',
+        verbose_name=_('user'),
+    )
+
+    # ---------------------------------- METHODS --------------------------------- #
+
+    def __str__(self):
+        return f'{self.get_kind_display()} ({self.get_status_display()})'
+
+    def get_email_message(self):
+        """Builds the email message to be sent.
+
+        Returns:
+            CustomEmailMessage: The email message, or `None` if it's no longer
+                needed (e.g. the email was confirmed or the password was reset
+                in the meantime).
+        """
+
+        if self.kind == self.Kind.VERIFICATION:
+            if self.email.is_confirmed:
+                return None
+
+            return self.email.get_verification_email_message()
+
+        if self.kind == self.Kind.PASSWORD_RECOVERY:
+            if not self.user.reset_token:
+                return None
+
+            return self.user.get_password_recovery_email_message()
+
+        return None
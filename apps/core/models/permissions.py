@@ -0,0 +1,107 @@
+from django.db import models
+from django.utils.translation import gettext_lazy as _
+from guardian.models import (
+    GroupObjectPermissionBase,
+    UserObjectPermissionBase,
+)
+
+
+# NOTE guardian picks these models over its generic `UserObjectPermission` and
+# `GroupObjectPermission` for `User` and `Email` objects (see guardian's
+# "direct foreign keys" docs). They reference the objects through a real
+# foreign key, instead of a content type and a text `object_pk`, so lookups
+# compare UUIDs and rows are deleted along with their objects.
+#
+# https://django-guardian.readthedocs.io/en/stable/userguide/performance.html#direct-foreign-keys
+
+
+class UserUserObjectPermission(UserObjectPermissionBase):
+    """Represents an object permission of an user over an `User`.
+
+    Attributes:
+        content_object (User): The user the permission is over.
+        permission (Permission): The permission granted.
+        user (User): The user granted the permission.
+    """
+
+    class Meta(UserObjectPermissionBase.Meta):
+        verbose_name = _('user object permission over user')
+        verbose_name_plural = _('user object permissions over users')
+
+    # ---------------------------------- FIELDS ---------------------------------- #
+
+    content_object = models.ForeignKey(
+        to='core.User',
+        on_delete=models.CASCADE,
+        related_name='user_object_permissions',
+        verbose_name=_('user'),
+    )
+
+
+class UserGroupObjectPermission(GroupObjectPermissionBase):
+    """Represents an object permission of a group over an `User`.
+
+    Attributes:
+        content_object (User): The user the permission is over.
+        group (Group): The group granted the permission.
+        permission (Permission): The permission granted.
+    """
+
+    class Meta(GroupObjectPermissionBase.Meta):
+        verbose_name = _('group object permission over user')
+        verbose_name_plural = _('group object permissions over users')
+
+    # ---------------------------------- FIELDS ---------------------------------- #
+
+    content_object = models.ForeignKey(
+        to='core.User',
+        on_delete=models.CASCADE,
+        related_name='group_object_permissions',
+        verbose_name=_('user'),
+    )
+
+
+class EmailUserObjectPermission(UserObjectPermissionBase):
+    """Represents an object permission of an user over an `Email`.
+
+    Attributes:
+        content_object (Email): The email the permission is over.
+        permission (Permission): The permission granted.
+        user (User): The user granted the permission.
+    """
+
+    class Meta(UserObjectPermissionBase.Meta):
+        verbose_name = _('user object permission over email')
+        verbose_name_plural = _('user object permissions over emails')
+
+    # ---------------------------------- FIELDS ---------------------------------- #
+
+    content_object = models.ForeignKey(
+        to='core.Email',
+        on_delete=models.CASCADE,
+        related_name='user_object_permissions',
+        verbose_name=_('email'),
+    )
+
+
+class EmailGroupObjectPermission(GroupObjectPermissionBase):
+    """Represents an object permission of a group over an `Email`.
+
+    Attributes:
+        content_object (Email): The email the permission is over.
+        group (Group): The group granted the permission.
+        permission (Permission): The permission granted.
+    """
+
+    class Meta(GroupObjectPermissionBase.Meta):
+        verbose_name = _('group object permission over email')
+        verbose_name_plural = _('group object permissions over emails')
+
+    # ---------------------------------- FIELDS ---------------------------------- #
+
+    content_object = models.ForeignKey(
+        to='core.Email',
+        on_delete=models.CASCADE,
+        related_name='group_object_permissions',
+        verbose_name=_('email'),
+    )
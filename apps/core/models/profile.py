@@ -4,8 +4,11 @@ from django.core import validators
 from django.db import models
 from django.utils.translation import gettext_lazy as _
 
+from utils.models.mixins import DirtyFieldsMixin
 
-class Profile(models.Model):
+
+class Profile(DirtyFieldsMixin,
+              models.Model):
     """Represents the profile data of an user in the system.
 
     Attributes:
@@ -10,16 +10,27 @@ from django.core import (
     validators,
 )
 from django.db import models
+from django.db.models import DEFERRED
+from django.db.models.base import ModelState
+from django.db.models.signals import (
+    post_init,
+    pre_init,
+)
 from django.utils import timezone
+from django.utils.http import quote_etag
 from django.utils.translation import gettext_lazy as _
 
+from utils import hashers
+from utils.auth import invalidate_auth_user_cache
+from utils.models.mixins import DirtyFieldsMixin
 
 from ..mail import PasswordRecoveryEmailMessage
 from ..managers import UserManager
 from .profile import Profile
 
 
-class User(AbstractBaseUser,
+class User(DirtyFieldsMixin,
+           AbstractBaseUser,
            PermissionsMixin):
     """Represents an user in the system.
 
@@ -33,11 +44,17 @@ class User(AbstractBaseUser,
         is_staff (bool): Whether the user is staff or not.
         is_superuser (bool): Whether the user is superuser or not.
         last_login (datetime): The last login of the user.
+        primary_email (Email): The `Email` of the primary email address
+            (`email`), kept in sync with it.
         profile (Profile): The profile data of the user.
         reset_token (str): The token to reset the password of the user.
         reset_token_date (datetime): The date the reset token was generated.
+        token_version (int): The version of the user's tokens, bumped to
+            revoke all of them (see `revoke_tokens`).
         user_permissions (Manager<Permission>): The permissions of the user.
         username (str): The username of the user.
+        version (int): The version of the user's data, bumped whenever the
+            user, its profile or its emails change.
     """
 
     class Meta:
@@ -47,6 +64,9 @@ class User(AbstractBaseUser,
 
     objects = UserManager()
 
+    # NOTE See `utils.permissions.OwnerOrObjectPermissions`.
+    OWNER_FIELD = 'self'
+
     USERNAME_FIELD = 'email'
 
     # ---------------------------------- FIELDS ---------------------------------- #
@@ -78,6 +98,18 @@ class User(AbstractBaseUser,
         verbose_name=_('is staff?'),
     )
 
+    # NOTE Denormalized from `email` (see `update_primary_email`), so the
+    # primary email is a column read instead of a query.
+    primary_email = models.OneToOneField(
+        to='core.Email',
+        null=True,
+        blank=True,
+        editable=False,
+        on_delete=models.SET_NULL,
+        related_name='+',
+        verbose_name=_('primary email'),
+    )
+
     reset_token = models.UUIDField(
         null=True,
         blank=True,
@@ -92,6 +124,13 @@ class User(AbstractBaseUser,
         verbose_name=_('reset token date'),
     )
 
+    # NOTE Embedded in the tokens of the user (see `utils.auth`)
+    token_version = models.PositiveIntegerField(
+        default=1,
+        editable=False,
+        verbose_name=_('token version'),
+    )
+
     username = models.CharField(
         verbose_name=_("username"),
         max_length=31,
@@ -109,6 +148,13 @@ class User(AbstractBaseUser,
         },
     )
 
+    # NOTE Bumped by `save` and by `core.signals` (see `UserQuerySet.bump_version`)
+    version = models.PositiveIntegerField(
+        default=1,
+        editable=False,
+        verbose_name=_('version'),
+    )
+
     # -------------------------------- PROPERTIES -------------------------------- #
 
     @classmethod
@@ -133,6 +179,16 @@ class User(AbstractBaseUser,
 
         return self.profile.full_name
 
+    @property
+    def etag(self):
+        """Returns the entity tag of the user's data (see `version`).
+
+        Returns:
+            str: The quoted entity tag.
+        """
+
+        return self.get_etag(self.pk, self.version)
+
     @property
     def is_anonymous(self):
         """Returns whether the user is anonymous or not.
@@ -145,17 +201,21 @@ class User(AbstractBaseUser,
 
         return self.username == settings.ANONYMOUS_USER_NAME
 
-    @property
-    def primary_email(self):
-        """Returns the primary email of the user.
+    # ---------------------------------- METHODS --------------------------------- #
+
+    @classmethod
+    def get_etag(cls, pk, version):
+        """Returns the entity tag of an user's data.
+
+        Args:
+            pk (uuid): The primary key of the user.
+            version (int): The version of the user's data.
 
         Returns:
-            Email: The primary email of the user.
+            str: The quoted entity tag.
         """
 
-        return self.emails.filter(address=self.email).first()
-
-    # ---------------------------------- METHODS --------------------------------- #
+        return quote_etag(f'{pk}-{version}')
 
     @classmethod
     @property
@@ -198,6 +258,48 @@ class User(AbstractBaseUser,
         kwargs = self._extract_profile_kwargs(kwargs)
         super().__init__(*args, **kwargs)
 
+    @classmethod
+    def from_db(cls, db, field_names, values):
+        """Creates an `User` from a database row.
+
+        Rows never carry profile data, so when all the concrete fields are
+        loaded (no deferred fields) and no `pre_init`/`post_init` receivers
+        are connected, the instance is hydrated directly, bypassing
+        `__init__` (and the profile kwargs extraction) and `__setattr__`.
+        Otherwise, the default (slower) path is used.
+
+        Args:
+            db (str): The database alias the row was loaded from.
+            field_names (tuple): The names of the fields loaded.
+            values (tuple): The values of the fields loaded.
+
+        Returns:
+            User: The user loaded.
+        """
+
+        attnames = cls.__dict__.get('_concrete_attnames_cache')
+        if attnames is None:
+            attnames = tuple(f.attname for f in cls._meta.concrete_fields)
+            cls._concrete_attnames_cache = attnames
+
+        if (len(values) != len(attnames)
+                or pre_init.has_listeners(cls)
+                or post_init.has_listeners(cls)):
+            return super().from_db(db, field_names, values)
+
+        state = ModelState()
+        state.adding = False
+        state.db = db
+
+        new = cls.__new__(cls)
+        new.__dict__.update(zip(attnames, values))
+        new.__dict__['_state'] = state
+
+        # NOTE Same as `_reset_dirty_fields()`, as all the fields are loaded
+        new.__dict__['_dirty_fields_snapshot'] = dict(zip(attnames, values))
+
+        return new
+
     def __getattr__(self, attr_name):
         if attr_name not in self._profile_fields_names:
             return super().__getattribute__(attr_name)
@@ -246,7 +348,34 @@ class User(AbstractBaseUser,
         self.reset_token_date = None
 
         if save:
-            self.save()
+            self.save(update_fields=['reset_token', 'reset_token_date'])
+
+    def check_password(self, raw_password):
+        """Checks the password of the user (see `utils.hashers`).
+
+        Same as `AbstractBaseUser.check_password`, but the password is hashed
+        by the hashing executor, if enabled. If the password is correct but
+        its hash is outdated (e.g. the iterations of the hasher changed, see
+        `PASSWORD_HASHERS_PARAMS`), it's hashed again.
+
+        Args:
+            raw_password (str): The password to be checked.
+
+        Returns:
+            bool: Whether the password is correct or not.
+        """
+
+        def setter(raw_password):
+            # NOTE Only the hash changes, not the password, so the user isn't
+            # saved (which would revoke its tokens and bump its version).
+            self.set_password(raw_password)
+            self._password = None
+            self._meta.model.objects.filter(pk=self.pk).update(
+                password=self.password)
+            self._reset_dirty_fields(['password'])
+            invalidate_auth_user_cache(self.pk)
+
+        return hashers.check_password(raw_password, self.password, setter)
 
     def check_reset_token(self, reset_token):
         """Checks if the reset token is valid.
@@ -286,7 +415,7 @@ class User(AbstractBaseUser,
             self.reset_token_date = timezone.now()
 
         if save:
-            self.save()
+            self.save(update_fields=['reset_token', 'reset_token_date'])
 
         return self.reset_token
 
@@ -303,3 +432,95 @@ class User(AbstractBaseUser,
         message_kwargs.update(kwargs)
 
         return PasswordRecoveryEmailMessage(**message_kwargs)
+
+    def save(self, *args, **kwargs):
+        update_fields = kwargs.get('update_fields')
+        dirty_fields = [] if self._state.adding else [
+            field_name for field_name in self.get_dirty_fields()
+            if update_fields is None or field_name in update_fields]
+        extra_fields = []
+
+        # NOTE Users being created get their primary email once the `Email`
+        # is created (see `core.signals.user_initial_setup`).
+        if 'email' in dirty_fields:
+            self.update_primary_email()
+            extra_fields.append('primary_email')
+
+        # NOTE Deactivating the user revokes all of its tokens (as resetting
+        # the password does, see `PasswordResetAPIView`).
+        if 'is_active' in dirty_fields and not self.is_active:
+            self.revoke_tokens()
+            extra_fields.append('token_version')
+
+        if update_fields is not None and extra_fields:
+            kwargs['update_fields'] = {*update_fields, *extra_fields}
+
+        if self._state.adding:
+            super().save(*args, **kwargs)
+            return
+
+        # NOTE The version is incremented by the `UPDATE` itself, so
+        # concurrent saves don't overwrite each other's bump. Afterwards,
+        # the version is assumed to be the loaded one + 1: if a concurrent
+        # save bumped it too, it's behind, and thus never matches again.
+        version = self.__dict__.get('version', DEFERRED)
+        self.version = models.F('version') + 1
+        if kwargs.get('update_fields') is not None:
+            kwargs['update_fields'] = {*kwargs['update_fields'], 'version'}
+
+        try:
+            super().save(*args, **kwargs)
+
+        finally:
+            # NOTE Deferred, so it's reloaded if accessed (e.g. on failures)
+            del self.__dict__['version']
+
+        if version is not DEFERRED:
+            self.version = version + 1
+            self._reset_dirty_fields(['version'])
+
+    def set_password(self, raw_password):
+        """Sets the password of the user (see `utils.hashers`).
+
+        Same as `AbstractBaseUser.set_password`, but the password is hashed
+        by the hashing executor, if enabled.
+
+        Args:
+            raw_password (str): The password to be set.
+        """
+
+        self.password = hashers.make_password(raw_password)
+        self._password = raw_password
+
+    def revoke_tokens(self, save=False):
+        """Revokes all the tokens of the user, by bumping its `token_version`.
+
+        Tokens carry the version of the user's tokens they were issued for,
+        and are only accepted while it's the current one (see
+        `utils.auth.CachedJWTAuthentication`), so no token is stored.
+
+        Args:
+            save (bool): Whether to save the user or not.
+        """
+
+        self.token_version += 1
+
+        if save:
+            self.save(update_fields=['token_version'])
+
+    def update_primary_email(self, save=False):
+        """Points `primary_email` to the `Email` of the `email` address.
+
+        Args:
+            save (bool): Whether to save the user or not.
+
+        Returns:
+            Email: The primary email of the user, if any.
+        """
+
+        self.primary_email = self.emails.filter(address=self.email).first()
+
+        if save:
+            self.save(update_fields=['primary_email'])
+
+        return self.primary_email
@@ -0,0 +1,235 @@
+import logging
+from collections import Counter
+
+from django.conf import settings
+from django.db import (
+    connection,
+    transaction,
+)
+from django.db.models import Q
+from django.utils import timezone
+
+from .models import OutboxEmail
+
+
+logger = logging.getLogger(__name__)
+
+
+def is_outbox_enabled():
+    """Returns whether the emails are queued (see `EMAIL_OUTBOX`).
+
+    Returns:
+        bool: Whether the outbox is enabled.
+    """
+
+    return settings.EMAIL_OUTBOX.get('USE_OUTBOX', False)
+
+
+def _enqueue(kind, user, email=None):
+    # NOTE The row is written in the transaction of the caller, so the email
+    # is only seen by the worker (or discarded) when it's committed.
+    return OutboxEmail.objects.create(kind=kind, user=user, email=email)
+
+
+def enqueue_verification_email(email):
+    """Queues the verification email of an email address.
+
+    If the outbox is disabled, the email is sent right away instead.
+
+    Args:
+        email (Email): The email to be verified.
+
+    Returns:
+        OutboxEmail: The queued email, or `None` if it was sent.
+    """
+
+    if not is_outbox_enabled():
+        email.get_verification_email_message().send()
+        return None
+
+    return _enqueue(OutboxEmail.Kind.VERIFICATION, email.user, email=email)
+
+
+def is_verification_email_queued(email):
+    """Returns whether the verification email of an email address is queued
+    and not sent yet.
+
+    Args:
+        email (Email): The email to be verified.
+
+    Returns:
+        bool: Whether the verification email is queued.
+    """
+
+    if not is_outbox_enabled():
+        return False
+
+    return OutboxEmail.objects.filter(
+        kind=OutboxEmail.Kind.VERIFICATION,
+        email=email,
+        status=OutboxEmail.Status.PENDING,
+    ).exists()
+
+
+def enqueue_password_recovery_email(user):
+    """Queues the password recovery email of an user.
+
+    If the outbox is disabled, the email is sent right away instead.
+
+    Args:
+        user (User): The user to recover the password.
+
+    Returns:
+        OutboxEmail: The queued email, or `None` if it was sent.
+    """
+
+    if not is_outbox_enabled():
+        user.get_password_recovery_email_message().send()
+        return None
+
+    return _enqueue(OutboxEmail.Kind.PASSWORD_RECOVERY, user)
+
+
+def claim_emails(batch_size):
+    """Claims the emails due to be sent, so no other worker sends them.
+
+    The emails are leased for `EMAIL_OUTBOX['LEASE_TIMEOUT']` seconds, so the
+    emails of a worker that dies are claimed again when the lease expires.
+    Where the database supports it, the rows are claimed with `SELECT ... FOR
+    UPDATE SKIP LOCKED`, so concurrent workers skip each other's rows instead
+    of waiting for them. Otherwise (e.g. SQLite), each row is claimed with a
+    conditional `UPDATE`, which only one of the workers wins.
+
+    Args:
+        batch_size (int): The maximum number of emails to be claimed.
+
+    Returns:
+        list: The claimed `OutboxEmail` instances.
+    """
+
+    now = timezone.now()
+    lease_date = now + timezone.timedelta(
+        seconds=settings.EMAIL_OUTBOX.get('LEASE_TIMEOUT', 60 * 5))
+
+    due = OutboxEmail.objects.filter(
+        Q(lease_date__isnull=True) | Q(lease_date__lt=now),
+        status=OutboxEmail.Status.PENDING,
+        next_attempt_date__lte=now,
+    ).order_by('next_attempt_date')
+
+    if connection.features.has_select_for_update_skip_locked:
+        with transaction.atomic():
+            pks = list(due.select_for_update(skip_locked=True)
+                       .values_list('pk', flat=True)[:batch_size])
+            OutboxEmail.objects.filter(pk__in=pks).update(
+                lease_date=lease_date)
+
+    else:
+        pks = []
+        for pk, current_lease_date in due.values_list(
+                'pk', 'lease_date')[:batch_size]:
+            claimed = OutboxEmail.objects.filter(
+                pk=pk,
+                status=OutboxEmail.Status.PENDING,
+                lease_date=current_lease_date,
+            ).update(lease_date=lease_date)
+
+            if claimed:
+                pks.append(pk)
+
+    return list(OutboxEmail.objects.filter(pk__in=pks)
+                .select_related('email', 'user')
+                .order_by('next_attempt_date'))
+
+
+def get_retry_delay(attempts):
+    """Returns the delay before the next attempt to send an email.
+
+    The delay doubles on every failed attempt, starting at `RETRY_DELAY` and
+    up to `MAX_RETRY_DELAY` (see `EMAIL_OUTBOX`).
+
+    Args:
+        attempts (int): The number of failed attempts.
+
+    Returns:
+        timedelta: The delay.
+    """
+
+    config = settings.EMAIL_OUTBOX
+    delay = config.get('RETRY_DELAY', 60) * 2 ** max(attempts - 1, 0)
+    return timezone.timedelta(
+        seconds=min(delay, config.get('MAX_RETRY_DELAY', 60 * 60)))
+
+
+def send_outbox_email(outbox_email):
+    """Sends a claimed email, updating its status.
+
+    If building or sending the message fails, the email is retried later (see
+    `get_retry_delay`), and after `EMAIL_OUTBOX['MAX_ATTEMPTS']` failed
+    attempts it's set as `FAILED` and left in the outbox (dead-lettered).
+
+    Args:
+        outbox_email (OutboxEmail): The claimed email.
+
+    Returns:
+        str: The new status of the email.
+    """
+
+    try:
+        message = outbox_email.get_email_message()
+        if message is not None:
+            message.send()
+
+    except Exception as e:
+        outbox_email.attempts += 1
+        outbox_email.last_error = f'{type(e).__name__}: {e}'
+
+        max_attempts = settings.EMAIL_OUTBOX.get('MAX_ATTEMPTS', 5)
+        if outbox_email.attempts >= max_attempts:
+            outbox_email.status = OutboxEmail.Status.FAILED
+            logger.error('Outbox email %s failed after %s attempts: %s',
+                         outbox_email.pk, outbox_email.attempts,
+                         outbox_email.last_error)
+
+        else:
+            outbox_email.next_attempt_date = (
+                timezone.now() + get_retry_delay(outbox_email.attempts))
+            logger.warning('Outbox email %s failed (attempt %s), retrying '
+                           'at %s: %s', outbox_email.pk, outbox_email.attempts,
+                           outbox_email.next_attempt_date,
+                           outbox_email.last_error)
+
+    else:
+        if message is None:
+            outbox_email.status = OutboxEmail.Status.DISCARDED
+
+        else:
+            outbox_email.status = OutboxEmail.Status.SENT
+            outbox_email.sent_date = timezone.now()
+
+    outbox_email.lease_date = None
+    outbox_email.save(update_fields=['attempts', 'last_error', 'lease_date',
+                                     'next_attempt_date', 'sent_date',
+                                     'status'])
+
+    return outbox_email.status
+
+
+def send_queued_emails(batch_size=None):
+    """Claims and sends a batch of the emails due to be sent.
+
+    Args:
+        batch_size (int, optional): The maximum number of emails to be sent.
+            Defaults to `EMAIL_OUTBOX['BATCH_SIZE']`.
+
+    Returns:
+        Counter: The number of emails per new status.
+    """
+
+    batch_size = batch_size or settings.EMAIL_OUTBOX.get('BATCH_SIZE', 50)
+
+    results = Counter()
+    for outbox_email in claim_emails(batch_size):
+        results[send_outbox_email(outbox_email)] += 1
+
+    return results
@@ -1,3 +1,8 @@
+from .auth import (
+    TokenObtainPairSerializer,
+    TokenRefreshSerializer,
+    TokenVerifySerializer,
+)
 from .email import EmailSerializer
 from .profile import ProfileSerializer
 from .user import UserSerializer
@@ -0,0 +1,40 @@
+from rest_framework_simplejwt import serializers as jwt_serializers
+from rest_framework_simplejwt.tokens import UntypedToken
+
+from utils.auth import (
+    TOKEN_VERSION_CLAIM,
+    CachedJWTAuthentication,
+)
+
+
+class TokenObtainPairSerializer(jwt_serializers.TokenObtainPairSerializer):
+    """Obtains a token pair carrying the `User.token_version` claim.
+    """
+
+    @classmethod
+    def get_token(cls, user):
+        token = super().get_token(user)
+        token[TOKEN_VERSION_CLAIM] = user.token_version
+        return token
+
+
+class TokenRefreshSerializer(jwt_serializers.TokenRefreshSerializer):
+    """Refreshes a token pair, unless the refresh token was revoked (see
+    `User.revoke_tokens`) or the user can't be authenticated anymore.
+    """
+
+    def validate(self, attrs):
+        refresh = self.token_class(attrs['refresh'])
+        CachedJWTAuthentication().get_user(refresh)
+        return super().validate(attrs)
+
+
+class TokenVerifySerializer(jwt_serializers.TokenVerifySerializer):
+    """Verifies a token, which is invalid if it was revoked (see
+    `User.revoke_tokens`) or the user can't be authenticated anymore.
+    """
+
+    def validate(self, attrs):
+        token = UntypedToken(attrs['token'])
+        CachedJWTAuthentication().get_user(token)
+        return super().validate(attrs)
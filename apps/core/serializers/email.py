@@ -1,9 +1,12 @@
 from rest_framework import serializers
 
+from utils.serializers.mixins import ValuesReadMixin
+
 from ..models import Email
 
 
-class EmailSerializer(serializers.ModelSerializer):
+class EmailSerializer(ValuesReadMixin,
+                      serializers.ModelSerializer):
 
     class Meta:
         model = Email
@@ -1,12 +1,21 @@
+import copy
+
 from django.utils.translation import gettext_lazy as _
 from rest_framework import serializers
 
+from utils.serializers.mixins import (
+    EagerLoadingMixin,
+    ValuesReadMixin,
+)
+
 from .email import EmailSerializer
 from ..models import User
 from .profile import ProfileSerializer
 
 
-class UserSerializer(serializers.ModelSerializer):
+class UserSerializer(EagerLoadingMixin,
+                     ValuesReadMixin,
+                     serializers.ModelSerializer):
 
     class Meta:
         model = User
@@ -17,21 +26,40 @@ class UserSerializer(serializers.ModelSerializer):
             'is_superuser',
             'last_login',
             'password',
+            'primary_email',
             'reset_token',
             'reset_token_date',
+            'token_version',
             'user_permissions',
+            'version',
         ]
         read_only_fields = [
             'date_joined',
         ]
 
-    def get_fields(self):
+    # NOTE See `get_fields`: the profile fields and the emails
+    select_related_fields = ('profile',)
+    prefetch_related_fields = ('emails',)
+
+    def _build_fields(self):
+        """Builds the fields of the serializer.
+
+        The `User` model fields are extended with the `Profile` fields (see
+        `ProfileSerializer`), the password confirmation fields and the
+        emails.
+
+        Returns:
+            dict: The fields of the serializer, by name.
+        """
+
         fields = super().get_fields()
 
+        # NOTE The fields are rebuilt with `source` as a keyword argument, as
+        # copies of a field are built from the arguments it was built with.
         profile_serializer = ProfileSerializer()
         for field_name, field in profile_serializer.get_fields().items():
-            field.source = f'profile.{field_name}'
-            fields[field_name] = field
+            kwargs = {**field._kwargs, 'source': f'profile.{field_name}'}
+            fields[field_name] = field.__class__(*field._args, **kwargs)
 
         fields['password_1'] = serializers.CharField(write_only=True)
         fields['password_2'] = serializers.CharField(write_only=True)
@@ -39,6 +67,25 @@ class UserSerializer(serializers.ModelSerializer):
 
         return fields
 
+    def get_fields(self):
+        """Returns copies of the fields of the serializer.
+
+        The fields are built once per serializer class (see `_build_fields`),
+        and then deep copied for each serializer instance, the same way
+        Django REST framework copies the declared fields.
+
+        Returns:
+            dict: The fields of the serializer, by name.
+        """
+
+        cls = self.__class__
+        fields = cls.__dict__.get('_fields_cache')
+        if fields is None:
+            fields = self._build_fields()
+            cls._fields_cache = fields
+
+        return copy.deepcopy(fields)
+
     def validate(self, data):
         data.pop('password', None)
         password_1 = data.pop('password_1', None)
@@ -65,10 +112,9 @@ class UserSerializer(serializers.ModelSerializer):
         validated_data.pop('email', None)
         password = validated_data.pop('password', None)
 
-        user = super().update(instance, validated_data)
-
+        # NOTE The password is set before the update, so the user is saved
+        # only once.
         if password:
-            user.set_password(password)
-            user.save()
+            instance.set_password(password)
 
-        return user
+        return super().update(instance, validated_data)
@@ -1,3 +1,4 @@
 from . import email
+from . import permissions
 from . import profile
 from . import user
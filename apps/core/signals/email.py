@@ -1,7 +1,17 @@
-from django.db.models.signals import post_save
+from django.contrib.auth import get_user_model
+from django.db.models import QuerySet
+from django.db.models.signals import (
+    post_delete,
+    post_save,
+)
 from django.dispatch import receiver
-from guardian.shortcuts import assign_perm
 
+from utils.permissions import (
+    EMAIL_OBJECT_PERMISSIONS,
+    bulk_assign_perms,
+)
+
+from ..cache import invalidate_user_data_cache
 from ..models import Email
 
 
@@ -10,20 +20,65 @@ def assign_email_permissions(sender, instance, created, **kwargs):
     """Adds the basic permissions to handle `Email` objects.
 
     Adds the necessary permissions to the user so it can view, change and
-    delete its own `Email` objects.
+    delete its own `Email` objects (see `EMAIL_OBJECT_PERMISSIONS`). All the
+    permissions are written with a single `INSERT`.
+
+    NOTE `post_save` is not sent by `bulk_create`, so when creating emails in
+    bulk (e.g. in import jobs), use `utils.permissions.bulk_assign_perms` to
+    grant the permissions over all the new emails at once.
 
     Args:
-        sender (cls): The model triggering the signal (`User`).
-        instance (User): The user just saved.
-        created (bool): Whether the user was created or not (updated).
+        sender (cls): The model triggering the signal (`Email`).
+        instance (Email): The email just saved.
+        created (bool): Whether the email was created or not (updated).
     """
 
     if not created:
         return
 
     email = instance
-    user = email.user
+    bulk_assign_perms(EMAIL_OBJECT_PERMISSIONS, [email])
+
+
+@receiver(post_save, sender=Email, dispatch_uid="bump_user_version_on_email_save")
+def bump_user_version_on_email_save(sender, instance, created, **kwargs):
+    """Bumps the version of the user (see `User.version`) of an email saved.
+
+    The cached data of the user (see `USER_DATA_CACHE`) is invalidated too.
+    The email created along with its user (or to become its primary email,
+    which saves the user) is skipped, as the user's version is bumped with it.
+
+    Args:
+        sender (cls): The model triggering the signal (`Email`).
+        instance (Email): The email just saved.
+        created (bool): Whether the email was created or not (updated).
+    """
+
+    email = instance
+    if created and email.address == email.user.email:
+        return
+
+    get_user_model().objects.filter(pk=email.user_id).bump_version()
+    invalidate_user_data_cache(email.user_id)
+
+
+@receiver(post_delete, sender=Email, dispatch_uid="bump_user_version_on_email_delete")
+def bump_user_version_on_email_delete(sender, instance, origin, **kwargs):
+    """Bumps the version of the user (see `User.version`) of an email deleted.
+
+    The cached data of the user (see `USER_DATA_CACHE`) is invalidated too.
+    Emails deleted along with their users are skipped.
+
+    Args:
+        sender (cls): The model triggering the signal (`Email`).
+        instance (Email): The email just deleted.
+        origin (cls): The Model or QuerySet class originating the deletion.
+    """
+
+    User = get_user_model()
+    if (isinstance(origin, User) or (
+            isinstance(origin, QuerySet) and origin.model == User)):
+        return
 
-    assign_perm("view_email", user, email)
-    assign_perm("change_email", user, email)
-    assign_perm("delete_email", user, email)
+    User.objects.filter(pk=instance.user_id).bump_version()
+    invalidate_user_data_cache(instance.user_id)
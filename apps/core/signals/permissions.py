@@ -0,0 +1,110 @@
+from django.contrib.auth.models import Group
+from django.db.models.signals import (
+    m2m_changed,
+    post_delete,
+    post_save,
+)
+from django.dispatch import receiver
+from guardian.models import (
+    GroupObjectPermission,
+    UserObjectPermission,
+)
+
+from utils.permissions import invalidate_perms_cache
+
+from ..models import (
+    EmailGroupObjectPermission,
+    EmailUserObjectPermission,
+    User,
+    UserGroupObjectPermission,
+    UserUserObjectPermission,
+)
+
+
+@receiver(post_save, sender=UserObjectPermission, dispatch_uid="invalidate_user_obj_perms_on_save")
+@receiver(post_delete, sender=UserObjectPermission, dispatch_uid="invalidate_user_obj_perms_on_delete")
+@receiver(post_save, sender=UserUserObjectPermission, dispatch_uid="invalidate_user_user_obj_perms_on_save")
+@receiver(post_delete, sender=UserUserObjectPermission, dispatch_uid="invalidate_user_user_obj_perms_on_delete")
+@receiver(post_save, sender=EmailUserObjectPermission, dispatch_uid="invalidate_email_user_obj_perms_on_save")
+@receiver(post_delete, sender=EmailUserObjectPermission, dispatch_uid="invalidate_email_user_obj_perms_on_delete")
+def invalidate_user_obj_perms(sender, instance, **kwargs):
+    """Invalidates the cached permissions of an user granted/revoked an
+    object permission.
+
+    NOTE guardian's `remove_perm` deletes through a queryset, which doesn't
+    send `post_delete`. After revoking permissions that way, call
+    `utils.permissions.invalidate_perms_cache` yourself.
+
+    Args:
+        sender (cls): The model triggering the signal (`UserObjectPermission`
+            or one of its direct foreign key counterparts).
+        instance (UserObjectPermissionBase): The object permission
+            saved/deleted.
+    """
+
+    invalidate_perms_cache(instance.user_id)
+
+
+@receiver(post_save, sender=GroupObjectPermission, dispatch_uid="invalidate_group_obj_perms_on_save")
+@receiver(post_delete, sender=GroupObjectPermission, dispatch_uid="invalidate_group_obj_perms_on_delete")
+@receiver(post_save, sender=UserGroupObjectPermission, dispatch_uid="invalidate_user_group_obj_perms_on_save")
+@receiver(post_delete, sender=UserGroupObjectPermission, dispatch_uid="invalidate_user_group_obj_perms_on_delete")
+@receiver(post_save, sender=EmailGroupObjectPermission, dispatch_uid="invalidate_email_group_obj_perms_on_save")
+@receiver(post_delete, sender=EmailGroupObjectPermission, dispatch_uid="invalidate_email_group_obj_perms_on_delete")
+@receiver(post_delete, sender=Group, dispatch_uid="invalidate_group_perms_on_delete")
+def invalidate_group_perms(sender, **kwargs):
+    """Invalidates the cached permissions of all the users when a group's
+    permissions change.
+
+    Args:
+        sender (cls): The model triggering the signal (`GroupObjectPermission`,
+            one of its direct foreign key counterparts, or `Group`).
+    """
+
+    invalidate_perms_cache()
+
+
+@receiver(m2m_changed, sender=Group.permissions.through, dispatch_uid="invalidate_group_global_perms")
+def invalidate_group_global_perms(sender, action, **kwargs):
+    """Invalidates the cached permissions of all the users when a group's
+    global permissions change.
+
+    Args:
+        sender (cls): The intermediate model of `Group.permissions`.
+        action (str): The kind of change (e.g. `post_add`).
+    """
+
+    if action.startswith('post_'):
+        invalidate_perms_cache()
+
+
+@receiver(m2m_changed, sender=User.user_permissions.through, dispatch_uid="invalidate_user_global_perms")
+@receiver(m2m_changed, sender=User.groups.through, dispatch_uid="invalidate_user_groups")
+def invalidate_user_perms(sender, instance, action, reverse, pk_set, **kwargs):
+    """Invalidates the cached permissions of the users whose global
+    permissions or groups change.
+
+    Args:
+        sender (cls): The intermediate model of `User.user_permissions` or
+            `User.groups`.
+        instance (Model): The user changed or, if `reverse`, the permission
+            or group changed.
+        action (str): The kind of change (e.g. `post_add`).
+        reverse (bool): Whether the change was made from the other side of
+            the relation (e.g. `group.user_set.add(user)`).
+        pk_set (set): The primary keys of the related objects added/removed,
+            or `None` when the relation is cleared.
+    """
+
+    if not action.startswith('post_'):
+        return
+
+    if not reverse:
+        invalidate_perms_cache(instance)
+
+    elif pk_set:
+        for user_pk in pk_set:
+            invalidate_perms_cache(user_pk)
+
+    else:
+        invalidate_perms_cache()
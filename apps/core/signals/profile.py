@@ -7,6 +7,7 @@ from django.db.models import (
 from django.dispatch import receiver
 from django.utils.translation import gettext_lazy as _
 
+from ..cache import invalidate_user_data_cache
 from ..models import Profile
 
 
@@ -27,3 +28,25 @@ def prevent_profile_direct_deletion(sender, instance, using, origin, **kwargs):
 
     error_msg = _('Can\'t delete a profile directly.')
     raise PermissionDenied(error_msg)
+
+
+@receiver(signals.post_save, sender=Profile, dispatch_uid="bump_user_version_on_profile_save")
+def bump_user_version_on_profile_save(sender, instance, created, **kwargs):
+    """Bumps the version of the user (see `User.version`) of a profile saved.
+
+    The cached data of the user (see `USER_DATA_CACHE`) is invalidated too.
+    Profiles are created along with their users, and profiles saved by
+    `User.save` (see `user_initial_setup`) are flagged with
+    `_skip_version_bump`, as the user's version was already bumped.
+
+    Args:
+        sender (cls): The model triggering the signal (`Profile`).
+        instance (Profile): The profile just saved.
+        created (bool): Whether the profile was created or not (updated).
+    """
+
+    if created or getattr(instance, '_skip_version_bump', False):
+        return
+
+    get_user_model().objects.filter(pk=instance.user_id).bump_version()
+    invalidate_user_data_cache(instance.user_id)
@@ -1,11 +1,11 @@
-from datetime import datetime
-
 from django.conf import settings
 from django.db.models import signals
 from django.dispatch import receiver
 
+from utils.auth import invalidate_auth_user_cache
 from utils.permissions import assign_initial_permissions
 
+from ..cache import invalidate_user_data_cache
 from ..models import (
     Email,
     Profile,
@@ -18,8 +18,8 @@ def generate_username(sender, instance, **kwargs):
 
     This function generates a username for the user being saved, if it
     doesn't have one already. The username is generated from the user's email
-    address, and if it already exists, a numeric sequence based on the
-    timestamp is appended to it (e.g. `john_12345`).
+    address, and if it already exists, the smallest free numeric suffix is
+    appended to it (e.g. `john_2`). See `UserManager.generate_username`.
 
     Args:
         sender (cls): The model triggering the signal (`User`).
@@ -31,22 +31,21 @@ def generate_username(sender, instance, **kwargs):
         return
 
     base_username = user.email.split('@')[0]
-    generated_username = base_username
-
-    while sender.objects.filter(username=generated_username).exists():
-        timestamp_slice = str(int(datetime.now().timestamp()))[-5:]
-        generated_username = f'{base_username}_{timestamp_slice}'
-
-    user.username = generated_username
+    user.username = sender.objects.generate_username(base_username)
 
 
 @receiver(signals.post_save, sender=settings.AUTH_USER_MODEL, dispatch_uid="user_initial_setup")
 def user_initial_setup(sender, instance, created, **kwargs):
-    """Initial setup for newly created user.
+    """Initial setup for newly created user, and profile updates.
 
     This function creates a `Profile` and an `Email` object for newly created
     `User` objects, and assigns the necessary permissions to it, so it can
-    change its own data.
+    change its own data. The `Email` is set as the user's `primary_email`.
+
+    For existing users, the cached data of the user (see `USER_DATA_CACHE`)
+    is invalidated, and the profile attributes set in the `User` (see
+    `User.__setattr__`) are applied to the `Profile`, which is saved only if
+    any of its fields actually changed, and only those fields are written.
 
     Args:
         sender (cls): The model triggering the signal (`User`).
@@ -58,7 +57,8 @@ def user_initial_setup(sender, instance, created, **kwargs):
     if user.is_anonymous:
         return
 
-    profile_kwargs = getattr(user, '_profile_attrs', {})
+    # NOTE The profile attributes are consumed, so they're applied only once
+    profile_kwargs = user.__dict__.pop('_profile_attrs', {})
 
     if created:
         if not getattr(sender, '_skip_profile_creation', False):
@@ -67,12 +67,41 @@ def user_initial_setup(sender, instance, created, **kwargs):
 
         assign_initial_permissions(user)
 
-        Email.objects.create(user=user,
-                             address=user.email)
+        email = Email.objects.create(user=user,
+                                     address=user.email)
+
+        # NOTE A plain `UPDATE`, so the user isn't saved (nor signaled) again
+        sender.objects.filter(pk=user.pk).update(primary_email=email)
+        user.primary_email = email
+
+        return
+
+    invalidate_user_data_cache(user.pk)
 
-    else:
-        if profile_kwargs:
-            for field_name, value in profile_kwargs.items():
-                setattr(user.profile, field_name, value)
+    if profile_kwargs:
+        profile = user.profile
+        for field_name, value in profile_kwargs.items():
+            setattr(profile, field_name, value)
+
+        dirty_fields = profile.get_dirty_fields()
+        if dirty_fields:
+            # NOTE The user's version was just bumped by `User.save`
+            profile._skip_version_bump = True
+            try:
+                profile.save(update_fields=dirty_fields)
+
+            finally:
+                del profile._skip_version_bump
+
+
+@receiver(signals.post_save, sender=settings.AUTH_USER_MODEL, dispatch_uid="invalidate_auth_user_on_save")
+@receiver(signals.post_delete, sender=settings.AUTH_USER_MODEL, dispatch_uid="invalidate_auth_user_on_delete")
+def invalidate_auth_user(sender, instance, **kwargs):
+    """Deletes the cached user of the authentication (see `AUTH_USER_CACHE`).
+
+    Args:
+        sender (cls): The model triggering the signal (`User`).
+        instance (User): The user just saved/deleted.
+    """
 
-        user.profile.save()
+    invalidate_auth_user_cache(instance.pk)
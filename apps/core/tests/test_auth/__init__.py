@@ -0,0 +1,2 @@
+from .cache import CachedJWTAuthenticationTests
+from .token import TokenRevocationTests
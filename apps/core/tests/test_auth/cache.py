@@ -0,0 +1,97 @@
+from django.core.cache import cache
+from django.test import (
+    TestCase,
+    override_settings,
+)
+from rest_framework import status
+
+from utils.tests.mixins import APITestMixin
+
+from ..mixins import UserTestMixin
+from ...serializers import TokenObtainPairSerializer
+
+
+AUTH_USER_CACHE_ON = {
+    'USE_CACHE': True,
+    'CACHE_ALIAS': 'default',
+    'TIMEOUT': 60,
+}
+
+
+@override_settings(AUTH_USER_CACHE=AUTH_USER_CACHE_ON)
+class CachedJWTAuthenticationTests(UserTestMixin,
+                                   APITestMixin,
+                                   TestCase):
+    """Test cases for the cached user of `CachedJWTAuthentication`.
+    """
+
+    def setUp(self):
+        super().setUp()
+        cache.clear()
+        self.retrieve_view = 'core:user-retrieve-update'
+        self.user = self.create_user(given_name='Ramon')
+        token = TokenObtainPairSerializer.get_token(self.user).access_token
+        self.headers = {'Authorization': f'JWT {token}'}
+
+    def test_user_cached_across_requests(self):
+        """The authenticated user is only fetched when it's not cached
+        """
+
+        res = self.api_retrieve(headers=self.headers)
+        self.assertEqual(res.status_code, status.HTTP_200_OK)
+
+        # NOTE Only the version of the user is read (see `USER_DATA_CACHE`)
+        with self.assertNumQueries(1):
+            res = self.api_retrieve(headers=self.headers)
+        self.assertEqual(res.status_code, status.HTTP_200_OK)
+        self.assertEqual(res.data['id'], str(self.user.pk))
+        self.assertEqual(res.data['given_name'], 'Ramon')
+
+        # NOTE Saving the user invalidates the cached user (and its cached
+        # data, as its version is bumped)
+        self.user.username = 'new_valid_username'
+        self.user.save()
+
+        with self.assertNumQueries(4):
+            res = self.api_retrieve(headers=self.headers)
+        self.assertEqual(res.status_code, status.HTTP_200_OK)
+
+    def test_inactive_user_not_authenticated(self):
+        """Deactivated users can't authenticate, even if cached
+        """
+
+        res = self.api_retrieve(headers=self.headers)
+        self.assertEqual(res.status_code, status.HTTP_200_OK)
+
+        self.user.is_active = False
+        self.user.save()
+
+        res = self.api_retrieve(headers=self.headers)
+        self.assertEqual(res.status_code, status.HTTP_401_UNAUTHORIZED)
+
+        with override_settings(AUTH_USER_CACHE={'USE_CACHE': False}):
+            res = self.api_retrieve(headers=self.headers)
+        self.assertEqual(res.status_code, status.HTTP_401_UNAUTHORIZED)
+
+    def test_cached_user_updates_primary_email(self):
+        """The cached user follows the switch of its primary email
+        """
+
+        email = self.user.emails.create(address='another.email@test.com')
+        email.confirm()
+
+        res = self.api_retrieve(headers=self.headers)
+        self.assertEqual(res.status_code, status.HTTP_200_OK)
+
+        res = self.api_patch('core:email-update-destroy',
+                             url_args=[email.pk],
+                             data={'is_primary': True},
+                             headers=self.headers)
+        self.assertEqual(res.status_code, status.HTTP_200_OK)
+
+        # NOTE The former primary email can be deleted
+        old_email = self.user.emails.exclude(pk=email.pk).get()
+        res = self.api_delete('core:email-update-destroy',
+                              url_args=[old_email.pk],
+                              headers=self.headers)
+        self.assertEqual(res.status_code, status.HTTP_204_NO_CONTENT)
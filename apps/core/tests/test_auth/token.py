@@ -0,0 +1,159 @@
+from django.test import TestCase
+from rest_framework import status
+from rest_framework_simplejwt.tokens import RefreshToken
+
+from utils.tests.mixins import APITestMixin
+
+from ..mixins import UserTestMixin
+
+
+class TokenRevocationTests(UserTestMixin,
+                           APITestMixin,
+                           TestCase):
+    """Test cases for the revocation of tokens (see `User.token_version`).
+    """
+
+    def setUp(self):
+        super().setUp()
+        self.password = 'OLD#pass!123'
+        self.user = self.create_user(email='valid.email@test.com',
+                                     password=self.password)
+
+    def obtain_tokens(self):
+        res = self.api_post('core:token',
+                            data={'email': self.user.email,
+                                  'password': self.password})
+        self.assertEqual(res.status_code, status.HTTP_200_OK)
+        return res.data['access'], res.data['refresh']
+
+    def api_refresh(self, refresh):
+        return self.api_post('core:token-refresh', data={'refresh': refresh})
+
+    def api_retrieve_me(self, access):
+        return self.api_get('core:user-retrieve-update',
+                            headers={'Authorization': f'JWT {access}'})
+
+    def assertRevoked(self, access, refresh):
+        res = self.api_retrieve_me(access)
+        self.assertEqual(res.status_code, status.HTTP_401_UNAUTHORIZED)
+
+        res = self.api_refresh(refresh)
+        self.assertEqual(res.status_code, status.HTTP_401_UNAUTHORIZED)
+
+        res = self.api_post('core:token-verify', data={'token': refresh})
+        self.assertEqual(res.status_code, status.HTTP_401_UNAUTHORIZED)
+
+    def test_tokens_valid(self):
+        """Tokens are valid until revoked, including the refreshed ones
+        """
+
+        access, refresh = self.obtain_tokens()
+
+        res = self.api_retrieve_me(access)
+        self.assertEqual(res.status_code, status.HTTP_200_OK)
+
+        res = self.api_refresh(refresh)
+        self.assertEqual(res.status_code, status.HTTP_200_OK)
+
+        res = self.api_retrieve_me(res.data['access'])
+        self.assertEqual(res.status_code, status.HTTP_200_OK)
+
+        res = self.api_post('core:token-verify', data={'token': access})
+        self.assertEqual(res.status_code, status.HTTP_200_OK)
+
+    def test_tokens_without_version_claim(self):
+        """Tokens without the `token_version` claim are valid until revoked
+        """
+
+        # NOTE Minted as before the claim existed
+        refresh = RefreshToken.for_user(self.user)
+        access = str(refresh.access_token)
+        refresh = str(refresh)
+
+        res = self.api_retrieve_me(access)
+        self.assertEqual(res.status_code, status.HTTP_200_OK)
+
+        res = self.api_refresh(refresh)
+        self.assertEqual(res.status_code, status.HTTP_200_OK)
+
+        res = self.api_retrieve_me(res.data['access'])
+        self.assertEqual(res.status_code, status.HTTP_200_OK)
+
+        self.user.revoke_tokens(save=True)
+        self.assertRevoked(access, refresh)
+
+    def test_revoke_tokens(self):
+        """It's possible to revoke all the tokens of the authenticated user
+        """
+
+        access, refresh = self.obtain_tokens()
+        other_access, other_refresh = self.obtain_tokens()
+
+        res = self.api_post('core:token-revoke',
+                            headers={'Authorization': f'JWT {access}'})
+        self.assertEqual(res.status_code, status.HTTP_204_NO_CONTENT)
+
+        self.assertRevoked(access, refresh)
+        self.assertRevoked(other_access, other_refresh)
+
+        # NOTE New tokens can be obtained as usual
+        access, _ = self.obtain_tokens()
+        res = self.api_retrieve_me(access)
+        self.assertEqual(res.status_code, status.HTTP_200_OK)
+
+    def test_tokens_revoked_on_password_reset(self):
+        """Resetting the password revokes all the tokens of the user
+        """
+
+        access, refresh = self.obtain_tokens()
+
+        self.user.generate_reset_token(save=True)
+        self.password = 'NEW#pass!123'
+        res = self.api_post('core:password-reset',
+                            data={'user_id': self.user.pk,
+                                  'reset_token': self.user.reset_token,
+                                  'password_1': self.password,
+                                  'password_2': self.password})
+        self.assertEqual(res.status_code, status.HTTP_200_OK)
+
+        self.assertRevoked(access, refresh)
+
+    def test_tokens_kept_on_password_change(self):
+        """Changing the password through `/api/users/me/` keeps the tokens
+        """
+
+        access, refresh = self.obtain_tokens()
+
+        self.password = 'NEW#pass!123'
+        res = self.api_patch('core:user-retrieve-update',
+                             data={'password_1': self.password,
+                                   'password_2': self.password},
+                             headers={'Authorization': f'JWT {access}'})
+        self.assertEqual(res.status_code, status.HTTP_200_OK)
+
+        res = self.api_retrieve_me(access)
+        self.assertEqual(res.status_code, status.HTTP_200_OK)
+
+        res = self.api_refresh(refresh)
+        self.assertEqual(res.status_code, status.HTTP_200_OK)
+
+        self.obtain_tokens()
+
+    def test_tokens_revoked_on_deactivation(self):
+        """Deactivating the user revokes all its tokens
+        """
+
+        access, refresh = self.obtain_tokens()
+        token_version = self.user.token_version
+
+        self.user.is_active = False
+        self.user.save(update_fields=['is_active'])
+        self.assertRevoked(access, refresh)
+
+        # NOTE Reactivating the user doesn't restore the tokens
+        self.user.is_active = True
+        self.user.save(update_fields=['is_active'])
+        self.assertRevoked(access, refresh)
+
+        self.user.refresh_from_db()
+        self.assertEqual(self.user.token_version, token_version + 1)
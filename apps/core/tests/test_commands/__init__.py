@@ -0,0 +1,7 @@
+from .backfill_primary_emails import BackfillPrimaryEmailsCommandTests
+from .benchmark_password_hashers import BenchmarkPasswordHashersCommandTests
+from .delete_orphan_object_permissions import (
+    DeleteOrphanObjectPermissionsCommandTests,
+)
+from .migrate_object_permissions import MigrateObjectPermissionsCommandTests
+from .send_queued_emails import SendQueuedEmailsCommandTests
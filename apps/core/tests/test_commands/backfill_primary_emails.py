@@ -0,0 +1,45 @@
+from io import StringIO
+
+from django.core.management import call_command
+from django.test import TestCase
+
+from ..mixins import UserTestMixin
+from ...models import User
+
+
+class BackfillPrimaryEmailsCommandTests(UserTestMixin,
+                                        TestCase):
+    """Test cases for the `backfill_primary_emails` command.
+    """
+
+    def test_primary_emails_are_backfilled(self):
+        """Users without `primary_email` are pointed to the `Email` of their
+        address
+        """
+
+        users = [self.create_user() for _ in range(3)]
+        primary_emails = {user.pk: user.primary_email_id for user in users}
+
+        # NOTE An user whose address has no `Email` is left as it is
+        orphan = self.create_user()
+        orphan.emails.all().delete()
+
+        User.objects.update(primary_email=None)
+
+        out = StringIO()
+        call_command('backfill_primary_emails', '--dry-run', stdout=out)
+        self.assertIn('Would update 3 users.', out.getvalue())
+        self.assertFalse(User.objects.filter(
+            primary_email__isnull=False).exists())
+
+        out = StringIO()
+        call_command('backfill_primary_emails', '--batch-size', '2',
+                     stdout=out)
+        self.assertIn('Updated 3 users.', out.getvalue())
+
+        for user in users:
+            user.refresh_from_db()
+            self.assertEqual(user.primary_email_id, primary_emails[user.pk])
+
+        orphan.refresh_from_db()
+        self.assertIsNone(orphan.primary_email_id)
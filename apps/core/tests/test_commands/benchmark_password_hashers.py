@@ -0,0 +1,71 @@
+from io import StringIO
+
+from django.core.management import call_command
+from django.test import (
+    TestCase,
+    override_settings,
+)
+from rest_framework import status
+
+from utils.tests.mixins import APITestMixin
+
+from ..mixins import UserTestMixin
+from ...models import User
+
+
+PASSWORD_HASHERS = [
+    'utils.hashers.TunedPBKDF2PasswordHasher',
+    'django.contrib.auth.hashers.MD5PasswordHasher',
+]
+
+
+@override_settings(PASSWORD_HASHERS=PASSWORD_HASHERS,
+                   PASSWORD_HASHERS_PARAMS={'PBKDF2_ITERATIONS': 1000})
+class BenchmarkPasswordHashersCommandTests(UserTestMixin,
+                                           APITestMixin,
+                                           TestCase):
+    """Test cases for the `benchmark_password_hashers` command, and the
+    tuned hashers (see `utils.hashers`).
+    """
+
+    def test_recommends_parameters(self):
+        """The tunable hashers get recommended parameters
+        """
+
+        out = StringIO()
+        call_command('benchmark_password_hashers', '--samples', '1',
+                     stdout=out)
+        output = out.getvalue()
+
+        self.assertIn('pbkdf2_sha256: ', output)
+        self.assertIn('with iterations=1000, recommended iterations=', output)
+        self.assertIn('(`PBKDF2_ITERATIONS`)', output)
+        self.assertIn('md5: ', output)
+        self.assertIn('(not tunable)', output)
+
+    def test_password_rehashed_on_login(self):
+        """Passwords are hashed again on login when the iterations change
+        """
+
+        password = 'VALID#pass!123'
+        user = self.create_user(password=password)
+        self.assertTrue(user.password.startswith('pbkdf2_sha256$1000$'))
+
+        with override_settings(
+                PASSWORD_HASHERS_PARAMS={'PBKDF2_ITERATIONS': 2000}):
+            res = self.api_post('core:token', data={'email': user.email,
+                                                    'password': password})
+        self.assertEqual(res.status_code, status.HTTP_200_OK)
+
+        # NOTE The password didn't change, so the tokens aren't revoked
+        rehashed_user = User.objects.get(pk=user.pk)
+        self.assertTrue(
+            rehashed_user.password.startswith('pbkdf2_sha256$2000$'))
+        self.assertTrue(rehashed_user.check_password(password))
+        self.assertEqual(rehashed_user.token_version, user.token_version)
+        self.assertEqual(rehashed_user.version, user.version)
+
+        res = self.api_get('core:user-retrieve-update', headers={
+            'Authorization': f'JWT {res.data["access"]}',
+        })
+        self.assertEqual(res.status_code, status.HTTP_200_OK)
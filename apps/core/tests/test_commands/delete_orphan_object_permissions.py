@@ -0,0 +1,78 @@
+from io import StringIO
+
+from django.contrib.auth.models import Group
+from django.core.management import call_command
+from django.test import TestCase
+from guardian.ctypes import get_content_type
+from guardian.models import (
+    GroupObjectPermission,
+    UserObjectPermission,
+)
+
+from utils.permissions import get_permissions
+
+from ..mixins import UserTestMixin
+from ...models import (
+    Email,
+    User,
+)
+
+
+class DeleteOrphanObjectPermissionsCommandTests(UserTestMixin,
+                                                TestCase):
+    """Test cases for the `delete_orphan_object_permissions` command.
+    """
+
+    def create_generic_perm(self, model, perm, obj, **kwargs):
+        return model.objects.create(
+            permission=get_permissions([perm])[0],
+            content_type=get_content_type(obj),
+            object_pk=str(obj.pk),
+            **kwargs,
+        )
+
+    def test_orphans_are_deleted(self):
+        """Only the object permissions of deleted objects are deleted
+        """
+
+        owner = self.create_user()
+        delegate = self.create_user()
+        group = Group.objects.create(name='moderators')
+        kept_email = owner.emails.first()
+        deleted_email = Email.objects.create(user=owner,
+                                             address='deleted@test.com')
+        deleted_user = self.create_user()
+
+        kept = [
+            self.create_generic_perm(UserObjectPermission, 'core.view_email',
+                                     kept_email, user=delegate),
+            self.create_generic_perm(GroupObjectPermission, 'core.view_email',
+                                     kept_email, group=group),
+        ]
+        for perm in ['core.view_email', 'core.change_email']:
+            self.create_generic_perm(UserObjectPermission, perm,
+                                     deleted_email, user=delegate)
+        self.create_generic_perm(GroupObjectPermission, 'core.view_email',
+                                 deleted_email, group=group)
+        self.create_generic_perm(UserObjectPermission, 'core.view_user',
+                                 deleted_user, user=delegate)
+
+        deleted_email.delete()
+        User.objects.filter(pk=deleted_user.pk).delete()
+
+        out = StringIO()
+        call_command('delete_orphan_object_permissions', '--dry-run',
+                     stdout=out)
+        self.assertIn('Done (4 rows).', out.getvalue())
+        self.assertEqual(UserObjectPermission.objects.count(), 4)
+
+        out = StringIO()
+        call_command('delete_orphan_object_permissions', '--batch-size', '2',
+                     stdout=out)
+        self.assertIn('Deleted 2 orphaned `UserObjectPermission` rows of '
+                      '`core.Email`.', out.getvalue())
+        self.assertIn('Done (4 rows).', out.getvalue())
+
+        remaining = [*UserObjectPermission.objects.all(),
+                     *GroupObjectPermission.objects.all()]
+        self.assertEqual(remaining, kept)
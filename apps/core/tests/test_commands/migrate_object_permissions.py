@@ -0,0 +1,112 @@
+from io import StringIO
+
+from django.core.management import call_command
+from django.test import TestCase
+from guardian.ctypes import get_content_type
+from guardian.models import UserObjectPermission
+
+from utils.permissions import get_permissions
+
+from ..mixins import UserTestMixin
+from ...models import (
+    Email,
+    EmailUserObjectPermission,
+    User,
+)
+
+
+class MigrateObjectPermissionsCommandTests(UserTestMixin,
+                                           TestCase):
+    """Test cases for the `migrate_object_permissions` command.
+    """
+
+    def create_generic_perm(self, user, perm, model, object_pk):
+        return UserObjectPermission.objects.create(
+            user=user,
+            permission=get_permissions([perm])[0],
+            content_type=get_content_type(model),
+            object_pk=str(object_pk),
+        )
+
+    def test_direct_models_are_used(self):
+        """New object permissions are written to the direct models
+        """
+
+        user = self.create_user()
+
+        self.assertEqual(
+            user.user_object_permissions.filter(user=user).count(), 2)
+        self.assertEqual(
+            EmailUserObjectPermission.objects.filter(user=user).count(), 3)
+        self.assertFalse(UserObjectPermission.objects.exists())
+
+        user.delete()
+        self.assertFalse(EmailUserObjectPermission.objects.exists())
+
+    def test_generic_rows_are_moved(self):
+        """Generic object permissions are moved to the direct models
+        """
+
+        owner = self.create_user()
+        delegate = self.create_user()
+        email = owner.emails.first()
+
+        self.create_generic_perm(delegate, 'core.view_email', Email, email.pk)
+        self.create_generic_perm(delegate, 'core.change_email', Email,
+                                 email.pk)
+        self.create_generic_perm(delegate, 'core.view_user', User, owner.pk)
+
+        # NOTE Generic object permissions are not deleted along with objects
+        deleted_email = Email.objects.create(user=owner,
+                                             address='deleted@test.com')
+        orphan = self.create_generic_perm(delegate, 'core.view_email', Email,
+                                          deleted_email.pk)
+        deleted_email.delete()
+
+        out = StringIO()
+        call_command('migrate_object_permissions', '--dry-run', stdout=out)
+        self.assertIn('Done (3 rows).', out.getvalue())
+        self.assertEqual(UserObjectPermission.objects.count(), 4)
+
+        call_command('migrate_object_permissions', '--batch-size', '1',
+                     stdout=StringIO())
+
+        self.assertEqual(list(UserObjectPermission.objects.all()), [orphan])
+        self.assertEqual(
+            email.user_object_permissions.filter(user=delegate).count(), 2)
+
+        delegate = User.objects.get(pk=delegate.pk)
+        self.assertTrue(delegate.has_perm('core.change_email', email))
+        self.assertTrue(delegate.has_perm('core.view_user', owner))
+        self.assertFalse(delegate.has_perm('core.change_user', owner))
+
+    def test_malformed_rows_are_skipped(self):
+        """Generic object permissions with a malformed `object_pk` are
+        skipped and counted, without stopping the migration
+        """
+
+        owner = self.create_user()
+        delegate = self.create_user()
+        email = owner.emails.first()
+
+        # NOTE Guardian's `save` checks the object, so the row is inserted
+        malformed, = UserObjectPermission.objects.bulk_create([
+            UserObjectPermission(
+                user=delegate,
+                permission=get_permissions(['core.view_email'])[0],
+                content_type=get_content_type(Email),
+                object_pk='not-an-uuid',
+            ),
+        ])
+        self.create_generic_perm(delegate, 'core.view_email', Email, email.pk)
+
+        out = StringIO()
+        call_command('migrate_object_permissions', '--batch-size', '1',
+                     stdout=out)
+
+        self.assertIn('Skipped 1 `UserObjectPermission` rows of `core.Email` '
+                      'with a malformed `object_pk`.', out.getvalue())
+        self.assertIn('Done (1 rows).', out.getvalue())
+        self.assertEqual(list(UserObjectPermission.objects.all()), [malformed])
+        self.assertTrue(
+            email.user_object_permissions.filter(user=delegate).exists())
@@ -0,0 +1,196 @@
+from io import StringIO
+from smtplib import SMTPException
+from unittest import mock
+
+from django.core.management import call_command
+from django.test import (
+    TestCase,
+    override_settings,
+)
+from django.utils import timezone
+from rest_framework import status
+
+from utils.tests.mixins import APITestMixin
+
+from ..mixins import UserTestMixin
+from ...mail import (
+    PasswordRecoveryEmailMessage,
+    VerificationEmailMessage,
+)
+from ...models import (
+    OutboxEmail,
+    User,
+)
+from ...outbox import (
+    claim_emails,
+    enqueue_verification_email,
+)
+
+
+class SendQueuedEmailsCommandTests(UserTestMixin,
+                                   APITestMixin,
+                                   TestCase):
+    """Test cases for the `send_queued_emails` command, and the outbox (see
+    `core.outbox`).
+    """
+
+    def send_queued_emails(self):
+        out = StringIO()
+        call_command('send_queued_emails', stdout=out)
+        return out.getvalue()
+
+    def test_signup_queues_verification_email(self):
+        """Signing up queues the verification email instead of sending it
+        """
+
+        data = self.create_user_payload()
+        with mock.patch.object(VerificationEmailMessage, 'send') as send:
+            res = self.api_post('core:user-create', data=data)
+
+        self.assertEqual(res.status_code, status.HTTP_201_CREATED)
+        send.assert_not_called()
+
+        user = User.objects.get(email=data['email'])
+        outbox_email = OutboxEmail.objects.get()
+        self.assertEqual(outbox_email.kind, OutboxEmail.Kind.VERIFICATION)
+        self.assertEqual(outbox_email.status, OutboxEmail.Status.PENDING)
+        self.assertEqual(outbox_email.email_id, user.primary_email_id)
+        self.assertEqual(outbox_email.user_id, user.pk)
+
+    def test_queued_emails_are_sent(self):
+        """The worker sends the queued emails once
+        """
+
+        self.user = self.create_user()
+        outbox_email = enqueue_verification_email(self.user.primary_email)
+
+        with mock.patch.object(VerificationEmailMessage, 'send') as send:
+            output = self.send_queued_emails()
+            self.send_queued_emails()
+
+        send.assert_called_once()
+        self.assertIn('Sent 1, ', output)
+
+        outbox_email.refresh_from_db()
+        self.assertEqual(outbox_email.status, OutboxEmail.Status.SENT)
+        self.assertIsNotNone(outbox_email.sent_date)
+        self.assertIsNone(outbox_email.lease_date)
+
+    @override_settings(EMAIL_OUTBOX={'USE_OUTBOX': True,
+                                     'MAX_ATTEMPTS': 2,
+                                     'RETRY_DELAY': 60})
+    def test_failed_emails_are_retried(self):
+        """Failed emails are retried with backoff, and then dead-lettered
+        """
+
+        self.user = self.create_user()
+        outbox_email = enqueue_verification_email(self.user.primary_email)
+
+        with (mock.patch.object(VerificationEmailMessage, 'send',
+                                side_effect=SMTPException('Timeout')) as send,
+              self.assertLogs('apps.core.outbox') as logs):
+            self.send_queued_emails()
+
+            outbox_email.refresh_from_db()
+            self.assertEqual(outbox_email.status, OutboxEmail.Status.PENDING)
+            self.assertEqual(outbox_email.attempts, 1)
+            self.assertEqual(outbox_email.last_error,
+                             'SMTPException: Timeout')
+            self.assertGreater(outbox_email.next_attempt_date,
+                               timezone.now() + timezone.timedelta(seconds=50))
+
+            # NOTE Not due yet
+            self.send_queued_emails()
+            self.assertEqual(send.call_count, 1)
+
+            OutboxEmail.objects.update(next_attempt_date=timezone.now())
+            self.send_queued_emails()
+            self.assertEqual(send.call_count, 2)
+
+        outbox_email.refresh_from_db()
+        self.assertEqual(outbox_email.status, OutboxEmail.Status.FAILED)
+        self.assertEqual(outbox_email.attempts, 2)
+        self.assertEqual([record.levelname for record in logs.records],
+                         ['WARNING', 'ERROR'])
+
+    @override_settings(EMAIL_OUTBOX={'USE_OUTBOX': True,
+                                     'MAX_ATTEMPTS': 1})
+    def test_emails_failing_to_build_are_dead_lettered(self):
+        """Emails whose message can't be built are handled as failed sends,
+        without stopping the rest of the batch
+        """
+
+        self.user = self.create_user()
+        broken_email = enqueue_verification_email(self.user.primary_email)
+        outbox_email = enqueue_verification_email(self.user.primary_email)
+
+        get_email_message = OutboxEmail.get_email_message
+
+        def build_message(instance):
+            if instance.pk == broken_email.pk:
+                raise ValueError('Broken template')
+
+            return get_email_message(instance)
+
+        with (mock.patch.object(OutboxEmail, 'get_email_message',
+                                autospec=True, side_effect=build_message),
+              mock.patch.object(VerificationEmailMessage, 'send') as send,
+              self.assertLogs('apps.core.outbox', level='ERROR')):
+            self.send_queued_emails()
+
+        send.assert_called_once()
+
+        broken_email.refresh_from_db()
+        self.assertEqual(broken_email.status, OutboxEmail.Status.FAILED)
+        self.assertEqual(broken_email.attempts, 1)
+        self.assertEqual(broken_email.last_error, 'ValueError: Broken template')
+        self.assertIsNone(broken_email.lease_date)
+
+        outbox_email.refresh_from_db()
+        self.assertEqual(outbox_email.status, OutboxEmail.Status.SENT)
+
+    def test_unneeded_emails_are_discarded(self):
+        """Emails no longer needed when they're due aren't sent
+        """
+
+        self.user = self.create_user()
+        email = self.user.primary_email
+        outbox_email = enqueue_verification_email(email)
+        email.confirm()
+
+        with mock.patch.object(VerificationEmailMessage, 'send') as send:
+            self.send_queued_emails()
+
+        send.assert_not_called()
+
+        outbox_email.refresh_from_db()
+        self.assertEqual(outbox_email.status, OutboxEmail.Status.DISCARDED)
+
+    def test_claimed_emails_are_skipped(self):
+        """Emails claimed by a worker aren't claimed by another one, until
+        their lease expires
+        """
+
+        self.user = self.create_user()
+        outbox_email = enqueue_verification_email(self.user.primary_email)
+
+        self.assertEqual(claim_emails(10), [outbox_email])
+        self.assertEqual(claim_emails(10), [])
+
+        OutboxEmail.objects.update(lease_date=timezone.now())
+        self.assertEqual(claim_emails(10), [outbox_email])
+
+    @override_settings(EMAIL_OUTBOX={'USE_OUTBOX': False})
+    def test_outbox_disabled(self):
+        """Emails are sent right away when the outbox is disabled
+        """
+
+        self.user = self.create_user()
+
+        with mock.patch.object(PasswordRecoveryEmailMessage, 'send') as send:
+            res = self.api_post('core:password-recovery',
+                                data={'email': self.user.email})
+
+        self.assertEqual(res.status_code, status.HTTP_202_ACCEPTED)
+        send.assert_called_once()
+        self.assertFalse(OutboxEmail.objects.exists())
@@ -0,0 +1 @@
+from .executor import HashingExecutorTests
@@ -0,0 +1,61 @@
+import asyncio
+import threading
+from unittest import mock
+
+from django.contrib.auth import hashers as django_hashers
+from django.test import (
+    TestCase,
+    override_settings,
+)
+
+from utils import hashers
+
+from ..mixins import UserTestMixin
+
+
+HASHING_EXECUTOR_ON = {
+    'USE_EXECUTOR': True,
+    'POOL': 'thread',
+    'MAX_WORKERS': 2,
+}
+
+
+@override_settings(PASSWORD_HASHING_EXECUTOR=HASHING_EXECUTOR_ON)
+class HashingExecutorTests(UserTestMixin,
+                           TestCase):
+    """Test cases for the password hashing executor (see `utils.hashers`).
+    """
+
+    def test_passwords_hashed_by_executor(self):
+        """The passwords of the users are hashed by the executor
+        """
+
+        threads = []
+        original_make_password = django_hashers.make_password
+
+        def make_password(*args, **kwargs):
+            threads.append(threading.current_thread().name)
+            return original_make_password(*args, **kwargs)
+
+        with mock.patch.object(django_hashers, 'make_password',
+                               make_password):
+            user = self.create_user(password='VALID#pass!123')
+
+        self.assertEqual(len(threads), 1)
+        self.assertTrue(threads[0].startswith('password-hashing'))
+
+        self.assertTrue(user.check_password('VALID#pass!123'))
+        self.assertFalse(user.check_password('INVALID#pass!123'))
+
+    def test_async_interface(self):
+        """The passwords can be hashed and checked without blocking the loop
+        """
+
+        async def hash_and_check():
+            encoded = await hashers.amake_password('VALID#pass!123')
+            return (
+                await hashers.acheck_password('VALID#pass!123', encoded),
+                await hashers.acheck_password('INVALID#pass!123', encoded),
+            )
+
+        self.assertEqual(asyncio.run(hash_and_check()), (True, False))
@@ -0,0 +1,2 @@
+from .backend import PooledEmailBackendTests
+from .message import EmailMessageTests
@@ -0,0 +1,163 @@
+import socketserver
+import threading
+
+from django.test import (
+    SimpleTestCase,
+    override_settings,
+)
+
+from utils.mail import (
+    PooledEmailBackend,
+    close_email_connection,
+)
+
+from ...mail import (
+    CustomEmailMessage,
+    send_many,
+)
+
+
+class SMTPHandler(socketserver.StreamRequestHandler):
+    """Speaks just enough SMTP to receive messages.
+    """
+
+    def reply(self, line):
+        self.wfile.write(f'{line}\r\n'.encode())
+
+    def handle(self):
+        server = self.server
+        server.connections += 1
+        received = 0
+
+        self.reply('220 localhost')
+        while line := self.rfile.readline():
+            command = line.decode().strip().upper()
+
+            if command.startswith('EHLO'):
+                self.reply('250 localhost')
+
+            elif command == 'DATA':
+                self.reply('354 End data with <CR><LF>.<CR><LF>')
+                lines = []
+                while (data := self.rfile.readline()) != b'.\r\n':
+                    lines.append(data)
+
+                server.messages.append(b''.join(lines))
+                self.reply('250 OK')
+
+                received += 1
+                if received == server.drop_after:
+                    # NOTE The server drops the connection
+                    return
+
+            elif command == 'QUIT':
+                self.reply('221 Bye')
+                return
+
+            else:
+                self.reply('250 OK')
+
+
+class SMTPServer(socketserver.ThreadingTCPServer):
+    """Local SMTP stand-in, recording the connections and messages.
+    """
+
+    daemon_threads = True
+
+    def __init__(self, drop_after=None):
+        super().__init__(('127.0.0.1', 0), SMTPHandler)
+        self.connections = 0
+        self.drop_after = drop_after
+        self.messages = []
+
+
+class PooledEmailBackendTests(SimpleTestCase):
+    """Test cases for `PooledEmailBackend` and `send_many`.
+    """
+
+    def start_server(self, **kwargs):
+        server = SMTPServer(**kwargs)
+        threading.Thread(target=server.serve_forever, daemon=True).start()
+        self.addCleanup(server.server_close)
+        self.addCleanup(server.shutdown)
+        return server
+
+    def build_backend(self, server, **kwargs):
+        backend = PooledEmailBackend(host='127.0.0.1',
+                                     port=server.server_address[1],
+                                     use_ssl=False,
+                                     use_tls=False,
+                                     username='',
+                                     password='',
+                                     **kwargs)
+        self.addCleanup(backend.close)
+        return backend
+
+    def build_messages(self, count):
+        return [CustomEmailMessage(subject=f'Message {i}',
+                                   body=f'Body {i}',
+                                   to=[f'user.{i}@test.com'])
+                for i in range(count)]
+
+    def test_connection_reused(self):
+        """The messages are sent through a single connection
+        """
+
+        server = self.start_server()
+        backend = self.build_backend(server)
+
+        self.assertEqual(backend.send_messages(self.build_messages(2)), 2)
+        self.assertEqual(backend.send_messages(self.build_messages(1)), 1)
+
+        self.assertEqual(len(server.messages), 3)
+        self.assertEqual(server.connections, 1)
+
+    def test_reconnects_when_dropped(self):
+        """Messages are sent through a new connection if the server drops it
+        """
+
+        server = self.start_server(drop_after=1)
+        backend = self.build_backend(server)
+
+        self.assertEqual(backend.send_messages(self.build_messages(3)), 3)
+
+        self.assertEqual(len(server.messages), 3)
+        self.assertEqual(server.connections, 3)
+
+    def test_idle_connection_checked(self):
+        """Idle connections are checked before they're used
+        """
+
+        server = self.start_server(drop_after=1)
+        backend = self.build_backend(server, max_idle=0)
+
+        self.assertEqual(backend.send_messages(self.build_messages(1)), 1)
+        self.assertEqual(backend.send_messages(self.build_messages(1)), 1)
+
+        self.assertEqual(len(server.messages), 2)
+        self.assertEqual(server.connections, 2)
+
+    def test_send_many(self):
+        """`send_many` sends the messages through the shared backend
+        """
+
+        server = self.start_server()
+
+        with override_settings(TESTING=False,
+                               PRODUCTION=True,
+                               EMAIL_BACKEND='utils.mail.PooledEmailBackend',
+                               EMAIL_HOST='127.0.0.1',
+                               EMAIL_PORT=server.server_address[1],
+                               EMAIL_HOST_USER='',
+                               EMAIL_HOST_PASSWORD='',
+                               EMAIL_USE_SSL=False,
+                               EMAIL_USE_TLS=False):
+            self.addCleanup(close_email_connection)
+
+            messages = self.build_messages(3)
+            self.assertEqual(send_many(messages[:2]), 2)
+            self.assertEqual(messages[2].send(), 1)
+
+        self.assertEqual(len(server.messages), 3)
+        self.assertEqual(server.connections, 1)
+        self.assertIn(b'Message 0', server.messages[0])
@@ -0,0 +1,95 @@
+from io import StringIO
+from unittest import mock
+
+from django.conf import settings
+from django.test import (
+    TestCase,
+    override_settings,
+)
+
+from utils.helpers import load_entity
+
+from ..mixins import UserTestMixin
+from ...mail import (
+    PasswordRecoveryEmailMessage,
+    VerificationEmailMessage,
+)
+
+
+def send_callback(message):
+    return 1
+
+
+class EmailMessageTests(UserTestMixin,
+                        TestCase):
+    """Test cases for the rendering of `VerificationEmailMessage` and
+    `PasswordRecoveryEmailMessage`.
+    """
+
+    def test_bodies_rendered_from_templates(self):
+        """The bodies are rendered from the templates, with the copy
+        """
+
+        self.user = self.create_user()
+        email = self.user.primary_email
+        message = email.get_verification_email_message()
+
+        copy = message.get_copy()
+        self.assertIn(copy['confirmation_url'], message.body)
+        self.assertIn(copy['title_text'], message.body)
+        self.assertIn('Use the following link to confirm your email address:',
+                      message.body)
+        self.assertNotIn('<', message.body)
+
+        self.assertIn(f'<h1>{copy["title_text"]}</h1>', message.html_body)
+        self.assertIn('confirmation_code=', message.html_body)
+        self.assertNotIn('&confirmation_code=', message.html_body)
+
+        self.user.generate_reset_token(save=True)
+        message = self.user.get_password_recovery_email_message()
+        self.assertIn(str(self.user.reset_token), message.body)
+        self.assertIn(str(self.user.reset_token), message.html_body)
+
+    @override_settings(DEBUG=True)
+    def test_copy_built_once(self):
+        """The copy is built once per message, for its bodies and `print`
+        """
+
+        self.user = self.create_user()
+        self.user.generate_reset_token(save=True)
+
+        for message_class, kwargs in [
+            (VerificationEmailMessage,
+             {'email_to_verify': self.user.primary_email}),
+            (PasswordRecoveryEmailMessage, {'user': self.user}),
+        ]:
+            with mock.patch.object(
+                    message_class, 'get_body_copy', autospec=True,
+                    side_effect=message_class.get_body_copy) as get_body_copy:
+                message = message_class(**kwargs)
+                with mock.patch('sys.stdout', new_callable=StringIO):
+                    message.print()
+
+            self.assertEqual(get_body_copy.call_count, 1)
+
+    def test_send_email_callback_loaded_once(self):
+        """The `SEND_EMAIL_CALLBACK` is loaded once, until the settings change
+        """
+
+        self.user = self.create_user()
+        email = self.user.primary_email
+
+        config = {**settings.EMAIL_CONFIRMATION,
+                  'SEND_EMAIL_CALLBACK': f'{__name__}.send_callback'}
+        with override_settings(TESTING=False,
+                               PRODUCTION=True,
+                               EMAIL_CONFIRMATION=config):
+            for _ in range(3):
+                message = email.get_verification_email_message()
+                self.assertEqual(message.send(), 1)
+
+            cache_info = load_entity.cache_info()
+            self.assertEqual(cache_info.misses, 1)
+            self.assertEqual(cache_info.hits, 2)
+
+        self.assertEqual(load_entity.cache_info().currsize, 0)
@@ -1,11 +1,17 @@
-from datetime import datetime
+from unittest import mock
 
+from django.db import (
+    IntegrityError,
+    connection,
+)
 from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
 
 from ...models import (
     Profile,
     User,
 )
+from ...serializers import UserSerializer
 from ..mixins import UserTestMixin
 
 
@@ -26,8 +32,57 @@ class UserManagerTests(UserTestMixin,
         self.assertEqual(user_1.username, 'test')
 
         user_2 = User.objects.create_user(email='test@example2.com')
-        auto_username = 'test_' + str(int(datetime.now().timestamp()))[-5:-2]
-        self.assertTrue(user_2.username.startswith(auto_username))
+        self.assertEqual(user_2.username, 'test_1')
+
+        user_3 = User.objects.create_user(email='test@example3.com')
+        self.assertEqual(user_3.username, 'test_2')
+
+        # NOTE The smallest free suffix is picked
+        user_2.delete()
+        user_4 = User.objects.create_user(email='test@example4.com')
+        self.assertEqual(user_4.username, 'test_1')
+
+    def test_manager_generate_username_single_query(self):
+        """`UserManager.generate_username` runs a single query
+        """
+
+        for i in range(10):
+            User.objects.create_user(email=f'test@example{i}.com')
+        User.objects.create_user(email='test_other@example.com')
+        User.objects.create_user(email='test_10a@example.com')
+
+        with self.assertNumQueries(1):
+            username = User.objects.generate_username('test')
+
+        self.assertEqual(username, 'test_10')
+
+    def test_manager_create_user_retries_taken_username(self):
+        """`UserManager.create_user` retries when the username is taken
+        """
+
+        User.objects.create_user(email='test@example1.com')
+
+        # NOTE Given usernames are not retried
+        with self.assertRaises(IntegrityError):
+            User.objects.create_user(email='test@example2.com',
+                                     username='test')
+
+        # NOTE Simulates a concurrent signup taking `test` after it was
+        # generated for this user, but before it was saved.
+        generate_username = User.objects.generate_username
+        stale_usernames = ['test']
+
+        def generate_stale_username(base_username):
+            if stale_usernames:
+                return stale_usernames.pop()
+            return generate_username(base_username)
+
+        with mock.patch.object(User.objects, 'generate_username',
+                               side_effect=generate_stale_username):
+            user = User.objects.create_user(email='test@example2.com')
+
+        self.assertEqual(user.username, 'test_1')
+        self.assertEqual(User.objects.filter(username='test_1').count(), 1)
 
     def test_manager_create_user_accepts_profile_data(self):
         """`UserManager.create_user` handles profile data
@@ -48,3 +103,48 @@ class UserManagerTests(UserTestMixin,
         self.assertEqual(user.family_name, 'Kayo')
         self.assertEqual(user.profile.given_name, 'Ramon')
         self.assertEqual(user.profile.family_name, 'Kayo')
+
+    def test_manager_joins_profile_by_default(self):
+        """`User.objects` loads the profiles along with the users
+        """
+
+        for i in range(3):
+            self.create_user(given_name=f'Ramon {i}', family_name='Kayo')
+
+        users = list(User.objects.exclude(profile=None))
+        with self.assertNumQueries(0):
+            for user in users:
+                self.assertTrue(user.given_name.startswith('Ramon'))
+                self.assertTrue(user.full_name.endswith('Kayo'))
+
+        # NOTE Opting out, each profile is loaded when first accessed
+        users = list(User.objects.without_profile().exclude(profile=None))
+        with self.assertNumQueries(3):
+            for user in users:
+                self.assertTrue(user.given_name.startswith('Ramon'))
+
+        # NOTE The profiles are not joined when locking the users
+        queryset = User.objects.select_for_update()
+        self.assertNotIn('core_profile', str(queryset.query))
+
+    def test_manager_serializes_users_in_constant_queries(self):
+        """`UserSerializer` output takes the same queries for any user count
+        """
+
+        def serialize_users():
+            queryset = UserSerializer.setup_eager_loading(User.objects.all())
+            with CaptureQueriesContext(connection) as ctx:
+                data = UserSerializer(queryset, many=True).data
+
+            return data, len(ctx.captured_queries)
+
+        self.create_user(given_name='Ramon')
+        data, queries_count = serialize_users()
+
+        for i in range(5):
+            self.create_user(given_name=f'Ramon {i}')
+
+        more_data, more_queries_count = serialize_users()
+        self.assertEqual(len(more_data), len(data) + 5)
+        self.assertEqual(more_queries_count, queries_count)
+        self.assertEqual(more_queries_count, 2)
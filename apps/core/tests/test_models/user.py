@@ -1,8 +1,13 @@
 from django.contrib.auth import get_user_model
+from django.db import connection
 from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
 
 from ..mixins import UserTestMixin
-from ...models import Profile
+from ...models import (
+    Email,
+    Profile,
+)
 
 
 User = get_user_model()
@@ -42,6 +47,27 @@ class UserModelTests(UserTestMixin,
         user.delete()
         self.assertEqual(Profile.objects.count(), 0)
 
+    def test_user_primary_email_follows_email(self):
+        """`User.primary_email` is kept in sync with `User.email`
+        """
+
+        user = self.create_user(email='valid.email@test.com')
+        self.assertEqual(user.primary_email.address, 'valid.email@test.com')
+        self.assertEqual(User.objects.get(pk=user.pk).primary_email,
+                         user.primary_email)
+
+        other_email = Email.objects.create(user=user,
+                                           address='other.email@test.com')
+        user.email = other_email.address
+        user.save()
+        user.refresh_from_db()
+        self.assertEqual(user.primary_email, other_email)
+
+        user.email = 'not.an.email.of.the.user@test.com'
+        user.save(update_fields=['email'])
+        user.refresh_from_db()
+        self.assertIsNone(user.primary_email)
+
     def test_user_handles_profile_data(self):
         """`User` model handles `Profile` data
         """
@@ -82,3 +108,76 @@ class UserModelTests(UserTestMixin,
         # the `User` model to handle `Profile` fields as it was its own
         with self.assertRaises(AttributeError):
             _test = user.inexistent_field
+
+    def test_user_tracks_dirty_fields(self):
+        """`User` tracks the fields changed since loaded or saved
+        """
+
+        user = User(email='ramon@test.com')
+        self.assertIn('email', user.get_dirty_fields())
+
+        user.save()
+        user = User.objects.get(pk=user.pk)
+        self.assertFalse(user.is_dirty)
+
+        user.username = 'new_username'
+        user.given_name = 'Ramon'
+        self.assertEqual(user.get_dirty_fields(), ['username'])
+
+        user.save()
+        self.assertFalse(user.is_dirty)
+
+    def test_saving_user_saves_only_changed_profile_fields(self):
+        """Saving an `User` only writes the `Profile` fields that changed
+        """
+
+        user = self.create_user(given_name='Ramon',
+                                family_name='Kayo')
+        user = User.objects.get(pk=user.pk)
+
+        # NOTE Only the user is updated
+        with self.assertNumQueries(1):
+            user.clear_reset_token(save=True)
+
+        # NOTE The profile was loaded along with the user, and isn't updated
+        user.given_name = 'Ramon'
+        with self.assertNumQueries(1):
+            user.save()
+
+        # NOTE The user and only the changed profile field are updated
+        user.given_name = 'Ramon Test'
+        with CaptureQueriesContext(connection) as ctx:
+            user.save()
+
+        self.assertEqual(len(ctx.captured_queries), 2)
+        profile_update = ctx.captured_queries[1]['sql']
+        self.assertIn('given_name', profile_update)
+        self.assertNotIn('family_name', profile_update)
+
+        user.profile.refresh_from_db()
+        self.assertEqual(user.profile.given_name, 'Ramon Test')
+        self.assertEqual(user.profile.family_name, 'Kayo')
+
+    def test_user_from_db_fast_path(self):
+        """`User` loaded from the database behave the same in both paths
+        """
+
+        created = self.create_user(given_name='Ramon')
+
+        # NOTE All the fields loaded: fast path
+        user = User.objects.get(pk=created.pk)
+        # NOTE Deferred fields: default path
+        deferred_user = User.objects.only('email').get(pk=created.pk)
+
+        for loaded in [user, deferred_user]:
+            self.assertFalse(loaded._state.adding)
+            self.assertEqual(loaded._state.db, 'default')
+            self.assertFalse(loaded.is_dirty)
+            self.assertEqual(loaded.email, created.email)
+            self.assertEqual(loaded.username, created.username)
+            self.assertEqual(loaded.given_name, 'Ramon')
+
+        user.given_name = 'Ramon Test'
+        user.save()
+        self.assertEqual(Profile.objects.get(user=created).given_name,
+                         'Ramon Test')
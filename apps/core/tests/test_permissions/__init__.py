@@ -0,0 +1,3 @@
+from .cache import PermissionsCacheTests
+from .email import EmailPermissionsTests
+from .owner import OwnerOrObjectPermissionsTests
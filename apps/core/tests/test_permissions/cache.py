@@ -0,0 +1,136 @@
+from django.contrib.auth.models import Group
+from django.core.cache import cache
+from django.test import (
+    TestCase,
+    override_settings,
+)
+from guardian.shortcuts import assign_perm
+from rest_framework import status
+
+from utils.permissions import get_permissions
+from utils.tests.mixins import APITestMixin
+
+from ..mixins import UserTestMixin
+from ...models import (
+    Email,
+    User,
+)
+
+
+PERMISSIONS_CACHE_ON = {
+    'USE_CACHE': True,
+    'CACHE_ALIAS': 'default',
+    'TIMEOUT': 60,
+}
+
+
+class PermissionsCacheTests(UserTestMixin,
+                            APITestMixin,
+                            TestCase):
+    """Test cases for the cached permission backends.
+    """
+
+    def setUp(self):
+        super().setUp()
+        cache.clear()
+        self.user = self.create_user()
+        self.email = Email.objects.create(user=self.user,
+                                          address='new.valid.email@test.com')
+
+    def fresh_user(self):
+        # NOTE Each request loads a new `User` instance, so the permissions
+        # cached in the instance don't outlive the request.
+        return User.objects.get(pk=self.user.pk)
+
+    def test_object_perms_cached_in_request(self):
+        """The object permissions are fetched once per user instance
+        """
+
+        user = self.fresh_user()
+        self.assertTrue(user.has_perm('core.change_email', self.email))
+
+        with self.assertNumQueries(0):
+            self.assertTrue(user.has_perm('core.delete_email', self.email))
+            self.assertFalse(user.has_perm('core.add_email', self.email))
+            self.assertIn('view_email', user.get_all_permissions(self.email))
+
+    @override_settings(PERMISSIONS_CACHE=PERMISSIONS_CACHE_ON)
+    def test_perms_cached_across_requests(self):
+        """The permissions are kept in the cache across requests
+        """
+
+        user = self.fresh_user()
+        self.assertTrue(user.has_perm('core.change_user'))
+        self.assertTrue(user.has_perm('core.change_email', self.email))
+
+        user = self.fresh_user()
+        with self.assertNumQueries(0):
+            self.assertTrue(user.has_perm('core.change_user'))
+            self.assertTrue(user.has_perm('core.change_email', self.email))
+            self.assertFalse(user.has_perm('core.add_email', self.email))
+
+    @override_settings(PERMISSIONS_CACHE=PERMISSIONS_CACHE_ON)
+    def test_object_perms_invalidated_on_grant_and_revoke(self):
+        """Granting or revoking object permissions invalidates the cache
+        """
+
+        other_user = self.create_user()
+        other_email = other_user.emails.first()
+
+        self.assertFalse(
+            self.fresh_user().has_perm('core.view_email', other_email))
+
+        obj_perm = assign_perm('core.view_email', self.user, other_email)
+        self.assertTrue(
+            self.fresh_user().has_perm('core.view_email', other_email))
+
+        obj_perm.delete()
+        self.assertFalse(
+            self.fresh_user().has_perm('core.view_email', other_email))
+
+    @override_settings(PERMISSIONS_CACHE=PERMISSIONS_CACHE_ON)
+    def test_global_perms_invalidated_on_group_changes(self):
+        """Changing groups or their permissions invalidates the cache
+        """
+
+        self.assertFalse(self.fresh_user().has_perm('core.delete_user'))
+
+        group = Group.objects.create(name='moderators')
+        group.user_set.add(self.user)
+        self.assertFalse(self.fresh_user().has_perm('core.delete_user'))
+
+        group.permissions.add(*get_permissions(['core.delete_user']))
+        self.assertTrue(self.fresh_user().has_perm('core.delete_user'))
+
+        self.user.groups.remove(group)
+        self.assertFalse(self.fresh_user().has_perm('core.delete_user'))
+
+    @override_settings(PERMISSIONS_CACHE=PERMISSIONS_CACHE_ON)
+    def test_api_query_count(self):
+        """Warm permissions spare the permission queries of API requests
+        """
+
+        self.partial_update_view = 'core:user-retrieve-update'
+
+        # NOTE Without the cache, each request runs 2 permission queries: the
+        # user's and groups' global permissions. The object permissions are
+        # granted by ownership (see `OwnerOrObjectPermissions`).
+        self.authenticate(self.fresh_user())
+        with self.assertNumQueries(6):
+            res = self.api_partial_update(data={'given_name': 'Ramon'})
+        self.assertEqual(res.status_code, status.HTTP_200_OK)
+
+        self.authenticate(self.fresh_user())
+        with self.assertNumQueries(4):
+            res = self.api_partial_update(data={'given_name': 'Kayo'})
+        self.assertEqual(res.status_code, status.HTTP_200_OK)
+
+        # NOTE With the global permissions warm, no permission queries are
+        # made at all. The queries left are the email's, the deletion of its
+        # object permissions and outbox emails, which cascade along with it,
+        # and the bump of the user's version.
+        self.authenticate(self.fresh_user())
+        with self.assertNumQueries(8):
+            res = self.api_delete('core:email-update-destroy',
+                                  url_kwargs={'pk': self.email.pk})
+        self.assertEqual(res.status_code, status.HTTP_204_NO_CONTENT)
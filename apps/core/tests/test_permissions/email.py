@@ -0,0 +1,74 @@
+from django.test import TestCase
+
+from utils.permissions import (
+    EMAIL_OBJECT_PERMISSIONS,
+    bulk_assign_perms,
+    get_permissions,
+)
+
+from ..mixins import UserTestMixin
+from ...models import Email
+
+
+class EmailPermissionsTests(UserTestMixin,
+                            TestCase):
+    """Test cases for the `Email` object permissions.
+    """
+
+    def test_creating_email_assigns_permissions(self):
+        """Creating an `Email` grants its owner all permissions in one insert
+        """
+
+        user = self.create_user()
+        get_permissions(EMAIL_OBJECT_PERMISSIONS)
+
+        # NOTE One query for the email, one for the permissions and one to
+        # bump the user's version
+        with self.assertNumQueries(3):
+            email = Email.objects.create(user=user,
+                                         address='new.valid.email@test.com')
+
+        for perm in ['view_email', 'change_email', 'delete_email']:
+            self.assertTrue(user.has_perm(perm, email))
+
+    def test_bulk_assign_perms_to_owners(self):
+        """`bulk_assign_perms` grants permissions to each object owner at once
+        """
+
+        users = [self.create_user() for _ in range(3)]
+        emails = Email.objects.bulk_create([
+            Email(user=user, address=f'bulk.{i}@test.com')
+            for i, user in enumerate(users)
+        ])
+        get_permissions(EMAIL_OBJECT_PERMISSIONS)
+
+        with self.assertNumQueries(1):
+            bulk_assign_perms(EMAIL_OBJECT_PERMISSIONS, emails)
+
+        for user, email in zip(users, emails):
+            self.assertTrue(user.has_perm('change_email', email))
+            other_emails = [e for e in emails if e.user_id != user.pk]
+            self.assertFalse(user.has_perm('change_email', other_emails[0]))
+
+        queryset = Email.objects.filter(pk__in=[e.pk for e in emails])
+
+        # NOTE One query to read the owners, one to insert (ignoring the
+        # permissions that were already granted)
+        with self.assertNumQueries(2):
+            bulk_assign_perms(EMAIL_OBJECT_PERMISSIONS, queryset)
+
+    def test_bulk_assign_perms_to_user(self):
+        """`bulk_assign_perms` grants permissions over many objects to an user
+        """
+
+        owner = self.create_user()
+        delegate = self.create_user()
+        emails = list(owner.emails.all())
+
+        bulk_assign_perms(['view_email'], emails, user=delegate)
+
+        self.assertTrue(delegate.has_perm('view_email', emails[0]))
+        self.assertFalse(delegate.has_perm('change_email', emails[0]))
+
+        with self.assertRaises(ValueError):
+            bulk_assign_perms(['core.view_user'], emails, user=delegate)
@@ -0,0 +1,85 @@
+from types import SimpleNamespace
+
+from django.test import TestCase
+from guardian.shortcuts import assign_perm
+from rest_framework import status
+
+from utils.permissions import OwnerOrObjectPermissions
+from utils.tests.mixins import APITestMixin
+
+from ..mixins import UserTestMixin
+from ...models import (
+    Email,
+    User,
+)
+
+
+class OwnerOrObjectPermissionsTests(UserTestMixin,
+                                    APITestMixin,
+                                    TestCase):
+    """Test cases for the `OwnerOrObjectPermissions` permission class.
+    """
+
+    def setUp(self):
+        super().setUp()
+        self.partial_update_view = 'core:user-retrieve-update'
+        self.user = self.create_user()
+        self.email = Email.objects.create(user=self.user,
+                                          address='new.valid.email@test.com')
+
+    def has_object_permission(self, user, method, obj):
+        request = SimpleNamespace(user=user, method=method)
+        view = SimpleNamespace(queryset=obj.__class__.objects.all())
+        return OwnerOrObjectPermissions().has_object_permission(
+            request, view, obj)
+
+    def test_owner_skips_object_permission_queries(self):
+        """Owners are granted their object permissions without queries
+        """
+
+        user = User.objects.get(pk=self.user.pk)
+        with self.assertNumQueries(0):
+            self.assertTrue(self.has_object_permission(user, 'PATCH', user))
+            self.assertTrue(
+                self.has_object_permission(user, 'DELETE', self.email))
+
+        # NOTE Only the global permissions of `DjangoModelPermissions` are
+        # fetched (user's and groups').
+        self.authenticate(User.objects.get(pk=self.user.pk))
+        with self.assertNumQueries(6):
+            res = self.api_partial_update(data={'given_name': 'Ramon'})
+        self.assertEqual(res.status_code, status.HTTP_200_OK)
+
+        # NOTE One of the queries bumps the user's version, and another one
+        # deletes the outbox emails of the email (see `OutboxEmail`)
+        self.authenticate(User.objects.get(pk=self.user.pk))
+        with self.assertNumQueries(10):
+            res = self.api_delete('core:email-update-destroy',
+                                  url_kwargs={'pk': self.email.pk})
+        self.assertEqual(res.status_code, status.HTTP_204_NO_CONTENT)
+
+    def test_owner_without_owner_permission_falls_back(self):
+        """Owners fall back to guardian for permissions they aren't granted
+        """
+
+        user = User.objects.get(pk=self.user.pk)
+        self.assertFalse(self.has_object_permission(user, 'DELETE', user))
+
+    def test_non_owner_falls_back_to_guardian(self):
+        """Non-owners are granted only the permissions assigned by guardian
+        """
+
+        delegate = self.create_user()
+        self.assertFalse(
+            self.has_object_permission(delegate, 'DELETE', self.email))
+
+        assign_perm('core.view_email', delegate, self.email)
+        delegate = User.objects.get(pk=delegate.pk)
+        self.assertTrue(self.has_object_permission(delegate, 'GET', self.email))
+        self.assertFalse(
+            self.has_object_permission(delegate, 'DELETE', self.email))
+
+        assign_perm('core.delete_email', delegate, self.email)
+        delegate = User.objects.get(pk=delegate.pk)
+        self.assertTrue(
+            self.has_object_permission(delegate, 'DELETE', self.email))
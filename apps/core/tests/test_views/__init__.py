@@ -5,5 +5,6 @@ from .email import (
 from .user import (
     PasswordRecoveryAPITests,
     UserCreateAPITests,
+    UserRetrieveAPITests,
     UserUpdateAPITests,
 )
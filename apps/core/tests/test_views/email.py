@@ -1,13 +1,19 @@
 import uuid
 
+from django.db import connection
 from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
 from django.utils import timezone
 from rest_framework import status
 
 from utils.tests.mixins import APITestMixin
 
 from ..mixins import UserTestMixin
-from ...models import Email
+from ...models import (
+    Email,
+    OutboxEmail,
+)
+from ...outbox import enqueue_verification_email
 
 
 class EmailAPITests(UserTestMixin,
@@ -97,6 +103,22 @@ class EmailAPITests(UserTestMixin,
         self.assertIn('non_field_errors', res.data)
         self.assertEqual(self.user.emails.count(), 2)
 
+    def test_remove_user_primary_email_not_backfilled(self):
+        """It's impossible to remove user primary email, even before the
+        `primary_email` of the user is backfilled
+        """
+
+        self.user = self.create_user(email='valid.email@test.com')
+        primary_email = self.user.primary_email
+        self.user.primary_email = None
+        self.user.save(update_fields=['primary_email'])
+        self.authenticate()
+
+        res = self.api_destroy(url_args=[primary_email.pk])
+
+        self.assertEqual(res.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertTrue(self.user.emails.filter(pk=primary_email.pk).exists())
+
     def test_make_user_confirmed_email_primary(self):
         """It's possible to make an confirmed email primary
         """
@@ -123,6 +145,40 @@ class EmailAPITests(UserTestMixin,
         self.assertTrue(additional_email.is_primary)
         self.assertEqual(self.user.email, additional_email.address)
 
+    def test_make_user_email_primary_single_update(self):
+        """Making an email primary updates the user with a single query
+        """
+
+        self.user = self.create_user(email='valid.email@test.com')
+        self.authenticate()
+        additional_email = Email.objects.create(
+            address='another.valid.email@test.com',
+            user=self.user,
+        )
+        additional_email.confirm()
+
+        data = {'is_primary': True}
+        with CaptureQueriesContext(connection) as ctx:
+            res = self.api_partial_update(
+                url_args=[additional_email.pk], data=data)
+
+        self.assertEqual(res.status_code, status.HTTP_200_OK)
+
+        updates = [q['sql'] for q in ctx.captured_queries
+                   if q['sql'].startswith('UPDATE')]
+        self.assertEqual(len(updates), 1)
+        self.assertIn('"primary_email_id"', updates[0])
+
+        self.user.refresh_from_db()
+        self.assertEqual(self.user.primary_email, additional_email)
+        self.assertEqual(self.user.email, additional_email.address)
+
+        # NOTE The emails loaded through the user don't load it again
+        with self.assertNumQueries(1):
+            primary_emails = [email.address for email in self.user.emails.all()
+                              if email.is_primary]
+        self.assertEqual(primary_emails, [additional_email.address])
+
     def test_make_user_unconfirmed_email_primary(self):
         """It's impossible to an unconfirmed email primary
         """
@@ -246,6 +302,11 @@ class EmailConfirmationAPITests(UserTestMixin,
         self.authenticate()
         self.assertFalse(self.user.primary_email.is_confirmed)
 
+        # NOTE The code must be older than the `RESEND_COOLDOWN`
+        self.user.primary_email.confirmation_code_date = (
+            timezone.now() - timezone.timedelta(hours=1))
+        self.user.primary_email.save()
+
         initial_confirmation_code = self.user.primary_email.confirmation_code
         initial_confirmation_code_date = self.user.primary_email.confirmation_code_date
 
@@ -259,6 +320,55 @@ class EmailConfirmationAPITests(UserTestMixin,
         self.assertNotEqual(self.user.primary_email.confirmation_code_date,
                             initial_confirmation_code_date)
 
+    def test_request_confirmation_within_cooldown(self):
+        """Requests for email confirmation within the cooldown are coalesced
+        into the queued email, or throttled
+        """
+
+        self.user = self.create_user()
+        self.authenticate()
+        email = self.user.primary_email
+
+        res = self.api_request_confirmation(url_args=[email.pk])
+        self.assertEqual(res.status_code, status.HTTP_429_TOO_MANY_REQUESTS)
+        self.assertIn('Retry-After', res.headers)
+        self.assertLessEqual(int(res.headers['Retry-After']), 60)
+
+        # NOTE Nothing is written while the verification email is queued: the
+        # queries are the email's and the outbox check.
+        enqueue_verification_email(email)
+        initial_confirmation_code = email.confirmation_code
+
+        with self.assertNumQueries(2):
+            res = self.api_request_confirmation(url_args=[email.pk])
+        self.assertEqual(res.status_code, status.HTTP_202_ACCEPTED)
+
+        email.refresh_from_db()
+        self.assertEqual(email.confirmation_code, initial_confirmation_code)
+        self.assertEqual(OutboxEmail.objects.filter(email=email).count(), 1)
+
+    def test_request_confirmation_queued_after_cooldown(self):
+        """Requests for email confirmation after the cooldown reuse the
+        verification email still queued (e.g. being retried)
+        """
+
+        self.user = self.create_user()
+        self.authenticate()
+        email = self.user.primary_email
+
+        enqueue_verification_email(email)
+        email.confirmation_code_date = (
+            timezone.now() - timezone.timedelta(hours=1))
+        email.save()
+        initial_confirmation_code = email.confirmation_code
+
+        res = self.api_request_confirmation(url_args=[email.pk])
+        self.assertEqual(res.status_code, status.HTTP_202_ACCEPTED)
+
+        email.refresh_from_db()
+        self.assertNotEqual(email.confirmation_code, initial_confirmation_code)
+        self.assertEqual(OutboxEmail.objects.filter(email=email).count(), 1)
+
     def test_request_confirmation_confirmed_email(self):
         """It's impossible to request email confirmation for confirmed email
         """
@@ -1,11 +1,26 @@
-from django.test import TestCase
+from unittest import mock
+
+from django.core.cache import cache
+from django.test import (
+    TestCase,
+    override_settings,
+)
 from django.utils import timezone
-from rest_framework import status
+from rest_framework import (
+    serializers,
+    status,
+)
 
 from utils.tests.mixins import APITestMixin
 
 from ..mixins import UserTestMixin
-from ...models import User
+from ...cache import get_cached_user_data
+from ...models import (
+    Email,
+    User,
+)
+from ...serializers import UserSerializer
+from ...views import UserRetrieveUpdateAPIView
 
 
 class UserCreateAPITests(UserTestMixin,
@@ -100,6 +115,210 @@ class UserCreateAPITests(UserTestMixin,
         self.assertIn('username', res.data)
         self.assertEqual(User.objects.count(), 2)
 
+    def test_create_user_query_count(self):
+        """Creating an user runs a fixed number of queries
+        """
+
+        # NOTE The first request warms up the permissions and content types
+        # caches, which are kept for the lifetime of the process.
+        self.api_create(data=self.create_user_payload())
+
+        # NOTE Four of the queries are the savepoints (and their releases) of
+        # the view, which commits the user and its verification email (see
+        # `core.outbox`) together, and of `UserManager.create_user`, which
+        # retries taken usernames. One more queues the email.
+        data = self.create_user_payload()
+        with self.assertNumQueries(15):
+            res = self.api_create(data=data)
+
+        self.assertEqual(res.status_code, status.HTTP_201_CREATED)
+
+        user = User.objects.get(email=data['email'])
+        self.assertTrue(user.has_perm('core.change_user'))
+        self.assertTrue(user.has_perm('core.change_user', user))
+        self.assertTrue(user.has_perm('core.delete_email'))
+
+
+class UserRetrieveAPITests(UserTestMixin,
+                           APITestMixin,
+                           TestCase):
+
+    def setUp(self):
+        super().setUp()
+        cache.clear()
+        self.retrieve_view = 'core:user-retrieve-update'
+
+    def test_retrieve_user(self):
+        """It's possible to retrieve the authenticated user
+        """
+
+        self.user = self.create_user(given_name='Ramon')
+        self.authenticate()
+
+        res = self.api_retrieve()
+
+        self.assertEqual(res.status_code, status.HTTP_200_OK)
+        self.assertEqual(res.data['id'], str(self.user.pk))
+        self.assertEqual(res.data['given_name'], 'Ramon')
+        self.assertEqual([e['address'] for e in res.data['emails']],
+                         [self.user.email])
+
+    @override_settings(USER_DATA_CACHE={'USE_CACHE': False})
+    def test_retrieve_user_values_read(self):
+        """The user is retrieved the same way with or without `values_read`
+        """
+
+        self.user = self.create_user(given_name='Ramon', family_name=None)
+        Email.objects.create(user=self.user,
+                             address='another.email@test.com').confirm()
+        self.authenticate()
+
+        res = self.api_retrieve()
+        self.assertEqual(res.status_code, status.HTTP_200_OK)
+
+        with mock.patch.object(UserRetrieveUpdateAPIView, 'values_read',
+                               False):
+            serializer_res = self.api_retrieve()
+
+        self.assertEqual(res.content, serializer_res.content)
+
+        # NOTE Serializers with fields that can't be read from `.values()`
+        # rows are used as usual.
+        class MethodUserSerializer(UserSerializer):
+            method = serializers.SerializerMethodField()
+
+            def get_method(self, obj):
+                return obj.username
+
+        self.assertIsNone(MethodUserSerializer.read_values(User.objects.all()))
+
+    def test_retrieve_user_not_modified(self):
+        """The user isn't sent again if its `ETag` didn't change
+        """
+
+        self.user = self.create_user()
+        self.authenticate()
+
+        res = self.api_retrieve()
+        etag = res['ETag']
+        self.assertEqual(etag, User.objects.get(pk=self.user.pk).etag)
+
+        # NOTE Only the version of the user is fetched
+        with self.assertNumQueries(1):
+            res = self.api_retrieve(headers={'If-None-Match': etag})
+        self.assertEqual(res.status_code, status.HTTP_304_NOT_MODIFIED)
+        self.assertEqual(res['ETag'], etag)
+        self.assertFalse(res.content)
+
+        # NOTE Changes to the user, its profile or its emails change the ETag
+        etags = {etag}
+        changes = [
+            lambda: self.api_patch(self.retrieve_view,
+                                   data={'username': 'new_valid_username'}),
+            lambda: User.objects.get(pk=self.user.pk).profile.save(),
+            lambda: Email.objects.create(user=self.user,
+                                         address='another.email@test.com'),
+            lambda: Email.objects.get(address='another.email@test.com').confirm(),
+            lambda: Email.objects.get(address='another.email@test.com').delete(),
+        ]
+        for change in changes:
+            change()
+            res = self.api_retrieve(headers={'If-None-Match': etag})
+            self.assertEqual(res.status_code, status.HTTP_200_OK)
+            self.assertNotIn(res['ETag'], etags)
+            etag = res['ETag']
+            etags.add(etag)
+
+    def test_retrieve_user_query_count(self):
+        """Retrieving the user runs a fixed number of queries
+        """
+
+        self.user = self.create_user()
+        self.authenticate()
+
+        # NOTE The version of the user is read first (see `USER_DATA_CACHE`).
+        # Then, the user is loaded along with its profile, and all its emails
+        # are prefetched with another query (see `UserSerializer`).
+        with self.assertNumQueries(3):
+            res = self.api_retrieve()
+        self.assertEqual(len(res.data['emails']), 1)
+
+        with self.assertNumQueries(1):
+            res = self.api_retrieve()
+        self.assertEqual(len(res.data['emails']), 1)
+
+        for i in range(3):
+            Email.objects.create(user=self.user,
+                                 address=f'another.email.{i}@test.com')
+
+        with self.assertNumQueries(3):
+            res = self.api_retrieve()
+        self.assertEqual(len(res.data['emails']), 4)
+
+        with override_settings(USER_DATA_CACHE={'USE_CACHE': False}):
+            with self.assertNumQueries(2):
+                res = self.api_retrieve()
+        self.assertEqual(len(res.data['emails']), 4)
+
+    def test_retrieve_user_cache_invalidation(self):
+        """The cached user is invalidated by every change to the user
+        """
+
+        self.user = self.create_user(given_name='Ramon')
+        self.authenticate()
+        old_email = self.user.primary_email
+        another_email = Email.objects.create(user=self.user,
+                                             address='another.email@test.com')
+        another_email.confirm()
+
+        def assert_cached(**expected):
+            res = self.api_retrieve()
+            self.assertEqual(res.status_code, status.HTTP_200_OK)
+            for key, value in expected.items():
+                self.assertEqual(res.data[key], value)
+
+            with self.assertNumQueries(1):
+                cached_res = self.api_retrieve()
+            self.assertEqual(cached_res.content, res.content)
+            self.assertEqual(cached_res['ETag'], res['ETag'])
+            return res
+
+        assert_cached(given_name='Ramon')
+
+        self.api_patch(self.retrieve_view, data={'given_name': 'Kayo'})
+        assert_cached(given_name='Kayo')
+
+        # NOTE Switching the primary email doesn't send any signals
+        res = self.api_patch('core:email-update-destroy',
+                             url_args=[another_email.pk],
+                             data={'is_primary': True})
+        self.assertEqual(res.status_code, status.HTTP_200_OK)
+        assert_cached(email='another.email@test.com')
+
+        res = self.api_delete('core:email-update-destroy',
+                              url_args=[old_email.pk])
+        self.assertEqual(res.status_code, status.HTTP_204_NO_CONTENT)
+        res = assert_cached()
+        self.assertEqual([e['address'] for e in res.data['emails']],
+                         ['another.email@test.com'])
+
+        # NOTE The password reset doesn't change the representation of the
+        # user, but the cached one is invalidated anyway
+        user = User.objects.get(pk=self.user.pk)
+        user.generate_reset_token(save=True)
+        self.assertIsNone(get_cached_user_data(user.pk, user.version))
+        assert_cached()
+
+        version = User.objects.get(pk=user.pk).version
+        res = self.api_post('core:password-reset',
+                            data={'user_id': user.pk,
+                                  'reset_token': user.reset_token,
+                                  'password_1': 'NEW#pass!123',
+                                  'password_2': 'NEW#pass!123'})
+        self.assertEqual(res.status_code, status.HTTP_200_OK)
+        self.assertIsNone(get_cached_user_data(user.pk, version))
+        self.assertNotEqual(User.objects.get(pk=user.pk).version, version)
+
 
 class UserUpdateAPITests(UserTestMixin,
                          APITestMixin,
@@ -144,6 +363,29 @@ class UserUpdateAPITests(UserTestMixin,
         self.assertEqual(self.user.profile.given_name, 'Ramon')
         self.assertEqual(self.user.profile.family_name, 'Kayo')
 
+    def test_update_user_if_match(self):
+        """The user is only updated if it didn't change since retrieved
+        """
+
+        self.user = self.create_user(username='valid_username')
+        self.authenticate()
+
+        etag = self.api_get('core:user-retrieve-update')['ETag']
+        res = self.api_partial_update(data={'username': 'new_valid_username'},
+                                      headers={'If-Match': etag})
+
+        self.assertEqual(res.status_code, status.HTTP_200_OK)
+        self.assertNotEqual(res['ETag'], etag)
+        self.assertEqual(res['ETag'], User.objects.get(pk=self.user.pk).etag)
+
+        # NOTE The ETag is stale now
+        res = self.api_partial_update(data={'username': 'stale_username'},
+                                      headers={'If-Match': etag})
+
+        self.assertEqual(res.status_code, status.HTTP_412_PRECONDITION_FAILED)
+        self.user.refresh_from_db()
+        self.assertEqual(self.user.username, 'new_valid_username')
+
     def test_update_user_password_directly(self):
         """It's impossible to update user password directly
         """
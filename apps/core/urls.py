@@ -3,6 +3,7 @@ from django.urls import path
 from .views import (
     TokenObtainAPIView,
     TokenRefreshAPIView,
+    TokenRevocationAPIView,
     TokenVerifyAPIView,
     EmailConfirmationAPIView,
     EmailConfirmationRequestAPIView,
@@ -49,6 +50,10 @@ urlpatterns = [
          TokenRefreshAPIView.as_view(),
          name='token-refresh'),
 
+    path('token/revocation/',
+         TokenRevocationAPIView.as_view(),
+         name='token-revoke'),
+
     path('token/verification/',
          TokenVerifyAPIView.as_view(),
          name='token-verify'),
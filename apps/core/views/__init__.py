@@ -1,6 +1,7 @@
 from .auth import (
     TokenObtainAPIView,
     TokenRefreshAPIView,
+    TokenRevocationAPIView,
     TokenVerifyAPIView,
 )
 from .email import (
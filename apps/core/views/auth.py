@@ -4,7 +4,13 @@ from drf_spectacular.utils import (
     extend_schema_view,
     inline_serializer,
 )
-from rest_framework import serializers
+from rest_framework import (
+    permissions,
+    response,
+    serializers,
+    status,
+    views,
+)
 from rest_framework_simplejwt.views import (
     TokenObtainPairView,
     TokenRefreshView,
@@ -61,3 +67,23 @@ class TokenRefreshAPIView(TokenRefreshView):
 class TokenVerifyAPIView(TokenVerifyView):
     """Verify whether an access or refresh token is valid or not.
     """
+
+
+@extend_schema(tags=['Token', ])
+@extend_schema_view(
+    post=extend_schema(
+        request=None,
+        responses={
+            204: OpenApiTypes.NONE,
+        },
+    ),
+)
+class TokenRevocationAPIView(views.APIView):
+    """Revoke all the access and refresh tokens of the authenticated user.
+    """
+
+    permission_classes = [permissions.IsAuthenticated, ]
+
+    def post(self, request, *args, **kwargs):
+        request.user.revoke_tokens(save=True)
+        return response.Response(status=status.HTTP_204_NO_CONTENT)
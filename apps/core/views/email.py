@@ -1,3 +1,5 @@
+from django.db import transaction
+from django.db.models import F
 from django.http import Http404
 from django.utils.translation import gettext_lazy as _
 from drf_spectacular.utils import (
@@ -5,6 +7,7 @@ from drf_spectacular.utils import (
     inline_serializer,
 )
 from rest_framework import (
+    exceptions,
     generics,
     permissions,
     response,
@@ -12,7 +15,17 @@ from rest_framework import (
     status,
 )
 
-from ..models import Email
+from utils.auth import invalidate_auth_user_cache
+
+from ..cache import invalidate_user_data_cache
+from ..outbox import (
+    enqueue_verification_email,
+    is_verification_email_queued,
+)
+from ..models import (
+    Email,
+    User,
+)
 from ..serializers import EmailSerializer
 
 
@@ -74,14 +87,20 @@ class EmailConfirmationRequestAPIView(generics.GenericAPIView):
         if not self.request.user or self.request.user.is_anonymous:
             return Email.objects.none()
 
-        return Email.objects.filter(user=self.request.user)
+        # NOTE The emails share the user instance (see `Email.is_primary`)
+        return self.request.user.emails.all()
 
     @extend_schema(
         request=None,
-        responses={202: None},
+        responses={202: None, 429: None},
     )
     def post(self, request, *args, **kwargs):
         """Requests a new confirmation link for an email.
+
+        A new link can be requested once per `RESEND_COOLDOWN` (see
+        `EMAIL_CONFIRMATION`). While a verification email is still queued,
+        the requests are coalesced into it; otherwise, the requests within
+        the cooldown are throttled.
         """
 
         email = self.get_object()
@@ -91,9 +110,23 @@ class EmailConfirmationRequestAPIView(generics.GenericAPIView):
             return response.Response({'non_field_errors': error_msg},
                                      status.HTTP_400_BAD_REQUEST)
 
-        email.regenerate_confirmation_code(save=True)
-        verification_email_msg = email.get_verification_email_message()
-        verification_email_msg.send()
+        wait = email.get_resend_wait()
+
+        # NOTE The queued email is built when it's sent, with the current code,
+        # so it's reused (e.g. while it's retried) instead of queuing another.
+        # After the cooldown, the code is still regenerated.
+        if is_verification_email_queued(email):
+            if not wait:
+                email.regenerate_confirmation_code(save=True)
+
+            return response.Response(status=status.HTTP_202_ACCEPTED)
+
+        if wait:
+            raise exceptions.Throttled(wait=wait)
+
+        with transaction.atomic():
+            email.regenerate_confirmation_code(save=True)
+            enqueue_verification_email(email)
 
         return response.Response(status=status.HTTP_202_ACCEPTED)
 
@@ -113,9 +146,9 @@ class EmailCreateAPIView(generics.CreateAPIView):
         return EmailSerializer
 
     def perform_create(self, serializer):
-        email = serializer.save(user=self.request.user)
-        verification_email_msg = email.get_verification_email_message()
-        verification_email_msg.send()
+        with transaction.atomic():
+            email = serializer.save(user=self.request.user)
+            enqueue_verification_email(email)
 
 
 @extend_schema(tags=['Users', ])
@@ -125,7 +158,8 @@ class EmailUpdateDestroyAPIView(generics.GenericAPIView):
         if not self.request.user or self.request.user.is_anonymous:
             return Email.objects.none()
 
-        return Email.objects.filter(user=self.request.user)
+        # NOTE The emails share the user instance (see `Email.is_primary`)
+        return self.request.user.emails.all()
 
     def get_serializer_class(self):
         return EmailSerializer
@@ -162,9 +196,21 @@ class EmailUpdateDestroyAPIView(generics.GenericAPIView):
             return response.Response({'non_field_errors': error_msg},
                                      status.HTTP_400_BAD_REQUEST)
 
+        # NOTE A single `UPDATE` switches the primary email (and bumps the
+        # version, the same way `User.save` does). As no signals are sent, the
+        # cached data and the cached authenticated user are invalidated here.
         user = email.user
+        User.objects.filter(pk=user.pk).update(
+            email=email.address,
+            primary_email=email,
+            version=F('version') + 1,
+        )
         user.email = email.address
-        user.save()
+        user.primary_email = email
+        user.version += 1
+        user._reset_dirty_fields(['email', 'primary_email', 'version'])
+        invalidate_user_data_cache(user.pk)
+        invalidate_auth_user_cache(user.pk)
 
         data = self.get_serializer(email).data
 
@@ -1,6 +1,9 @@
 from django.core.exceptions import ValidationError
+from django.db import transaction
+from django.db.models import F
 from django.http import Http404
 from django.shortcuts import get_object_or_404
+from django.utils.http import parse_etags
 from django.utils.translation import gettext_lazy as _
 from drf_spectacular.utils import (
     extend_schema,
@@ -15,7 +18,16 @@ from rest_framework import (
     views,
 )
 
+from ..cache import (
+    get_cached_user_data,
+    is_user_data_cache_enabled,
+    set_cached_user_data,
+)
 from ..models import User
+from ..outbox import (
+    enqueue_password_recovery_email,
+    enqueue_verification_email,
+)
 from ..serializers import UserSerializer
 
 
@@ -47,10 +59,9 @@ class PasswordRecoveryAPIView(views.APIView):
         if not user:
             return response.Response(status=status.HTTP_202_ACCEPTED)
 
-        user.generate_reset_token(overwrite=False, save=True)
-
-        recovery_email_msg = user.get_password_recovery_email_message()
-        recovery_email_msg.send()
+        with transaction.atomic():
+            user.generate_reset_token(overwrite=False, save=True)
+            enqueue_password_recovery_email(user)
 
         return response.Response(status=status.HTTP_202_ACCEPTED)
 
@@ -98,9 +109,12 @@ class PasswordResetAPIView(views.APIView):
         serializer = UserSerializer(
             user, data=data, partial=True)
         serializer.is_valid(raise_exception=True)
-        serializer.save()
 
-        user.clear_reset_token(save=True)
+        # NOTE The token is cleared, and the tokens of the user revoked,
+        # along with the password update
+        user.clear_reset_token()
+        user.revoke_tokens()
+        serializer.save()
 
         return response.Response(serializer.data, status=status.HTTP_200_OK)
 
@@ -117,10 +131,11 @@ class UserCreateAPIView(generics.CreateAPIView):
         return UserSerializer
 
     def perform_create(self, serializer):
-        user = serializer.save()
-        email = user.primary_email
-        verification_email_msg = email.get_verification_email_message()
-        verification_email_msg.send()
+        # NOTE The user and its verification email (see `core.outbox`) are
+        # committed together, so no user is left without it.
+        with transaction.atomic():
+            user = serializer.save()
+            enqueue_verification_email(user.primary_email)
 
 
 @extend_schema(tags=['Users', ])
@@ -128,11 +143,16 @@ class UserRetrieveUpdateAPIView(generics.GenericAPIView):
     """Retrieves and updates the authenticated user.
     """
 
+    # NOTE Whether to build the GET response straight from `.values()` rows
+    # (see `ValuesReadMixin`), instead of serializing the user instance.
+    values_read = True
+
     def get_serializer_class(self):
         return UserSerializer
 
     def get_queryset(self):
-        return User.objects.filter(pk=self.request.user.pk)
+        queryset = User.objects.filter(pk=self.request.user.pk)
+        return self.get_serializer_class().setup_eager_loading(queryset)
 
     def get_object(self):
         queryset = self.filter_queryset(self.get_queryset())
@@ -143,16 +163,97 @@ class UserRetrieveUpdateAPIView(generics.GenericAPIView):
         except (TypeError, ValueError, ValidationError):
             raise Http404
 
+    def claim_version(self, instance, if_match):
+        """Checks the `If-Match` header against the version of the user.
+
+        The check is a conditional `UPDATE` (that changes nothing), so it
+        must run in the same transaction as the update of the user: the row
+        stays locked until the transaction ends, and concurrent requests
+        with the same version fail the check once it's bumped.
+
+        Args:
+            instance (User): The user to be updated.
+            if_match (str): The `If-Match` header.
+
+        Returns:
+            bool: Whether the header matches the version of the user.
+        """
+
+        etags = parse_etags(if_match)
+        if '*' in etags:
+            return True
+
+        versions = []
+        for etag in etags:
+            # NOTE Weak entity tags never match `If-Match`
+            pk, _, version = etag.strip('"').rpartition('-')
+            if pk == str(instance.pk) and version.isdigit():
+                versions.append(int(version))
+
+        if not versions:
+            return False
+
+        queryset = User.objects.filter(pk=instance.pk, version__in=versions)
+        return queryset.update(version=F('version')) > 0
+
     def get(self, request, *args, **kwargs):
         """Retrieves the authenticated user.
+
+        The response has the `ETag` of the user (see `User.version`), and
+        it's `304 Not Modified` (without body) if it matches the
+        `If-None-Match` header.
+
+        If the `USER_DATA_CACHE` is enabled, the representation of the user
+        is cached for its current version, so only the version is read while
+        the user doesn't change (see `get_cached_user_data`).
         """
 
-        instance = self.get_queryset().first()
-        serializer = self.get_serializer(instance)
-        return response.Response(serializer.data)
+        queryset = self.get_queryset()
+        use_cache = is_user_data_cache_enabled()
+
+        version = None
+        if_none_match = request.headers.get('If-None-Match')
+        if if_none_match or use_cache:
+            version = queryset.values_list('version', flat=True).first()
+
+        if if_none_match:
+            etag = User.get_etag(request.user.pk, version)
+            etags = [e.removeprefix('W/') for e in parse_etags(if_none_match)]
+            if version is not None and ('*' in etags or etag in etags):
+                return response.Response(status=status.HTTP_304_NOT_MODIFIED,
+                                         headers={'ETag': etag})
+
+        if use_cache and version is not None:
+            data = get_cached_user_data(request.user.pk, version)
+            if data is not None:
+                etag = User.get_etag(request.user.pk, version)
+                return response.Response(data, headers={'ETag': etag})
+
+        if self.values_read:
+            serializer_class = self.get_serializer_class()
+            rows, data = serializer_class.read_rows(queryset, ('version',))
+            if data:
+                version, data = rows[0]['version'], data[0]
+
+        else:
+            data = None
+
+        if data is None:
+            instance = queryset.first()
+            version, data = instance.version, self.get_serializer(instance).data
+
+        if use_cache:
+            set_cached_user_data(request.user.pk, version, data)
+
+        etag = User.get_etag(request.user.pk, version)
+        return response.Response(data, headers={'ETag': etag})
 
     def patch(self, request, *args, **kwargs):
         """Updates the authenticated user.
+
+        If the `If-Match` header is sent, the user is only updated if it
+        matches the `ETag` of the user (see `claim_version`). Otherwise, the
+        response is `412 Precondition Failed`.
         """
 
         instance = self.get_object()
@@ -161,9 +262,24 @@ class UserRetrieveUpdateAPIView(generics.GenericAPIView):
         serializer = self.get_serializer(
             instance, data=request.data, partial=True)
         serializer.is_valid(raise_exception=True)
-        serializer.save()
 
-        if getattr(instance, '_prefetched_objects_cache', None):
-            instance._prefetched_objects_cache = {}
+        if_match = request.headers.get('If-Match')
+        if if_match:
+            with transaction.atomic():
+                if not self.claim_version(instance, if_match):
+                    error_msg = _('The user has changed since it was '
+                                  'retrieved.')
+                    return response.Response(
+                        {'non_field_errors': error_msg},
+                        status.HTTP_412_PRECONDITION_FAILED)
+
+                serializer.save()
+
+        else:
+            serializer.save()
+
+        # NOTE The prefetched emails are kept: `UserSerializer` doesn't change
+        # them (they're read only), so they are still up to date.
 
-        return response.Response(serializer.data)
+        return response.Response(serializer.data,
+                                 headers={'ETag': instance.etag})
@@ -0,0 +1,53 @@
+"""
+Bootstraps Django for the benchmark scripts, the same way the notebooks do.
+
+Import it before anything else from Django or the project:
+
+    from bootstrap import test_database
+"""
+
+import os
+import sys
+import tempfile
+from contextlib import contextmanager
+
+import django
+
+PROJECTPATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..')
+sys.path.insert(0, PROJECTPATH)
+os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'config.settings')
+os.chdir(PROJECTPATH)
+django.setup()
+
+
+@contextmanager
+def test_database():
+    """Runs the benchmark against a throwaway test database.
+
+    SQLite test databases are kept in memory by default, where a connection
+    can't be shared by many threads, so a temporary file is used instead.
+    """
+
+    from django.conf import settings
+    from django.db import connection
+    from django.test.utils import (
+        setup_test_environment,
+        teardown_test_environment,
+    )
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        if connection.vendor == 'sqlite':
+            test_settings = settings.DATABASES['default'].setdefault('TEST', {})
+            test_settings['NAME'] = os.path.join(tmp_dir, 'benchmark.sqlite3')
+            settings.DATABASES['default'].setdefault('OPTIONS', {})
+            settings.DATABASES['default']['OPTIONS']['timeout'] = 30
+
+        setup_test_environment()
+        old_name = connection.creation.create_test_db(verbosity=0,
+                                                      autoclobber=True)
+        try:
+            yield
+
+        finally:
+            connection.creation.destroy_test_db(old_name, verbosity=0)
+            teardown_test_environment()
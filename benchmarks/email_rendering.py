@@ -0,0 +1,91 @@
+"""
+EMAIL RENDERING BENCHMARK
+
+Measures how many verification and password recovery emails are rendered
+per second (`VerificationEmailMessage` and `PasswordRecoveryEmailMessage`
+instantiated, which renders both bodies, and printed, as in development),
+with the copy of each message built once (`CustomEmailMessage.get_copy`) and
+with the copy built again for each body and `print` ("default").
+
+The templates of the bodies are compiled once by Django's cached template
+loader, so they're warmed up before measuring. Each language in `--languages`
+is measured separately.
+
+Usage:
+    python benchmarks/email_rendering.py [--messages 5000]
+        [--languages en-us pt-br]
+"""
+
+import argparse
+import io
+import time
+import uuid
+from contextlib import (
+    contextmanager,
+    redirect_stdout,
+)
+from unittest import mock
+
+from bootstrap import test_database  # noqa: F401 (sets Django up)
+
+from django.utils import translation
+
+from apps.core.mail import CustomEmailMessage
+from apps.core.models import (
+    Email,
+    User,
+)
+
+
+@contextmanager
+def default_path():
+    """Makes the messages build their copy for every body (and `print`).
+    """
+
+    def get_copy(self):
+        return self.get_body_copy()
+
+    with mock.patch.object(CustomEmailMessage, 'get_copy', get_copy):
+        yield
+
+
+def render(build_message, count):
+    start = time.perf_counter()
+    with redirect_stdout(io.StringIO()):
+        for _ in range(count):
+            build_message().print()
+
+    return count / (time.perf_counter() - start)
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--messages', type=int, default=5000)
+    parser.add_argument('--languages', nargs='+', default=['en-us', 'pt-br'])
+    args = parser.parse_args()
+
+    # NOTE The messages are built from unsaved instances (no queries)
+    user = User(email='john@example.com', reset_token=uuid.uuid4())
+    email = Email(address=user.email, user=user)
+
+    messages = [
+        ('verification', email.get_verification_email_message),
+        ('recovery', user.get_password_recovery_email_message),
+    ]
+
+    for language in args.languages:
+        with translation.override(language):
+            for name, build_message in messages:
+                # NOTE Warms the template loader up
+                build_message()
+
+                with default_path():
+                    before = render(build_message, args.messages)
+                after = render(build_message, args.messages)
+
+                print(f'{language:<6} {name:<13} default {before:.0f} msgs/s, '
+                      f'cached copy {after:.0f} msgs/s, {after / before:.2f}x')
+
+
+if __name__ == '__main__':
+    main()
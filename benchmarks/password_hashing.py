@@ -0,0 +1,95 @@
+"""
+PASSWORD HASHING BENCHMARK
+
+Simulates a login storm on a single worker: as many threads as `--threads`
+(the worker's request threads) checking passwords with `User.check_password`
+(what `TokenObtainAPIView` does), with the configured `PASSWORD_HASHERS`. It
+reports the logins per second of the worker when hashing:
+
+- "sync": in the request threads (the default);
+- "thread": in a thread pool of `--pool-size` threads;
+- "process": in a process pool of `--pool-size` processes.
+
+It also reports how long a request that doesn't hash anything waits to run
+a bit of Python code during the storm ("latency"), that is, how much the
+hashing slows the other requests of the worker down.
+
+Usage:
+    python benchmarks/password_hashing.py [--logins 24] [--threads 8]
+        [--pool-size 2]
+"""
+
+import argparse
+import os
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from bootstrap import test_database  # noqa: F401 (sets Django up)
+
+from django.test.utils import override_settings
+
+from apps.core.models import User
+from utils.hashers import shutdown_hashing_executor
+
+
+def measure_latency(stop):
+    latencies = []
+    while not stop.is_set():
+        start = time.perf_counter()
+        sum(range(10000))
+        latencies.append(time.perf_counter() - start)
+        time.sleep(0.01)
+
+    return max(latencies, default=0) * 1000
+
+
+def run(user, password, logins, threads):
+    stop = threading.Event()
+    with ThreadPoolExecutor(max_workers=1) as latency_executor:
+        latency = latency_executor.submit(measure_latency, stop)
+
+        start = time.perf_counter()
+        with ThreadPoolExecutor(max_workers=threads) as executor:
+            results = list(executor.map(
+                lambda _: user.check_password(password), range(logins)))
+        duration = time.perf_counter() - start
+
+        stop.set()
+        assert all(results)
+        return duration, latency.result()
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--logins', type=int, default=24)
+    parser.add_argument('--threads', type=int, default=8)
+    parser.add_argument('--pool-size', type=int, default=2)
+    args = parser.parse_args()
+
+    password = 'VALID#pass!123'
+    user = User(email='john@example.com')
+    user.set_password(password)
+
+    print(f'{os.cpu_count()} CPUs, {args.logins} logins, '
+          f'{args.threads} request threads, pool size {args.pool_size}')
+
+    for pool in [None, 'thread', 'process']:
+        config = {
+            'USE_EXECUTOR': pool is not None,
+            'POOL': pool,
+            'MAX_WORKERS': args.pool_size,
+        }
+        with override_settings(PASSWORD_HASHING_EXECUTOR=config):
+            # NOTE Warms the pool up (e.g. the processes set Django up)
+            user.check_password(password)
+
+            duration, latency = run(user, password, args.logins, args.threads)
+            shutdown_hashing_executor()
+
+        print(f'{pool or "sync":<8} {args.logins / duration:.2f} logins/s '
+              f'({duration:.2f}s), max latency {latency:.1f}ms')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,84 @@
+"""
+USER HYDRATION BENCHMARK
+
+Measures the cost of instantiating `User` objects from database rows, with
+the default path (`Model.from_db`, which goes through `User.__init__` and
+`User.__setattr__`) and with the `User.from_db` fast path:
+
+- "from_db": only the instantiation, from the same row repeated many times;
+- "queryset": iterating over a queryset of that many users (fetching the
+  rows included).
+
+Usage:
+    python benchmarks/user_hydration.py [--rows 100000]
+"""
+
+import argparse
+import time
+from contextlib import contextmanager
+from unittest import mock
+
+from bootstrap import test_database
+
+from django.db import connection
+
+from apps.core.models import User
+from utils.models.mixins import DirtyFieldsMixin
+
+
+@contextmanager
+def default_path():
+    """Makes `User.from_db` use the default (pre fast path) implementation.
+    """
+
+    def from_db(cls, db, field_names, values):
+        return super(DirtyFieldsMixin, cls).from_db(db, field_names, values)
+
+    with mock.patch.object(User, 'from_db', classmethod(from_db)):
+        yield
+
+
+def timeit(func):
+    start = time.perf_counter()
+    func()
+    return time.perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--rows', type=int, default=100000)
+    args = parser.parse_args()
+
+    with test_database():
+        # NOTE `bulk_create` skips the signals (no profiles, emails etc.)
+        User.objects.bulk_create([
+            User(email=f'user.{i}@example.com', username=f'user_{i}')
+            for i in range(args.rows)
+        ], batch_size=5000)
+
+        field_names = tuple(f.attname for f in User._meta.concrete_fields)
+        values = User.objects.values_list(*field_names).first()
+
+        alias = connection.alias
+
+        def hydrate():
+            for _ in range(args.rows):
+                User.from_db(alias, field_names, values)
+
+        def iterate():
+            for _ in User.objects.all().iterator(chunk_size=5000):
+                pass
+
+        for name, func in [('from_db', hydrate), ('queryset', iterate)]:
+            with default_path():
+                before = timeit(func)
+            after = timeit(func)
+
+            print(f'{name:<9} {args.rows} rows: '
+                  f'default {before:.3f}s ({before / args.rows * 1e6:.2f}us/row), '
+                  f'fast path {after:.3f}s ({after / args.rows * 1e6:.2f}us/row), '
+                  f'{before / after:.1f}x')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,128 @@
+"""
+USER SERIALIZER BENCHMARK
+
+Measures `UserSerializer` with its fields built for every serializer instance
+(the default `get_fields` path) and with the fields built once per class and
+copied (`UserSerializer.get_fields`):
+
+- "instantiation": instantiating a serializer and binding its fields, once
+  per user (as each request does);
+- "data": serializing all the users at once (`many=True`);
+- "data (each)": serializing the users one by one.
+
+It also compares the GET `/api/users/me/` read ("me"), fetching and
+serializing each user with its profile and emails, against building the same
+representation from `.values()` rows (`UserSerializer.read_values`).
+
+Usage:
+    python benchmarks/user_serializer.py [--users 10000]
+"""
+
+import argparse
+import time
+from contextlib import contextmanager
+from unittest import mock
+
+from bootstrap import test_database
+
+from apps.core.models import (
+    Email,
+    Profile,
+    User,
+)
+from apps.core.serializers import UserSerializer
+
+
+@contextmanager
+def default_path():
+    """Makes `UserSerializer` build its fields for every instance.
+    """
+
+    def get_fields(self):
+        return self._build_fields()
+
+    with mock.patch.object(UserSerializer, 'get_fields', get_fields):
+        yield
+
+
+def timeit(func):
+    start = time.perf_counter()
+    func()
+    return time.perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--users', type=int, default=10000)
+    args = parser.parse_args()
+
+    with test_database():
+        # NOTE `bulk_create` skips the signals (no profiles, emails etc.)
+        users = User.objects.bulk_create([
+            User(email=f'user.{i}@example.com', username=f'user_{i}')
+            for i in range(args.users)
+        ], batch_size=5000)
+        Profile.objects.bulk_create([
+            Profile(user=user, given_name='John', family_name=f'Doe {i}')
+            for i, user in enumerate(users)
+        ], batch_size=5000)
+        Email.objects.bulk_create([
+            Email(user=user, address=user.email) for user in users
+        ], batch_size=5000)
+
+        users = list(UserSerializer.setup_eager_loading(User.objects.all()))
+
+        def instantiate():
+            for user in users:
+                UserSerializer(user).fields
+
+        def serialize():
+            UserSerializer(users, many=True).data
+
+        def serialize_each():
+            for user in users:
+                UserSerializer(user).data
+
+        with default_path():
+            expected = UserSerializer(users, many=True).data
+        assert UserSerializer(users, many=True).data == expected
+
+        for name, func in [('instantiation', instantiate),
+                           ('data', serialize),
+                           ('data (each)', serialize_each)]:
+            with default_path():
+                before = timeit(func)
+            after = timeit(func)
+
+            print(f'{name:<13} {len(users)} users: '
+                  f'default {before:.3f}s ({before / len(users) * 1e6:.1f}us/user), '
+                  f'compiled {after:.3f}s ({after / len(users) * 1e6:.1f}us/user), '
+                  f'{before / after:.1f}x')
+
+        pks = [user.pk for user in users]
+
+        def queryset(pk):
+            return UserSerializer.setup_eager_loading(
+                User.objects.filter(pk=pk))
+
+        def read_serializer():
+            for pk in pks:
+                UserSerializer(queryset(pk).first()).data
+
+        def read_values():
+            for pk in pks:
+                UserSerializer.read_values(queryset(pk))[0]
+
+        assert ([UserSerializer.read_values(queryset(pk))[0] for pk in pks[:100]]
+                == [UserSerializer(queryset(pk).first()).data for pk in pks[:100]])
+
+        before = timeit(read_serializer)
+        after = timeit(read_values)
+        print(f'{"me":<13} {len(pks)} users: '
+              f'serializer {before:.3f}s ({before / len(pks) * 1e6:.1f}us/user), '
+              f'values {after:.3f}s ({after / len(pks) * 1e6:.1f}us/user), '
+              f'{before / after:.1f}x')
+
+
+if __name__ == '__main__':
+    main()
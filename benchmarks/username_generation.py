@@ -0,0 +1,82 @@
+"""
+USERNAME GENERATION BENCHMARK
+
+Many simultaneous signups sharing the same email local part (`john@...`), as
+many threads as `--workers`, each one with its own database connection. For
+each signup, it reports the queries run by `UserManager.create_user` (the
+whole signup: username, user, profile, permissions and email).
+
+NOTE SQLite allows a single writer at a time and fails with "database is
+locked" when a transaction that started reading needs to write while another
+one is writing. Those errors are retried here (and reported), as they are an
+SQLite limitation, unrelated to the username generation.
+
+Usage:
+    python benchmarks/username_generation.py [--signups 200] [--workers 8]
+"""
+
+import argparse
+import statistics
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from bootstrap import test_database
+
+from django.db import (
+    IntegrityError,
+    OperationalError,
+    connection,
+)
+from django.test.utils import CaptureQueriesContext
+
+from apps.core.models import User
+
+
+def signup(i):
+    lock_retries = 0
+    try:
+        while True:
+            try:
+                with CaptureQueriesContext(connection) as ctx:
+                    user = User.objects.create_user(
+                        email=f'john@example{i}.com')
+
+                return user.username, len(ctx.captured_queries), lock_retries
+
+            except OperationalError:
+                lock_retries += 1
+
+            except IntegrityError:
+                return None, None, lock_retries
+
+    finally:
+        connection.close()
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--signups', type=int, default=200)
+    parser.add_argument('--workers', type=int, default=8)
+    args = parser.parse_args()
+
+    with test_database():
+        start = time.perf_counter()
+        with ThreadPoolExecutor(max_workers=args.workers) as executor:
+            results = list(executor.map(signup, range(args.signups)))
+        elapsed = time.perf_counter() - start
+
+        usernames = [username for username, _, _ in results if username]
+        queries = [count for _, count, _ in results if count]
+        lock_retries = sum(retries for _, _, retries in results)
+
+        print(f'signups:             {args.signups} ({args.workers} workers)')
+        print(f'failed:              {args.signups - len(usernames)}')
+        print(f'unique usernames:    {len(set(usernames))}')
+        print(f'queries/signup:      min {min(queries)}, '
+              f'median {statistics.median(queries)}, max {max(queries)}')
+        print(f'sqlite lock retries: {lock_retries}')
+        print(f'elapsed:             {elapsed:.2f}s')
+
+
+if __name__ == '__main__':
+    main()
@@ -4,6 +4,7 @@ from .django_apps import *
 from .django_templates import *
 from .django_middleware import *
 from .django_db import *
+from .django_cache import *
 from .django_auth import *
 from .django_static import *
 from .django_email import *
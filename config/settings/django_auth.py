@@ -31,14 +31,62 @@ AUTH_PASSWORD_VALIDATORS = [
     },
 ]
 
+# ---------------------------------------------------------------------------- #
+# https://docs.djangoproject.com/en/dev/ref/settings/#password-hashers
+
+PASSWORD_HASHERS = [
+    'utils.hashers.TunedPBKDF2PasswordHasher',
+    'django.contrib.auth.hashers.PBKDF2SHA1PasswordHasher',
+    'utils.hashers.TunedArgon2PasswordHasher',
+    'django.contrib.auth.hashers.BCryptSHA256PasswordHasher',
+    'django.contrib.auth.hashers.ScryptPasswordHasher',
+]
+
+# ---------------------------------------------------------------------------- #
+# https://github.com/ramonkcom/drf-launchpad/blob/main/docs/custom-settings-and-flags.md#password_hashers_params
+
+PASSWORD_HASHERS_PARAMS = {
+    'PBKDF2_ITERATIONS': None,
+    'ARGON2_TIME_COST': None,
+    'ARGON2_MEMORY_COST': None,
+    'ARGON2_PARALLELISM': None,
+}
+
+# ---------------------------------------------------------------------------- #
+# https://github.com/ramonkcom/drf-launchpad/blob/main/docs/custom-settings-and-flags.md#password_hashing_executor
+
+PASSWORD_HASHING_EXECUTOR = {
+    'USE_EXECUTOR': False,
+    'POOL': 'thread',
+    'MAX_WORKERS': None,
+}
+
 # ---------------------------------------------------------------------------- #
 # https://docs.djangoproject.com/en/dev/ref/settings/#authentication-backends
 
 AUTHENTICATION_BACKENDS = (
-    'django.contrib.auth.backends.ModelBackend',
-    'guardian.backends.ObjectPermissionBackend',
+    'utils.permissions.CachedModelBackend',
+    'utils.permissions.CachedObjectPermissionBackend',
 )
 
+# ---------------------------------------------------------------------------- #
+# https://github.com/ramonkcom/drf-launchpad/blob/main/docs/custom-settings-and-flags.md#permissions_cache
+
+PERMISSIONS_CACHE = {
+    'USE_CACHE': False,
+    'CACHE_ALIAS': 'default',
+    'TIMEOUT': 60 * 5,
+}
+
+# ---------------------------------------------------------------------------- #
+# https://github.com/ramonkcom/drf-launchpad/blob/main/docs/custom-settings-and-flags.md#auth_user_cache
+
+AUTH_USER_CACHE = {
+    'USE_CACHE': False,
+    'CACHE_ALIAS': 'default',
+    'TIMEOUT': 60,
+}
+
 # ---------------------------------------------------------------------------- #
 # https://github.com/ramonkcom/drf-launchpad/blob/main/docs/custom-settings-and-flags.md#password_recovery
 
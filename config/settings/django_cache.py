@@ -0,0 +1,29 @@
+"""
+CACHE SETTINGS
+
+About Django's cache framework:
+- https://docs.djangoproject.com/en/dev/topics/cache/
+
+Full list of Django settings:
+- https://docs.djangoproject.com/en/dev/ref/settings/
+"""
+
+# ---------------------------------------------------------------------------- #
+# https://docs.djangoproject.com/en/dev/ref/settings/#caches
+
+CACHES = {
+    'default': {
+        'BACKEND': 'django.core.cache.backends.locmem.LocMemCache',
+    }
+}
+
+# ---------------------------------------------------------------------------- #
+# https://github.com/ramonkcom/drf-launchpad/blob/main/docs/custom-settings-and-flags.md#user_data_cache
+
+USER_DATA_CACHE = {
+    'USE_CACHE': True,
+    'CACHE_ALIAS': 'default',
+    'TIMEOUT': 60 * 5,
+}
+
+# ---------------------------------------------------------------------------- #
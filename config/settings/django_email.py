@@ -16,6 +16,11 @@ from .common import PROJECT_TITLE
 
 load_dotenv()
 
+# ---------------------------------------------------------------------------- #
+# https://docs.djangoproject.com/en/dev/ref/settings/#email-backend
+
+EMAIL_BACKEND = 'utils.mail.PooledEmailBackend'
+
 # ---------------------------------------------------------------------------- #
 # https://docs.djangoproject.com/en/dev/ref/settings/#email-host
 
@@ -46,6 +51,11 @@ EMAIL_USE_TLS = False
 
 EMAIL_USE_SSL = True
 
+# ---------------------------------------------------------------------------- #
+# https://docs.djangoproject.com/en/dev/ref/settings/#email-timeout
+
+EMAIL_TIMEOUT = 10
+
 # ---------------------------------------------------------------------------- #
 # https://docs.djangoproject.com/en/4.2/ref/settings/#default-from-email
 
@@ -57,8 +67,21 @@ DEFAULT_FROM_EMAIL = os.getenv('DEFAULT_FROM_EMAIL', 'noreply@localhost')
 EMAIL_CONFIRMATION = {
     'FRONTEND_BASE_URL': 'https://FRONTEND_URL/CONFIRM_EMAIL_PATH/',
     'CODE_TIMEOUT': 60 * 60 * 24,
+    'RESEND_COOLDOWN': 60,
     'SEND_EMAIL_CALLBACK': '',
     'SEND_EMAIL_IN_DEV': False,
 }
 
 # ---------------------------------------------------------------------------- #
+# https://github.com/ramonkcom/drf-launchpad/blob/main/docs/custom-settings-and-flags.md#email_outbox
+
+EMAIL_OUTBOX = {
+    'USE_OUTBOX': True,
+    'BATCH_SIZE': 50,
+    'LEASE_TIMEOUT': 60 * 5,
+    'MAX_ATTEMPTS': 5,
+    'RETRY_DELAY': 60,
+    'MAX_RETRY_DELAY': 60 * 60,
+}
+
+# ---------------------------------------------------------------------------- #
@@ -10,3 +10,8 @@ Full list of Django Guardian settings:
 
 ANONYMOUS_USER_NAME = 'anonymous'
 GUARDIAN_GET_INIT_ANONYMOUS_USER = 'utils.permissions.get_anonymous_user'
+
+# NOTE `utils.permissions.CachedObjectPermissionBackend` (see
+# `AUTHENTICATION_BACKENDS`) extends guardian's backend, which guardian's
+# system check doesn't recognize.
+SILENCED_SYSTEM_CHECKS = ['guardian.W001']
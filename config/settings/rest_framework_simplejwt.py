@@ -16,5 +16,8 @@ SIMPLE_JWT = {
     'AUTH_HEADER_TYPES': ['JWT',],
     'REFRESH_TOKEN_LIFETIME': timedelta(days=2),
     'ROTATE_REFRESH_TOKENS': True,
+    'TOKEN_OBTAIN_SERIALIZER': 'apps.core.serializers.TokenObtainPairSerializer',
+    'TOKEN_REFRESH_SERIALIZER': 'apps.core.serializers.TokenRefreshSerializer',
+    'TOKEN_VERIFY_SERIALIZER': 'apps.core.serializers.TokenVerifySerializer',
     'USER_AUTHENTICATION_RULE': 'utils.auth.user_authentication_rule',
 }
@@ -1,4 +1,21 @@
+from django.conf import settings
+from django.core.cache import (
+    DEFAULT_CACHE_ALIAS,
+    caches,
+)
 from django.utils.translation import gettext_lazy as _
+from rest_framework_simplejwt.authentication import JWTAuthentication
+from rest_framework_simplejwt.exceptions import (
+    AuthenticationFailed,
+    InvalidToken,
+)
+from rest_framework_simplejwt.settings import api_settings
+
+
+# NOTE The claim with the version of the user's tokens (`User.token_version`)
+TOKEN_VERSION_CLAIM = 'token_version'
+
+_AUTH_USER_CACHE_PREFIX = 'auth:user'
 
 
 def user_authentication_rule(user):
@@ -12,3 +29,125 @@ def user_authentication_rule(user):
     """
 
     return user is not None and user.is_active
+
+
+def _get_auth_user_cache():
+    """Returns the cache of the authenticated users, if enabled.
+
+    Returns:
+        BaseCache: The cache set in `AUTH_USER_CACHE`, or `None` if the cache
+            is disabled.
+    """
+
+    config = settings.AUTH_USER_CACHE
+    if not config.get('USE_CACHE', False):
+        return None
+
+    return caches[config.get('CACHE_ALIAS', DEFAULT_CACHE_ALIAS)]
+
+
+def _get_auth_user_cache_key(user_id):
+    return f'{_AUTH_USER_CACHE_PREFIX}:{user_id}'
+
+
+def invalidate_auth_user_cache(user_id):
+    """Deletes the cached user (see `CachedJWTAuthentication`).
+
+    This function is called by the signals of the `User` model, and must be
+    called by any code that updates users without saving them (e.g. with
+    `QuerySet.update`).
+
+    Args:
+        user_id: The value of the `USER_ID_FIELD` (Simple JWT setting) of the
+            user, usually its primary key.
+    """
+
+    cache = _get_auth_user_cache()
+    if cache is None:
+        return
+
+    cache.delete(_get_auth_user_cache_key(user_id))
+
+
+class CachedJWTAuthentication(JWTAuthentication):
+    """`JWTAuthentication` with the authenticated users kept in the cache.
+
+    `JWTAuthentication` fetches the user of the token on every request. When
+    `AUTH_USER_CACHE['USE_CACHE']` is set, the row of the user is kept in
+    Django's cache for a short time (`TIMEOUT`), so the user is only fetched
+    when it's not cached. A new `User` instance is built from the cached row
+    on every request, so nothing cached in the instance (e.g. permissions or
+    related objects) outlives the request.
+
+    The `USER_AUTHENTICATION_RULE` (Simple JWT setting) is checked for cached
+    users too, and the cached users are deleted whenever they're saved (see
+    `invalidate_auth_user_cache`), so changes to `is_active`, the password or
+    the permission flags (e.g. `is_superuser`) take effect immediately.
+
+    Tokens are only accepted while their `TOKEN_VERSION_CLAIM` matches the
+    `token_version` of the user, so bumping it (see `User.revoke_tokens`)
+    revokes all the tokens of the user at once.
+    """
+
+    def get_user(self, validated_token):
+        cache = _get_auth_user_cache()
+        if cache is None:
+            user = super().get_user(validated_token)
+            return self.check_user(user, validated_token)
+
+        try:
+            user_id = validated_token[api_settings.USER_ID_CLAIM]
+
+        except KeyError:
+            error_msg = _('Token contained no recognizable user identification')
+            raise InvalidToken(error_msg)
+
+        cache_key = _get_auth_user_cache_key(user_id)
+        fields = self.user_model._meta.concrete_fields
+
+        entry = cache.get(cache_key)
+        if entry is not None:
+            db, values = entry
+            user = self.user_model.from_db(
+                db, [field.attname for field in fields], values)
+            return self.check_user(user, validated_token)
+
+        user = super().get_user(validated_token)
+        self.check_user(user, validated_token)
+        values = tuple(getattr(user, field.attname) for field in fields)
+        cache.set(cache_key, (user._state.db, values),
+                  timeout=settings.AUTH_USER_CACHE.get('TIMEOUT', 60))
+
+        return user
+
+    def check_user(self, user, validated_token):
+        """Checks the `USER_AUTHENTICATION_RULE` (Simple JWT setting) and the
+        version of the token.
+
+        Args:
+            user (User): The user of the token.
+            validated_token (Token): The token.
+
+        Raises:
+            AuthenticationFailed: If the user can't be authenticated.
+            InvalidToken: If the token was revoked.
+
+        Returns:
+            User: The user of the token.
+        """
+
+        if not api_settings.USER_AUTHENTICATION_RULE(user):
+            error_msg = _('User is inactive')
+            raise AuthenticationFailed(error_msg, code='user_inactive')
+
+        # NOTE Tokens issued before the claim existed are of the first version,
+        # so they're accepted until the tokens of the user are revoked.
+        token_version = validated_token.get(
+            TOKEN_VERSION_CLAIM,
+            self.user_model._meta.get_field('token_version').get_default())
+
+        if token_version != user.token_version:
+            error_msg = _('Token has been revoked')
+            raise InvalidToken(error_msg)
+
+        return user
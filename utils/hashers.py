@@ -0,0 +1,222 @@
+import asyncio
+import os
+import threading
+from concurrent.futures import (
+    ProcessPoolExecutor,
+    ThreadPoolExecutor,
+)
+
+from django.conf import settings
+from django.contrib.auth import hashers
+from django.core.exceptions import ImproperlyConfigured
+from django.core.signals import setting_changed
+from django.dispatch import receiver
+from django.utils.translation import gettext_lazy as _
+
+
+_executor = None
+_executor_lock = threading.Lock()
+
+
+def _setup_worker():
+    """Sets Django up in the processes of a process pool.
+    """
+
+    import django
+
+    os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'config.settings')
+    django.setup()
+
+
+def get_hashing_executor():
+    """Returns the executor hashing the passwords, if enabled.
+
+    The executor is created on first use (see `PASSWORD_HASHING_EXECUTOR`)
+    and shared by the whole process.
+
+    Raises:
+        ImproperlyConfigured: If the `POOL` setting is invalid.
+
+    Returns:
+        Executor: The thread or process pool, or `None` if the passwords are
+            hashed in the calling thread.
+    """
+
+    global _executor
+
+    config = settings.PASSWORD_HASHING_EXECUTOR
+    if not config.get('USE_EXECUTOR', False):
+        return None
+
+    with _executor_lock:
+        if _executor is None:
+            pool = config.get('POOL', 'thread')
+            max_workers = config.get('MAX_WORKERS')
+
+            if pool == 'thread':
+                _executor = ThreadPoolExecutor(
+                    max_workers=max_workers,
+                    thread_name_prefix='password-hashing')
+
+            elif pool == 'process':
+                _executor = ProcessPoolExecutor(max_workers=max_workers,
+                                                initializer=_setup_worker)
+
+            else:
+                error_msg = _('The `POOL` of `PASSWORD_HASHING_EXECUTOR` must '
+                              'be `thread` or `process`.')
+                raise ImproperlyConfigured(error_msg)
+
+    return _executor
+
+
+@receiver(setting_changed, dispatch_uid='shutdown_hashing_executor')
+def shutdown_hashing_executor(setting=None, **kwargs):
+    """Shuts the executor down, so it's created again on the next use.
+
+    It's called when `PASSWORD_HASHING_EXECUTOR` changes (e.g. in tests).
+    """
+
+    global _executor
+
+    if setting not in (None, 'PASSWORD_HASHING_EXECUTOR'):
+        return
+
+    with _executor_lock:
+        if _executor is not None:
+            _executor.shutdown(wait=False)
+            _executor = None
+
+
+def _verify_password(password, encoded, preferred='default'):
+    """Checks a password, returning whether its hash must be updated too.
+
+    The `setter` of Django's `check_password` can't cross process (or event
+    loop) boundaries, so it's called by the caller instead.
+
+    Returns:
+        tuple: Whether the password is correct, and whether it must be
+            hashed again (e.g. the iterations of the hasher changed).
+    """
+
+    must_update = []
+    is_correct = hashers.check_password(password, encoded, must_update.append,
+                                        preferred)
+    return is_correct, bool(must_update)
+
+
+def make_password(password, salt=None, hasher='default'):
+    """Same as Django's `make_password`, run by the hashing executor.
+
+    Args:
+        password (str): The password to be hashed.
+        salt (str, optional): The salt to be used.
+        hasher (str, optional): The name of the hasher to be used.
+
+    Returns:
+        str: The encoded password.
+    """
+
+    executor = get_hashing_executor()
+    if executor is None:
+        return hashers.make_password(password, salt, hasher)
+
+    return executor.submit(hashers.make_password,
+                           password, salt, hasher).result()
+
+
+def check_password(password, encoded, setter=None, preferred='default'):
+    """Same as Django's `check_password`, run by the hashing executor.
+
+    Args:
+        password (str): The password to be checked.
+        encoded (str): The encoded password to check against.
+        setter (callable, optional): Called with the password when it's
+            correct but must be hashed again.
+        preferred (str, optional): The name of the preferred hasher.
+
+    Returns:
+        bool: Whether the password is correct or not.
+    """
+
+    executor = get_hashing_executor()
+    if executor is None:
+        return hashers.check_password(password, encoded, setter, preferred)
+
+    is_correct, must_update = executor.submit(
+        _verify_password, password, encoded, preferred).result()
+
+    if setter and must_update:
+        setter(password)
+
+    return is_correct
+
+
+async def amake_password(password, salt=None, hasher='default'):
+    """Asynchronous version of `make_password`.
+
+    The event loop isn't blocked while the password is hashed, either by the
+    hashing executor or, if it's disabled, by the loop's default executor.
+    """
+
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(get_hashing_executor(),
+                                      hashers.make_password,
+                                      password, salt, hasher)
+
+
+async def acheck_password(password, encoded, setter=None,
+                          preferred='default'):
+    """Asynchronous version of `check_password`.
+
+    The `setter`, if called, is called in the event loop, so it must not
+    block it (e.g. it shouldn't save the user synchronously).
+    """
+
+    loop = asyncio.get_running_loop()
+    is_correct, must_update = await loop.run_in_executor(
+        get_hashing_executor(), _verify_password, password, encoded,
+        preferred)
+
+    if setter and must_update:
+        setter(password)
+
+    return is_correct
+
+
+class TunedPBKDF2PasswordHasher(hashers.PBKDF2PasswordHasher):
+    """Django's `PBKDF2PasswordHasher` with the iterations from the settings.
+
+    The iterations are set in `PASSWORD_HASHERS_PARAMS['PBKDF2_ITERATIONS']`
+    (or Django's default, if not set). When they change, the passwords are
+    hashed again on the next successful login (see `User.check_password`).
+    """
+
+    @property
+    def iterations(self):
+        iterations = settings.PASSWORD_HASHERS_PARAMS.get('PBKDF2_ITERATIONS')
+        return iterations or hashers.PBKDF2PasswordHasher.iterations
+
+
+class TunedArgon2PasswordHasher(hashers.Argon2PasswordHasher):
+    """Django's `Argon2PasswordHasher` with the parameters from the settings.
+
+    The parameters are set in `PASSWORD_HASHERS_PARAMS` (`ARGON2_TIME_COST`,
+    `ARGON2_MEMORY_COST` and `ARGON2_PARALLELISM`), or Django's defaults, if
+    not set. It requires `argon2-cffi`, as Django's.
+    """
+
+    @property
+    def time_cost(self):
+        time_cost = settings.PASSWORD_HASHERS_PARAMS.get('ARGON2_TIME_COST')
+        return time_cost or hashers.Argon2PasswordHasher.time_cost
+
+    @property
+    def memory_cost(self):
+        memory_cost = settings.PASSWORD_HASHERS_PARAMS.get('ARGON2_MEMORY_COST')
+        return memory_cost or hashers.Argon2PasswordHasher.memory_cost
+
+    @property
+    def parallelism(self):
+        parallelism = settings.PASSWORD_HASHERS_PARAMS.get('ARGON2_PARALLELISM')
+        return parallelism or hashers.Argon2PasswordHasher.parallelism
@@ -1,5 +1,10 @@
+import importlib
+from functools import lru_cache
 from itertools import chain
 
+from django.core.signals import setting_changed
+from django.dispatch import receiver
+
 
 def debug_model_instance(instance):
     """Prints a model instance in a more readable format.
@@ -25,9 +30,14 @@ def debug_model_instance(instance):
     print('='*80)
 
 
+@lru_cache(maxsize=None)
 def load_entity(path):
     """Loads a module entity from a string path.
 
+    The entities are kept once loaded, so the dotted paths read from the
+    settings (e.g. `SEND_EMAIL_CALLBACK`) can be resolved on every use. The
+    cache is cleared when any setting changes (see `clear_entity_cache`).
+
     Args:
         path (str): A string path to the entity (e.g. 'utils.load_function').
 
@@ -35,13 +45,21 @@ def load_entity(path):
         any: The entity at the given path.
     """
 
-    import importlib
-
     module_path, entity_name = path.rsplit('.', 1)
     module = importlib.import_module(module_path)
     return getattr(module, entity_name)
 
 
+@receiver(setting_changed, dispatch_uid='clear_entity_cache')
+def clear_entity_cache(**kwargs):
+    """Clears the entities loaded by `load_entity`.
+
+    It's called when any setting changes (e.g. in tests).
+    """
+
+    load_entity.cache_clear()
+
+
 def model_to_dict(instance):
     """Returns a dict representation of a model instance.
 
@@ -0,0 +1,159 @@
+import smtplib
+import threading
+import time
+
+from django.core import mail
+from django.core.mail.backends import smtp
+from django.core.signals import setting_changed
+from django.dispatch import receiver
+
+
+_connection = None
+_connection_lock = threading.Lock()
+
+
+class PooledEmailBackend(smtp.EmailBackend):
+    """SMTP email backend that keeps its connection open across messages.
+
+    Django's SMTP backend opens a connection (and, with `EMAIL_USE_SSL` or
+    `EMAIL_USE_TLS`, makes the TLS handshake) for every call to
+    `send_messages`, and closes it afterwards. This backend keeps the
+    connection open, so the instance shared by the process (see
+    `get_email_connection`) sends all its emails through a single session.
+
+    Connections dropped by the server are detected and opened again: a
+    connection idle for more than `max_idle` seconds is checked with a
+    `NOOP` before it's used, and a message that fails because the server
+    disconnected is sent again through a new connection.
+
+    Attributes:
+        max_idle (int): The time (in seconds) a connection can be idle before
+            it's checked. Defaults to 30.
+    """
+
+    max_idle = 30
+
+    def __init__(self, *args, max_idle=None, **kwargs):
+        super().__init__(*args, **kwargs)
+
+        if max_idle is not None:
+            self.max_idle = max_idle
+
+        self.last_used = None
+
+    def reset(self):
+        """Drops the connection, without waiting for the server.
+        """
+
+        if self.connection is None:
+            return
+
+        try:
+            self.connection.close()
+
+        except (OSError, smtplib.SMTPException):
+            pass
+
+        finally:
+            self.connection = None
+
+    def open(self):
+        if self.connection is not None and self.last_used is not None:
+            idle = time.monotonic() - self.last_used
+
+            if idle > self.max_idle:
+                try:
+                    status = self.connection.noop()[0]
+
+                except (OSError, smtplib.SMTPException):
+                    status = None
+
+                if status != 250:
+                    self.reset()
+
+        return super().open()
+
+    def send_messages(self, email_messages):
+        if not email_messages:
+            return 0
+
+        with self._lock:
+            num_sent = 0
+            for message in email_messages:
+                if self._send_with_retry(message):
+                    num_sent += 1
+
+            self.last_used = time.monotonic()
+
+        return num_sent
+
+    def _send_with_retry(self, message):
+        """Sends a message, opening the connection again if it was dropped.
+
+        Returns:
+            bool: Whether the message was sent or not.
+        """
+
+        for attempt in range(2):
+            try:
+                if self.open() is None:
+                    # NOTE Failed silently to connect
+                    return False
+
+                sent = self._send(message)
+
+            except (OSError, smtplib.SMTPServerDisconnected):
+                self.reset()
+                if not attempt:
+                    continue
+
+                if self.fail_silently:
+                    return False
+
+                raise
+
+            if not sent:
+                # NOTE Failed silently, so the connection may be broken
+                self.reset()
+
+            return sent
+
+        return False
+
+
+def get_email_connection():
+    """Returns the email backend shared by the process.
+
+    The backend is created on first use, from `EMAIL_BACKEND`. With
+    `PooledEmailBackend`, its connection is kept open and shared by all the
+    emails sent by the process (e.g. by the `send_queued_emails` worker).
+
+    Returns:
+        BaseEmailBackend: The email backend.
+    """
+
+    global _connection
+
+    with _connection_lock:
+        if _connection is None:
+            _connection = mail.get_connection()
+
+    return _connection
+
+
+@receiver(setting_changed, dispatch_uid='close_email_connection')
+def close_email_connection(setting=None, **kwargs):
+    """Closes the shared email backend, so it's created again on next use.
+
+    It's called when any of the `EMAIL_*` settings changes (e.g. in tests).
+    """
+
+    global _connection
+
+    if setting is not None and not setting.startswith('EMAIL_'):
+        return
+
+    with _connection_lock:
+        if _connection is not None:
+            _connection.close()
+            _connection = None
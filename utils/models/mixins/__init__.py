@@ -0,0 +1 @@
+from .dirty import DirtyFieldsMixin
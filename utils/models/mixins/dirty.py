@@ -0,0 +1,83 @@
+from django.db.models import DEFERRED
+
+
+class DirtyFieldsMixin:
+    """Mixin to track the changes to the fields of a model instance.
+
+    The values of the concrete fields are snapshotted when the instance is
+    loaded from (or saved to) the database, and `get_dirty_fields` compares
+    the current values against them. Values are compared with `!=`, so
+    in-place changes to mutable values (e.g. the dict of a `JSONField`) are
+    not detected.
+    """
+
+    @classmethod
+    def from_db(cls, db, field_names, values):
+        instance = super().from_db(db, field_names, values)
+        instance._reset_dirty_fields()
+        return instance
+
+    def _reset_dirty_fields(self, fields=None):
+        """Snapshots the current values of the fields, making them clean.
+
+        Args:
+            fields (list, optional): The names of the fields to snapshot.
+                Defaults to all the concrete fields loaded.
+        """
+
+        values = self.__dict__
+        snapshot = values.setdefault('_dirty_fields_snapshot', {})
+        if fields is None:
+            snapshot.update({f.attname: values[f.attname]
+                             for f in self._meta.concrete_fields
+                             if f.attname in values})
+            return
+
+        for field in self._meta.concrete_fields:
+            if field.name in fields or field.attname in fields:
+                if field.attname in values:
+                    snapshot[field.attname] = values[field.attname]
+
+    def get_dirty_fields(self):
+        """Returns the names of the fields changed since loaded or saved.
+
+        Deferred fields that were never loaded are not considered dirty.
+
+        Returns:
+            list: The names of the changed fields. For instances that were
+                never saved, all the concrete fields.
+        """
+
+        snapshot = self.__dict__.get('_dirty_fields_snapshot')
+        if snapshot is None or self._state.adding:
+            return [f.name for f in self._meta.concrete_fields]
+
+        dirty_fields = []
+        for field in self._meta.concrete_fields:
+            value = self.__dict__.get(field.attname, DEFERRED)
+            if value is DEFERRED:
+                continue
+
+            if (field.attname not in snapshot
+                    or snapshot[field.attname] != value):
+                dirty_fields.append(field.name)
+
+        return dirty_fields
+
+    @property
+    def is_dirty(self):
+        """Whether any field changed since loaded or saved.
+
+        Returns:
+            bool: Whether any field changed.
+        """
+
+        return bool(self.get_dirty_fields())
+
+    def save(self, *args, **kwargs):
+        super().save(*args, **kwargs)
+        self._reset_dirty_fields(kwargs.get('update_fields'))
+
+    def refresh_from_db(self, using=None, fields=None, **kwargs):
+        super().refresh_from_db(using=using, fields=fields, **kwargs)
+        self._reset_dirty_fields(fields)
@@ -1,12 +1,530 @@
+from uuid import uuid4
+
 from django.conf import settings
-from guardian.shortcuts import assign_perm
+from django.contrib.auth.backends import ModelBackend
+from django.contrib.auth.models import Permission
+from django.core.cache import (
+    DEFAULT_CACHE_ALIAS,
+    caches,
+)
+from django.db.models import (
+    Model,
+    Q,
+    QuerySet,
+)
+from django.db.models.signals import post_migrate
+from django.dispatch import receiver
+from django.utils.translation import gettext_lazy as _
+from guardian.backends import (
+    ObjectPermissionBackend,
+    check_support,
+)
+from guardian.core import ObjectPermissionChecker
+from guardian.ctypes import get_content_type
+from guardian.exceptions import WrongAppError
+from guardian.utils import get_user_obj_perms_model
+from rest_framework.permissions import DjangoObjectPermissions
+
+
+# NOTE Global (model level) permissions assigned to every new user.
+INITIAL_GLOBAL_PERMISSIONS = [
+    'core.view_user',
+    'core.change_user',
+    'core.view_email',
+    'core.add_email',
+    'core.change_email',
+    'core.delete_email',
+]
+
+# NOTE Object level permissions every new user gets over itself.
+INITIAL_OBJECT_PERMISSIONS = [
+    'core.view_user',
+    'core.change_user',
+]
+
+# NOTE Object level permissions every user gets over its own emails.
+EMAIL_OBJECT_PERMISSIONS = [
+    'core.view_email',
+    'core.change_email',
+    'core.delete_email',
+]
+
+# NOTE Object level permissions owners have over their own objects, by model.
+# The owner of an object is given by the model's `OWNER_FIELD`, either the
+# name of a foreign key to the user or `'self'` (see `get_owner_pk`).
+OWNER_OBJECT_PERMISSIONS = {
+    'core.User': INITIAL_OBJECT_PERMISSIONS,
+    'core.Email': EMAIL_OBJECT_PERMISSIONS,
+}
+
+_permissions_cache = {}
+
+# NOTE Attributes used to cache permissions in the `User` instance, for the
+# duration of a request. The first three are `ModelBackend`'s own.
+_USER_PERMS_CACHE_ATTRS = [
+    '_perm_cache',
+    '_user_perm_cache',
+    '_group_perm_cache',
+    '_obj_perm_cache',
+    '_perms_cache_versions',
+]
+
+_PERMS_CACHE_PREFIX = 'perms'
+
+
+@receiver(post_migrate, dispatch_uid='clear_permissions_cache')
+def clear_permissions_cache(**kwargs):
+    """Clears the process-wide cache of `Permission` objects.
+
+    Permissions are (re)created after migrations and database flushes, which
+    may change their primary keys, so the cache must be dropped.
+    """
+
+    _permissions_cache.clear()
+
+
+def get_permissions(perms, obj=None):
+    """Returns the `Permission` objects for the given permission names.
+
+    The permissions are resolved with a single query the first time they are
+    requested and cached for the lifetime of the process.
+
+    Args:
+        perms (list): The permission names, either as `app_label.codename` or
+            as `codename` (in which case `obj` is required).
+        obj (Model, optional): The object the permissions refer to. It's used
+            to infer the `app_label` of bare codenames.
+
+    Raises:
+        Permission.DoesNotExist: If any of the permissions does not exist.
+        ValueError: If a bare codename is given without an object.
+
+    Returns:
+        list: The `Permission` objects, in the same order of `perms`.
+    """
+
+    perm_names = []
+    for perm in perms:
+        if '.' not in perm:
+            if obj is None:
+                error_msg = _('The permission `%(perm)s` must be in the format '
+                              '`app_label.codename`.') % {'perm': perm}
+                raise ValueError(error_msg)
+
+            perm = f'{obj._meta.app_label}.{perm}'
+
+        perm_names.append(perm)
+
+    missing = [p for p in perm_names if p not in _permissions_cache]
+    if missing:
+        query = Q()
+        for perm in missing:
+            app_label, codename = perm.split('.', 1)
+            query |= Q(content_type__app_label=app_label, codename=codename)
+
+        permissions = Permission.objects.filter(
+            query).select_related('content_type')
+        for permission in permissions:
+            perm = f'{permission.content_type.app_label}.{permission.codename}'
+            _permissions_cache[perm] = permission
+
+    try:
+        return [_permissions_cache[p] for p in perm_names]
+
+    except KeyError as error:
+        error_msg = _('The permission `%(perm)s` does not exist.') % {
+            'perm': error.args[0]}
+        raise Permission.DoesNotExist(error_msg)
+
+
+def assign_perms(perms, user, obj=None):
+    """Assigns many permissions to an user at once.
+
+    As opposed to guardian's `assign_perm`, which runs a lookup and an insert
+    for each permission, this function resolves the permissions from the
+    process cache (see `get_permissions`) and writes all the grants with a
+    single `bulk_create`. Grants that already exist are ignored.
+
+    Args:
+        perms (list): The permission names (see `get_permissions`).
+        user (User): The user to be assigned the permissions.
+        obj (Model, optional): The object to assign the permissions for. If
+            omitted, global permissions are assigned.
+
+    Raises:
+        ValueError: If any of the permissions does not refer to `obj`'s model.
+
+    Returns:
+        list: The `Permission` objects assigned.
+    """
+
+    permissions = get_permissions(perms, obj)
+
+    if obj is None:
+        through_model = user.user_permissions.through
+        through_model.objects.bulk_create([
+            through_model(user_id=user.pk, permission_id=permission.pk)
+            for permission in permissions
+        ], ignore_conflicts=True)
+
+        invalidate_perms_cache(user)
+
+        return permissions
+
+    bulk_assign_perms(perms, [obj], user=user)
+
+    return permissions
+
+
+def bulk_assign_perms(perms, objs, user=None, user_field='user'):
+    """Assigns object permissions over many objects at once.
+
+    All the grants are written with a single `bulk_create`, regardless of the
+    number of objects and permissions. Grants that already exist are ignored.
+
+    The permissions are assigned to `user` if given. Otherwise, each object's
+    permissions are assigned to its owner, the user referenced by the
+    `user_field` foreign key of the object (e.g. `Email.user`). The owner is
+    read from the foreign key column, so no extra queries are made.
+
+    Args:
+        perms (list): The permission names (see `get_permissions`).
+        objs (list|QuerySet): The objects to assign the permissions for. They
+            must all be instances of the same model.
+        user (User, optional): The user to be assigned the permissions.
+            Defaults to the owner of each object.
+        user_field (str, optional): The name of the foreign key to the owner
+            of the objects. Defaults to `'user'`.
+
+    Raises:
+        ValueError: If the objects are not instances of the same model or if
+            any of the permissions does not refer to their model.
+
+    Returns:
+        list: The object permissions created.
+    """
+
+    if isinstance(objs, QuerySet):
+        model = objs.model
+
+    else:
+        objs = list(objs)
+        if not objs:
+            return []
+
+        model = objs[0].__class__
+        if any(obj.__class__ is not model for obj in objs):
+            error_msg = _('All the objects must be instances of the same '
+                          'model.')
+            raise ValueError(error_msg)
+
+    if user is not None:
+        if isinstance(objs, QuerySet):
+            objs_pks = objs.values_list('pk', flat=True)
+        else:
+            objs_pks = [obj.pk for obj in objs]
+
+        rows = [(obj_pk, user.pk) for obj_pk in objs_pks]
+
+    else:
+        owner_attname = model._meta.get_field(user_field).attname
+        if isinstance(objs, QuerySet):
+            rows = list(objs.values_list('pk', owner_attname))
+        else:
+            rows = [(obj.pk, getattr(obj, owner_attname)) for obj in objs]
+
+    content_type = get_content_type(model)
+    permissions = get_permissions(perms, model)
+    for permission in permissions:
+        if permission.content_type_id != content_type.pk:
+            error_msg = _('The permission `%(perm)s` does not refer to '
+                          '`%(model)s` objects.') % {
+                'perm': permission.codename, 'model': model._meta.label}
+            raise ValueError(error_msg)
+
+    obj_perms_model = get_user_obj_perms_model(model)
+    is_generic = obj_perms_model.objects.is_generic()
+
+    def get_obj_kwargs(obj_pk):
+        if is_generic:
+            return {'content_type': content_type, 'object_pk': str(obj_pk)}
+
+        return {'content_object_id': obj_pk}
+
+    created = obj_perms_model.objects.bulk_create([
+        obj_perms_model(user_id=owner_pk,
+                        permission=permission,
+                        **get_obj_kwargs(obj_pk))
+        for obj_pk, owner_pk in rows
+        for permission in permissions
+    ], ignore_conflicts=True)
+
+    # NOTE `bulk_create` doesn't send `post_save`, so the cached permissions
+    # of the grantees are invalidated here.
+    if user is not None:
+        invalidate_perms_cache(user)
+    else:
+        for owner_pk in {owner_pk for _, owner_pk in rows}:
+            invalidate_perms_cache(owner_pk)
+
+    return created
+
+
+def _get_perms_cache():
+    """Returns the cache backing the permissions across requests, if any.
+
+    Returns:
+        BaseCache: The cache set in `PERMISSIONS_CACHE`, or `None` if the
+            cross-request cache is disabled.
+    """
+
+    config = settings.PERMISSIONS_CACHE
+    if not config.get('USE_CACHE', False):
+        return None
+
+    return caches[config.get('CACHE_ALIAS', DEFAULT_CACHE_ALIAS)]
+
+
+def _get_perms_cache_key(user, suffix):
+    """Returns the cache key for an user's permissions.
+
+    The key embeds the current global and per user versions, so bumping any
+    of them (see `invalidate_perms_cache`) makes the previous entries
+    unreachable. The versions are read once per `User` instance, that is,
+    once per request.
+
+    Args:
+        user (User): The user whose permissions are cached.
+        suffix (str): Identifies what is cached (e.g. the object).
+
+    Returns:
+        str: The cache key.
+    """
+
+    versions = user.__dict__.get('_perms_cache_versions')
+    if versions is None:
+        cache = _get_perms_cache()
+        keys = [f'{_PERMS_CACHE_PREFIX}:version',
+                f'{_PERMS_CACHE_PREFIX}:version:{user.pk}']
+        found = cache.get_many(keys)
+
+        versions = []
+        for key in keys:
+            version = found.get(key)
+            if version is None:
+                # NOTE A missing (e.g. evicted) version must never resolve to
+                # an old one, so a new random version is started.
+                version = uuid4().hex
+                if not cache.add(key, version, timeout=None):
+                    version = cache.get(key, version)
+
+            versions.append(version)
+
+        user._perms_cache_versions = versions
+
+    return f'{_PERMS_CACHE_PREFIX}:{":".join(versions)}:{user.pk}:{suffix}'
+
+
+def invalidate_perms_cache(user=None):
+    """Invalidates the cached permissions of an user or of all the users.
+
+    The permissions cached in the `User` instance (if given) are dropped and,
+    when the cross-request cache is enabled (see `PERMISSIONS_CACHE`), the
+    corresponding version is bumped. This function is called by the signals
+    that grant or revoke permissions, and by `assign_perms` and
+    `bulk_assign_perms`, as `bulk_create` doesn't send signals.
+
+    Args:
+        user (User|int, optional): The user (or its primary key) whose
+            permissions changed. If omitted, the permissions of all the users
+            are invalidated (e.g. when a group's permissions change).
+    """
+
+    if isinstance(user, Model):
+        for attr in _USER_PERMS_CACHE_ATTRS:
+            user.__dict__.pop(attr, None)
+
+    cache = _get_perms_cache()
+    if cache is None:
+        return
+
+    if user is None:
+        key = f'{_PERMS_CACHE_PREFIX}:version'
+    else:
+        key = f'{_PERMS_CACHE_PREFIX}:version:{getattr(user, "pk", user)}'
+
+    cache.set(key, uuid4().hex, timeout=None)
+
+
+def get_cached_perms(user, obj):
+    """Returns the object permissions of an user, using the caches.
+
+    The permissions are looked up in the `User` instance first (request
+    scope), then in the cross-request cache, if enabled. Only when both miss
+    the database is hit, through guardian's `ObjectPermissionChecker`.
+
+    Args:
+        user (User): The (supported, see guardian's `check_support`) user.
+        obj (Model): The object to get the permissions for.
+
+    Returns:
+        set: The codenames of the permissions the user has over the object.
+    """
+
+    local_key = (get_content_type(obj).pk, str(obj.pk))
+    local_cache = user.__dict__.setdefault('_obj_perm_cache', {})
+    if local_key in local_cache:
+        return local_cache[local_key]
+
+    perms = None
+    cache = _get_perms_cache()
+    if cache is not None:
+        cache_key = _get_perms_cache_key(user, '%s:%s' % local_key)
+        perms = cache.get(cache_key)
+
+    if perms is None:
+        perms = set(ObjectPermissionChecker(user).get_perms(obj))
+        if cache is not None:
+            cache.set(cache_key, perms,
+                      timeout=settings.PERMISSIONS_CACHE.get('TIMEOUT'))
+
+    local_cache[local_key] = perms
+    return perms
+
+
+class CachedModelBackend(ModelBackend):
+    """`ModelBackend` with its global permissions kept across requests.
+
+    `ModelBackend` already caches the permissions in the `User` instance, so
+    they are fetched once per request. When `PERMISSIONS_CACHE['USE_CACHE']`
+    is set, they are also kept in Django's cache, so they are not fetched at
+    all while they don't change.
+    """
+
+    def get_all_permissions(self, user_obj, obj=None):
+        cache = _get_perms_cache()
+        if (cache is None
+                or obj is not None
+                or not user_obj.is_active
+                or user_obj.is_anonymous
+                or hasattr(user_obj, '_perm_cache')):
+            return super().get_all_permissions(user_obj, obj=obj)
+
+        cache_key = _get_perms_cache_key(user_obj, 'global')
+        perms = cache.get(cache_key)
+        if perms is None:
+            perms = super().get_all_permissions(user_obj)
+            cache.set(cache_key, perms,
+                      timeout=settings.PERMISSIONS_CACHE.get('TIMEOUT'))
+
+        user_obj._perm_cache = perms
+        return perms
+
+
+class CachedObjectPermissionBackend(ObjectPermissionBackend):
+    """guardian's `ObjectPermissionBackend` with cached object permissions.
+
+    guardian builds a new `ObjectPermissionChecker` on every check, so every
+    `has_perm` call runs its queries again, even for the same object. This
+    backend caches the permissions per user and object (see
+    `get_cached_perms`) for the request and, optionally, across requests.
+    """
+
+    def has_perm(self, user_obj, perm, obj=None):
+        support, user_obj = check_support(user_obj, obj)
+        if not support:
+            return False
+
+        if '.' in perm:
+            app_label, perm = perm.split('.', 1)
+            if app_label != obj._meta.app_label:
+                ctype = get_content_type(obj)
+                if app_label != ctype.app_label:
+                    error_msg = (f'Passed perm has app label of `{app_label}` '
+                                 f'while given obj has app label '
+                                 f'`{obj._meta.app_label}` and given obj '
+                                 f'content_type has app label '
+                                 f'`{ctype.app_label}`.')
+                    raise WrongAppError(error_msg)
+
+        if not user_obj.is_active:
+            return False
+
+        if user_obj.is_superuser:
+            return True
+
+        return perm in get_cached_perms(user_obj, obj)
+
+    def get_all_permissions(self, user_obj, obj=None):
+        support, user_obj = check_support(user_obj, obj)
+        if not support or not user_obj.is_active:
+            return set()
+
+        return set(get_cached_perms(user_obj, obj))
+
+
+def get_owner_pk(obj):
+    """Returns the primary key of the owner of an object.
+
+    The owner is given by the `OWNER_FIELD` attribute of the object's model:
+    `'self'` for users, which own themselves, or the name of a foreign key to
+    the owner (e.g. `'user'` for `Email`). The foreign key column is read, so
+    no queries are made.
+
+    Args:
+        obj (Model): The object.
+
+    Returns:
+        The primary key of the owner, or `None` if the model doesn't define an
+            `OWNER_FIELD`.
+    """
+
+    owner_field = getattr(obj, 'OWNER_FIELD', None)
+    if owner_field is None:
+        return None
+
+    if owner_field == 'self':
+        return obj.pk
+
+    return getattr(obj, obj._meta.get_field(owner_field).attname)
+
+
+class OwnerOrObjectPermissions(DjangoObjectPermissions):
+    """Object permissions that owners are granted without any queries.
+
+    Owners are granted the object permissions listed for the object's model
+    in `OWNER_OBJECT_PERMISSIONS` (which are the ones they are assigned upon
+    creation), answered from the already loaded object. Any other access
+    (e.g. staff or delegated access) falls back to `DjangoObjectPermissions`,
+    that is, to guardian.
+
+    NOTE As ownership is checked first, revoking one of those permissions
+    from the owner with guardian has no effect.
+    """
+
+    def has_object_permission(self, request, view, obj):
+        user = request.user
+        owner_perms = OWNER_OBJECT_PERMISSIONS.get(obj._meta.label)
+
+        if (owner_perms is not None
+                and user.is_authenticated
+                and user.is_active
+                and get_owner_pk(obj) == user.pk):
+            queryset = self._queryset(view)
+            perms = self.get_required_object_permissions(request.method,
+                                                         queryset.model)
+            if set(perms).issubset(owner_perms):
+                return True
+
+        return super().has_object_permission(request, view, obj)
 
 
 def assign_initial_permissions(user):
     """Assigns the basic permissions to an user.
 
     This function assigns the basic permissions to an user (usually a newly
-    created one), so it can handle its own data.
+    created one), so it can handle its own data. The permissions assigned are
+    listed in `INITIAL_GLOBAL_PERMISSIONS` and `INITIAL_OBJECT_PERMISSIONS`.
 
     Args:
         user (User): The user to be assigned the permissions.
@@ -15,16 +533,8 @@ def assign_initial_permissions(user):
         User: The user with the assigned permissions.
     """
 
-    assign_perm('core.view_user', user)
-    assign_perm('core.change_user', user)
-
-    assign_perm("view_user", user, user)
-    assign_perm("change_user", user, user)
-
-    assign_perm('core.view_email', user)
-    assign_perm('core.add_email', user)
-    assign_perm('core.change_email', user)
-    assign_perm('core.delete_email', user)
+    assign_perms(INITIAL_GLOBAL_PERMISSIONS, user)
+    assign_perms(INITIAL_OBJECT_PERMISSIONS, user, user)
 
     return user
 
@@ -0,0 +1,2 @@
+from .eager import EagerLoadingMixin
+from .values import ValuesReadMixin
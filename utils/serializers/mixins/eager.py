@@ -0,0 +1,32 @@
+class EagerLoadingMixin:
+    """Mixin for serializers to declare the relations they read.
+
+    Serializers list the relations they need in `select_related_fields`
+    (forward and one-to-one relations, joined in the same query) and
+    `prefetch_related_fields` (many-to-one and many-to-many relations,
+    loaded in one query per relation). Views pass their querysets through
+    `setup_eager_loading`, so serializing the objects doesn't fire a query
+    per object.
+    """
+
+    select_related_fields = ()
+    prefetch_related_fields = ()
+
+    @classmethod
+    def setup_eager_loading(cls, queryset):
+        """Loads the relations read by the serializer along with a queryset.
+
+        Args:
+            queryset (QuerySet): The queryset to be serialized.
+
+        Returns:
+            QuerySet: The queryset, with the relations selected/prefetched.
+        """
+
+        if cls.select_related_fields:
+            queryset = queryset.select_related(*cls.select_related_fields)
+
+        if cls.prefetch_related_fields:
+            queryset = queryset.prefetch_related(*cls.prefetch_related_fields)
+
+        return queryset
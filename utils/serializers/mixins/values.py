@@ -0,0 +1,190 @@
+from collections import OrderedDict
+
+from django.core.exceptions import FieldDoesNotExist
+from django.db.models import ManyToOneRel
+from rest_framework import (
+    relations,
+    serializers,
+)
+
+
+class ValuesReadMixin:
+    """Mixin for model serializers to read straight from `.values()` rows.
+
+    The readable fields of the serializer are compiled (once per class) into
+    the lookups of a `.values()` query, so the representation is built from
+    plain rows instead of model instances: no instances are created, and no
+    attributes are resolved through them. Each value still goes through the
+    `to_representation` of its field, so the output is the same as the
+    serializer's.
+
+    Fields sourced from model fields (following forward relations, like
+    `profile.given_name`) and nested `many=True` serializers of reverse
+    foreign keys (that also use this mixin) are supported. If any readable
+    field can't be compiled (e.g. methods, properties or related fields),
+    `read_values` returns `None`, and the serializer should be used instead.
+    """
+
+    @classmethod
+    def _compile_values_plan(cls):
+        """Compiles the readable fields of the serializer into lookups.
+
+        Returns:
+            dict: The plan, or `None` if any readable field can't be
+                compiled.
+        """
+
+        model = cls.Meta.model
+        plan = {'fields': [], 'lookups': [model._meta.pk.attname],
+                'nested': []}
+
+        for field in cls().fields.values():
+            if field.write_only:
+                continue
+
+            if isinstance(field, serializers.ListSerializer):
+                child = field.child
+                try:
+                    relation = model._meta.get_field(field.source)
+
+                except FieldDoesNotExist:
+                    return None
+
+                if (not isinstance(child, ValuesReadMixin)
+                        or not isinstance(relation, ManyToOneRel)
+                        or child.Meta.model is not relation.related_model):
+                    return None
+
+                child_plan = child.get_values_plan()
+                if child_plan is None:
+                    return None
+
+                plan['fields'].append((field.field_name, None, field))
+                plan['nested'].append((field.field_name, child.__class__,
+                                       relation.field.attname))
+                continue
+
+            if (field.source == '*'
+                    or isinstance(field, (serializers.BaseSerializer,
+                                          serializers.SerializerMethodField,
+                                          relations.RelatedField,
+                                          relations.ManyRelatedField))):
+                return None
+
+            current_model = model
+            for attr in field.source_attrs[:-1]:
+                try:
+                    relation = current_model._meta.get_field(attr)
+
+                except FieldDoesNotExist:
+                    return None
+
+                if not relation.one_to_one and not relation.many_to_one:
+                    return None
+
+                current_model = relation.related_model
+
+            try:
+                model_field = current_model._meta.get_field(
+                    field.source_attrs[-1])
+
+            except FieldDoesNotExist:
+                return None
+
+            if not model_field.concrete or model_field.is_relation:
+                return None
+
+            lookup = '__'.join(field.source_attrs)
+            plan['fields'].append((field.field_name, lookup, field))
+            if lookup not in plan['lookups']:
+                plan['lookups'].append(lookup)
+
+        return plan
+
+    @classmethod
+    def get_values_plan(cls):
+        """Returns the compiled plan of the serializer, compiling it once.
+
+        Returns:
+            dict: The plan, or `None` if any readable field can't be
+                compiled.
+        """
+
+        if '_values_plan' not in cls.__dict__:
+            cls._values_plan = cls._compile_values_plan()
+
+        return cls._values_plan
+
+    @classmethod
+    def read_values(cls, queryset):
+        """Builds the representation of the objects of a queryset.
+
+        One query is made for the queryset, plus one for each nested
+        serializer, regardless of the number of objects.
+
+        Args:
+            queryset (QuerySet): The objects to be represented.
+
+        Returns:
+            list: The representation of each object (as the serializer's
+                `many=True` representation), or `None` if the serializer
+                can't be compiled.
+        """
+
+        _, data = cls.read_rows(queryset)
+        return data
+
+    @classmethod
+    def read_rows(cls, queryset, extra_lookups=()):
+        """Reads the rows of a queryset and builds their representation.
+
+        Same as `read_values`, but the rows read are returned too, with any
+        other lookups needed (e.g. fields not represented).
+
+        Args:
+            queryset (QuerySet): The objects to be represented.
+            extra_lookups (tuple): Lookups to read along with the plan's.
+
+        Returns:
+            tuple: The rows read and the representation of each of them, or
+                `(None, None)` if the serializer can't be compiled.
+        """
+
+        plan = cls.get_values_plan()
+        if plan is None:
+            return None, None
+
+        pk_name = plan['lookups'][0]
+        lookups = [*plan['lookups'],
+                   *(lookup for lookup in extra_lookups
+                     if lookup not in plan['lookups'])]
+
+        rows = list(queryset.prefetch_related(None).values(*lookups))
+
+        nested = {}
+        pks = [row[pk_name] for row in rows]
+        for field_name, child_class, fk_name in plan['nested']:
+            child_queryset = child_class.Meta.model._default_manager.filter(
+                **{f'{fk_name}__in': pks})
+            child_rows, child_data = child_class.read_rows(child_queryset,
+                                                           (fk_name,))
+
+            related = nested[field_name] = {}
+            for child_row, child_item in zip(child_rows, child_data):
+                related.setdefault(child_row[fk_name], []).append(child_item)
+
+        data = []
+        for row in rows:
+            item = OrderedDict()
+            for field_name, lookup, field in plan['fields']:
+                if lookup is None:
+                    item[field_name] = nested[field_name].get(row[pk_name], [])
+                    continue
+
+                value = row[lookup]
+                item[field_name] = (None if value is None
+                                    else field.to_representation(value))
+
+            data.append(item)
+
+        return rows, data
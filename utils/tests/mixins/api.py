@@ -53,6 +53,7 @@ class APITestMixin:
             current_app (str, optional): The current app name.
             data (dict, optional): The data to be sent.
             format (str, optional): The data format.
+            headers (dict, optional): The headers to be sent.
             query_params (dict, optional): The query params to included in
                 the URL.
             url_args (list, optional): The args to be passed to the URL.
@@ -80,6 +81,7 @@ class APITestMixin:
             current_app (str, optional): The current app name.
             data (dict, optional): The data to be sent.
             format (str, optional): The data format.
+            headers (dict, optional): The headers to be sent.
             query_params (dict, optional): The query params to included in
                 the URL.
             url_args (list, optional): The args to be passed to the URL.
@@ -103,6 +105,7 @@ class APITestMixin:
             current_app (str, optional): The current app name.
             data (dict, optional): The data to be sent.
             format (str, optional): The data format.
+            headers (dict, optional): The headers to be sent.
             query_params (dict, optional): The query params to included in
                 the URL.
             url_args (list, optional): The args to be passed to the URL.
@@ -126,6 +129,7 @@ class APITestMixin:
             current_app (str, optional): The current app name.
             data (dict, optional): The data to be sent.
             format (str, optional): The data format.
+            headers (dict, optional): The headers to be sent.
             query_params (dict, optional): The query params to included in
                 the URL.
             url_args (list, optional): The args to be passed to the URL.
@@ -153,6 +157,7 @@ class APITestMixin:
             current_app (str, optional): The current app name.
             data (dict, optional): The data to be sent.
             format (str, optional): The data format.
+            headers (dict, optional): The headers to be sent.
             query_params (dict, optional): The query params to included in
                 the URL.
             url_args (list, optional): The args to be passed to the URL.
@@ -176,6 +181,7 @@ class APITestMixin:
             current_app (str, optional): The current app name.
             data (dict, optional): The data to be sent.
             format (str, optional): The data format.
+            headers (dict, optional): The headers to be sent.
             query_params (dict, optional): The query params to included in
                 the URL.
             url_args (list, optional): The args to be passed to the URL.
@@ -199,6 +205,7 @@ class APITestMixin:
             current_app (str, optional): The current app name.
             data (dict, optional): The data to be sent.
             format (str, optional): The data format.
+            headers (dict, optional): The headers to be sent.
             query_params (dict, optional): The query params to included in
                 the URL.
             url_args (list, optional): The args to be passed to the URL.
@@ -226,6 +233,7 @@ class APITestMixin:
             current_app (str, optional): The current app name.
             data (dict, optional): The data to be sent.
             format (str, optional): The data format.
+            headers (dict, optional): The headers to be sent.
             query_params (dict, optional): The query params to included in
                 the URL.
             url_args (list, optional): The args to be passed to the URL.
@@ -249,6 +257,7 @@ class APITestMixin:
             current_app (str, optional): The current app name.
             data (dict, optional): The data to be sent.
             format (str, optional): The data format.
+            headers (dict, optional): The headers to be sent.
             query_params (dict, optional): The query params to included in
                 the URL.
             url_args (list, optional): The args to be passed to the URL.
@@ -272,6 +281,7 @@ class APITestMixin:
             current_app (str, optional): The current app name.
             data (dict, optional): The data to be sent.
             format (str, optional): The data format.
+            headers (dict, optional): The headers to be sent.
             method_name (str): The method name.
             query_params (dict, optional): The query params to included in
                 the URL.
@@ -296,10 +306,12 @@ class APITestMixin:
         api_client = kwargs.pop('api_client', self.api_client)
         data = kwargs.pop('data', None)
         data_format = kwargs.pop('format', 'json')
+        extra = {f'HTTP_{name.upper().replace("-", "_")}': value
+                 for name, value in kwargs.pop('headers', {}).items()}
 
         method = getattr(api_client, method_name)
 
-        return method(url, data, format=data_format)
+        return method(url, data, format=data_format, **extra)
 
     def api_retrieve(self, **kwargs):
         """Sends an API GET request to the retrieve endpoint.
@@ -309,6 +321,7 @@ class APITestMixin:
             current_app (str, optional): The current app name.
             data (dict, optional): The data to be sent.
             format (str, optional): The data format.
+            headers (dict, optional): The headers to be sent.
             query_params (dict, optional): The query params to included in
                 the URL.
             url_args (list, optional): The args to be passed to the URL.
@@ -336,6 +349,7 @@ class APITestMixin:
             current_app (str, optional): The current app name.
             data (dict, optional): The data to be sent.
             format (str, optional): The data format.
+            headers (dict, optional): The headers to be sent.
             query_params (dict, optional): The query params to included in
                 the URL.
             url_args (list, optional): The args to be passed to the URL.